@@ -0,0 +1,380 @@
+"""
+Headless benchmark for the Piccolo game.
+
+This module builds the real game with create_game on SDL's dummy video and
+audio drivers, feeds it scripted input and measures how fast the game loop runs.
+Results are printed as JSON so they can be stored and compared against a baseline.
+
+Usage:
+    python benchmark.py --scenario tour --output result.json
+    python benchmark.py --replay session.rec
+    python benchmark.py --scenario tour --items 5000
+    python benchmark.py --scenario tour --paced
+    python benchmark.py --baseline result.json --max-regression 0.1
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from time import perf_counter_ns
+
+# Select the dummy drivers before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from control.game_factory import create_game
+from control.replay import ReplayInputHandler, load_recording
+from utils.commands import Command
+from core.physics import at_front_door
+from utils.asset_pack import asset_pack
+from utils.helpers import sprites_collide
+from utils.pixel_cache import pixel_cache
+from utils.constants import (BALLROOM, EDGE_MARGIN, ELEVATOR, ENTRANCE,
+                             FRAMERATE, GARAGE, ITEM_SPRITES, LUGGAGE,
+                             RECEPTION, SCREEN_WIDTH, SOFAS, YARD)
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+# Frames a single scenario step may take before the scenario is considered stuck
+MAX_STEP_FRAMES = 2000
+
+
+def in_scene(scene: str):
+    """
+    Build a step condition that is met when the player is in a scene.
+
+    Args:
+        scene (str): Scene to wait for.
+    """
+    return lambda game: game.mediator.current_scene == scene
+
+
+def at_door(game) -> bool:
+    """
+    Step condition that is met when the player stands at the front door.
+    """
+    return at_front_door(game.player.rect.left)
+
+
+def at_trolley(game) -> bool:
+    """
+    Step condition that is met when the player touches the trolley in the current scene.
+    """
+    return game.mediator.in_current_scene(game.trolley) and sprites_collide(game.player, game.trolley)
+
+
+def toward_trolley(game) -> tuple:
+    """
+    Step commands walking the player toward the trolley, wherever it rolled.
+    """
+    if game.trolley.rect.centerx < game.player.rect.centerx:
+        return (Command.MOVE_LEFT,)
+    return (Command.MOVE_RIGHT,)
+
+
+# Scenario steps: (commands sent every frame or a function of the game returning them,
+# frame count or condition ending the step)
+SCENARIOS = {
+    # Take the trolley, walk it through every scene and leave it back in the entrance
+    "tour": [
+        (toward_trolley, at_trolley),
+        ((Command.TAKE_TROLLEY,), 1),
+        ((Command.MOVE_RIGHT,), in_scene(YARD)),
+        ((Command.MOVE_RIGHT,), in_scene(ENTRANCE)),
+        ((Command.MOVE_RIGHT,), at_door),
+        ((Command.ENTER_DOOR,), in_scene(RECEPTION)),
+        ((Command.MOVE_LEFT,), in_scene(SOFAS)),
+        ((Command.MOVE_LEFT,), in_scene(LUGGAGE)),
+        ((Command.MOVE_LEFT,), in_scene(GARAGE)),
+        ((Command.MOVE_LEFT,), in_scene(BALLROOM)),
+        ((Command.MOVE_RIGHT,), in_scene(GARAGE)),
+        ((Command.MOVE_RIGHT,), in_scene(LUGGAGE)),
+        ((Command.MOVE_RIGHT,), in_scene(SOFAS)),
+        ((Command.MOVE_RIGHT,), in_scene(RECEPTION)),
+        ((Command.MOVE_RIGHT,), in_scene(ELEVATOR)),
+        ((Command.MOVE_LEFT,), in_scene(RECEPTION)),
+        ((Command.MOVE_LEFT,), at_door),
+        ((Command.EXIT_DOOR,), in_scene(ENTRANCE)),
+        ((Command.RELEASE_TROLLEY,), 1),
+        ((), 60),
+    ],
+    # Take the trolley, push it away and fetch it again
+    "trolley": [
+        (toward_trolley, at_trolley),
+        ((Command.TAKE_TROLLEY,), 1),
+        ((Command.MOVE_RIGHT,), 60),
+        ((Command.RELEASE_TROLLEY,), 1),
+        ((Command.JUMP,), 60),
+        (toward_trolley, at_trolley),
+        ((Command.TAKE_TROLLEY,), 1),
+        ((Command.MOVE_LEFT,), 40),
+        ((Command.RELEASE_TROLLEY,), 1),
+        ((), 60),
+    ],
+    # Nobody touches anything
+    "idle": [
+        ((), 600),
+    ],
+}
+
+
+class ScriptedInputHandler:
+    """
+    Replaces InputHandler with a scripted sequence of commands.
+
+    Responsibilities:
+        - Queue the commands of the current scenario step in the mediator every frame
+        - Queue STOP_MOVING on frames without commands, like InputHandler does
+        - Advance to the next step when the step's frame count or condition is met
+
+    Args:
+        game: Game instance the scenario is played in.
+        steps (list): Scenario steps of (commands or function returning them, frame count or condition).
+
+    Attributes:
+        game: Game instance the scenario is played in.
+        steps (list): Scenario steps of (commands or function returning them, frame count or condition).
+        done (bool): Whether every step has been played.
+        _step (int): Index of the current step.
+        _frames (int): Frames played in the current step.
+    """
+
+    def __init__(self, game, steps: list):
+        self.game = game
+        self.steps = steps
+        self.done = not steps
+        self._step = 0
+        self._frames = 0
+
+    def process_input(self) -> None:
+        """
+        Queue the current step's commands and advance the script.
+        """
+        if self.done:
+            return
+
+        commands, until = self.steps[self._step]
+        if callable(commands):
+            commands = commands(self.game)
+        for command in commands:
+            self.game.mediator.queue_command(command)
+        if not commands:
+            self.game.mediator.queue_command(Command.STOP_MOVING)
+        self._frames += 1
+
+        # Steps end after a frame count or when their condition is met
+        if isinstance(until, int):
+            finished = self._frames >= until
+        else:
+            finished = until(self.game)
+
+        if finished:
+            self._step += 1
+            self._frames = 0
+            self.done = self._step == len(self.steps)
+        elif self._frames >= MAX_STEP_FRAMES:
+            raise RuntimeError(f"Scenario step {self._step} did not finish in {MAX_STEP_FRAMES} frames.")
+
+    def frame_presented(self) -> None:
+        """
+        Scripted input has no input latency to measure.
+        """
+
+
+def scatter_items(game, count: int, seed: int = 0) -> None:
+    """
+    Put items with random sprites at random places in every scene.
+
+    Args:
+        game: Game instance whose items are filled.
+        count (int): Number of items.
+        seed (int): Random seed, the same seed places the same items.
+    """
+    rng = random.Random(seed)
+    scenes = sorted(game.mediator.scene_graph.scenes)
+    for _ in range(count):
+        game.items.add(rng.choice(ITEM_SPRITES), rng.choice(scenes),
+                       rng.randrange(EDGE_MARGIN * 5, SCREEN_WIDTH - EDGE_MARGIN * 5))
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """
+    Return the nearest-rank percentile of sorted values.
+
+    Args:
+        sorted_values (list): Values in ascending order.
+        fraction (float): Percentile as a fraction between 0 and 1.
+    """
+    return sorted_values[round((len(sorted_values) - 1) * fraction)]
+
+
+def peak_rss_kb() -> int | None:
+    """
+    Return the peak resident memory of this process in kilobytes, None if unknown.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_benchmark(scenario: str, loops: int = 1, warmup: int = 60, dirty_rects: bool = False,
+                  replay: str | None = None, items: int = 0, paced: bool = False) -> dict:
+    """
+    Play a scenario in a headless game and measure the game loop.
+
+    Args:
+        scenario (str): Name of a scenario in SCENARIOS, ignored when replaying.
+        loops (int): Number of times the scenario is played.
+        warmup (int): Frames run before measuring, with no input.
+        dirty_rects (bool): Whether the game uses the dirty-rect renderer.
+        replay (str | None): File path of a recording to play instead of a scenario.
+        items (int): Number of items scattered across the scenes before playing.
+        paced (bool): Whether measured frames start at the framerate like in the game, so background
+            work such as scene prefetching gets the time between frames it gets when playing.
+
+    Returns:
+        dict: Frames, frames per second, frame time percentiles, time to first frame,
+        startup image decoding, pixel cache, asset pack, scene prefetch and spatial hash counters
+        and peak memory.
+    """
+    if replay is not None:
+        scenario = f"replay:{os.path.basename(replay)}"
+        _, recorded_frames = load_recording(replay)
+
+    pygame.init()
+    try:
+        # Time to first frame covers decoding the startup images, building the game and its first frame
+        start = perf_counter_ns()
+        game = create_game(dirty_rects=dirty_rects)
+        game.run()
+        first_frame_ns = perf_counter_ns() - start
+
+        # Run unthrottled, the clock would otherwise cap the loop to the framerate,
+        # with one simulation step per frame so every run simulates the same steps
+        game.screen.framerate = 0
+        game.timestep = None
+        scatter_items(game, items)
+
+        idle = ScriptedInputHandler(game, SCENARIOS["idle"][:1])
+        game.input_handler = idle
+        for _ in range(warmup):
+            pygame.event.pump()
+            game.run()
+
+        # Pacing waits outside the measured frame time, which stays the time the loop works
+        pacer = pygame.time.Clock() if paced else None
+        frame_times = []
+        for _ in range(loops):
+            if replay is not None:
+                script = ReplayInputHandler(game.mediator, recorded_frames)
+            else:
+                script = ScriptedInputHandler(game, SCENARIOS[scenario])
+            game.input_handler = script
+            while not script.done:
+                start = perf_counter_ns()
+                pygame.event.pump()
+                game.run()
+                frame_times.append(perf_counter_ns() - start)
+                if pacer is not None:
+                    pacer.tick(FRAMERATE)
+        spatial_hash = game.mediator.spatial_hash.stats()
+        prefetch = game.mediator.prefetcher.stats()
+        game.close()
+    finally:
+        pygame.quit()
+
+    total_ns = sum(frame_times)
+    frame_times.sort()
+    return {
+        "scenario": scenario,
+        "dirty_rects": dirty_rects,
+        "items": items,
+        "paced": paced,
+        "frames": len(frame_times),
+        "fps": len(frame_times) * 1_000_000_000 / total_ns if total_ns else 0.0,
+        "frame_ms": {
+            name: percentile(frame_times, fraction) / 1_000_000
+            for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99), ("max", 1.0))
+        },
+        "time_to_first_frame_ms": first_frame_ns / 1_000_000,
+        "preload": game.load_stats,
+        "pixel_cache": pixel_cache.stats(),
+        "asset_pack": asset_pack.stats(),
+        "prefetch": prefetch,
+        "spatial_hash": spatial_hash,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def compare_to_baseline(result: dict, baseline: dict) -> dict:
+    """
+    Compare a benchmark result to a stored baseline result.
+
+    Args:
+        result (dict): Result of run_benchmark.
+        baseline (dict): Earlier result of run_benchmark.
+
+    Returns:
+        dict: Relative change of fps and frame time percentiles, positive means slower for frame times.
+    """
+    comparison = {"fps": result["fps"] / baseline["fps"] - 1 if baseline["fps"] else 0.0}
+    for name, value in result["frame_ms"].items():
+        base = baseline["frame_ms"].get(name)
+        comparison[f"frame_ms_{name}"] = value / base - 1 if base else 0.0
+    return comparison
+
+
+def main(argv: list | None = None) -> int:
+    """
+    Run the benchmark from the command line.
+
+    Args:
+        argv (list | None): Command line arguments, None reads sys.argv.
+
+    Returns:
+        int: Exit code, 1 when fps regressed more than allowed against the baseline.
+    """
+    parser = argparse.ArgumentParser(description="Headless Piccolo game loop benchmark.")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="tour")
+    parser.add_argument("--loops", type=int, default=1, help="times the scenario is played")
+    parser.add_argument("--warmup", type=int, default=60, help="frames run before measuring")
+    parser.add_argument("--dirty-rects", action="store_true", help="use the dirty-rect renderer")
+    parser.add_argument("--replay", metavar="FILE", help="play a recording made with main.py --record")
+    parser.add_argument("--items", type=int, default=0, help="items scattered across the scenes")
+    parser.add_argument("--paced", action="store_true",
+                        help="start frames at the framerate, for prefetch hit rates as in the game")
+    parser.add_argument("--output", help="write the JSON result to this file")
+    parser.add_argument("--baseline", help="JSON result to compare against")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="fail when fps drops more than this fraction below the baseline")
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(args.scenario, args.loops, args.warmup, args.dirty_rects, args.replay, args.items,
+                           args.paced)
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline) as file:
+            result["baseline"] = compare_to_baseline(result, json.load(file))
+        if args.max_regression is not None and result["baseline"]["fps"] < -args.max_regression:
+            exit_code = 1
+
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    return exit_code
+
+
+# This ensures that the benchmark runs only when the file is ran directly
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Per-frame command queue between command producers and the Mediator.
+"""
+from utils.commands import Command
+
+# Commands that move the player, a later one overrides an earlier one in the same frame
+MOVEMENT_COMMANDS = (Command.MOVE_LEFT, Command.MOVE_RIGHT)
+
+
+class CommandQueue:
+    """
+    Collects the commands of one frame so they can be dispatched at once.
+
+    Responsibilities:
+        - Accept commands from any producer (input, AI, scripts) during a frame
+        - Coalesce the frame's commands before dispatch:
+            * Duplicate commands are merged into the first one
+            * Only the last movement command is kept
+            * STOP_MOVING is cancelled by movement
+        - Count pushed, coalesced and drained commands and the deepest frame
+
+    Attributes:
+        pushed (int): Number of commands pushed.
+        coalesced (int): Number of pushed commands merged or cancelled by coalescing.
+        drained (int): Number of commands returned for dispatch.
+        max_depth (int): Most commands pushed during a single frame.
+        _commands (list): Commands pushed since the last drain.
+    """
+
+    def __init__(self):
+        self.pushed = 0
+        self.coalesced = 0
+        self.drained = 0
+        self.max_depth = 0
+        self._commands = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    @property
+    def depth(self) -> int:
+        """
+        Number of commands waiting for dispatch.
+        """
+        return len(self._commands)
+
+    def push(self, command: Command) -> None:
+        """
+        Add a command to the current frame.
+
+        Args:
+            command (Command): Command to dispatch at the end of input handling.
+        """
+        self._commands.append(command)
+        self.pushed += 1
+        self.max_depth = max(self.max_depth, len(self._commands))
+
+    def drain(self) -> list:
+        """
+        Empty the queue and return its coalesced commands in push order.
+
+        Returns:
+            list: Commands to dispatch this frame.
+        """
+        commands = self._commands
+        self._commands = []
+
+        # Last movement of the frame wins
+        movement = None
+        for command in commands:
+            if command in MOVEMENT_COMMANDS:
+                movement = command
+
+        drained = []
+        for command in commands:
+            if command in drained:
+                continue
+            if command in MOVEMENT_COMMANDS and command != movement:
+                continue
+            if command == Command.STOP_MOVING and movement is not None:
+                continue
+            drained.append(command)
+
+        self.coalesced += len(commands) - len(drained)
+        self.drained += len(drained)
+        return drained
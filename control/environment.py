@@ -0,0 +1,294 @@
+"""
+Headless environment API for automated play.
+
+PiccoloEnv wraps one game built with create_game behind reset() and step(commands)
+and returns observations as NumPy arrays. VectorEnv runs many PiccoloEnv instances,
+each in its own worker process, so batches of episodes use every core.
+
+Requires NumPy. Code that creates a VectorEnv must be guarded with
+`if __name__ == "__main__":`, because worker processes are spawned.
+"""
+import multiprocessing
+import os
+import numpy as np
+import pygame
+from control.game_factory import create_game
+from utils.commands import Command
+
+# Order of the values in an observation array
+OBSERVATION_FIELDS = (
+    "player_x",
+    "player_y",
+    "player_width",
+    "player_height",
+    "player_velocity_y",
+    "player_is_jumping",
+    "trolley_x",
+    "trolley_y",
+    "trolley_speed",
+    "trolley_taken",
+    "trolley_scene",
+    "scene",
+)
+
+# Player attributes that reset() accepts for tuning
+PLAYER_PARAMETERS = ("gravity", "jump_ceiling_y", "jump_height")
+
+
+class PiccoloEnv:
+    """
+    Single game instance driven by commands instead of keyboard input.
+
+    Responsibilities:
+        - Build a fresh game on reset, optionally with tuned player parameters
+        - Queue commands and advance the simulation by whole steps
+        - Return the game state as a NumPy observation array
+        - Render frames only when asked to
+
+    Args:
+        render (bool): Whether to draw every step to a window, False uses SDL's dummy drivers.
+
+    Attributes:
+        render (bool): Whether to draw every step to a window.
+        game: Game instance of the current episode, None before the first reset.
+        steps (int): Simulation steps run in the current episode.
+    """
+
+    def __init__(self, render: bool = False):
+        self.render = render
+        self.game = None
+        self.steps = 0
+
+        # Without rendering the dummy drivers must be chosen before pygame is initialized
+        if not render:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.init()
+
+    def reset(self, params: dict | None = None) -> np.ndarray:
+        """
+        Start a new episode.
+
+        Args:
+            params (dict | None): Player attributes to override, keys from PLAYER_PARAMETERS.
+
+        Returns:
+            np.ndarray: Observation of the initial state.
+
+        Raises:
+            ValueError: If params holds an unknown player attribute.
+        """
+        params = params or {}
+        unknown = set(params) - set(PLAYER_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown player parameters: {sorted(unknown)}.")
+
+        # One step per call, the environment decides when time passes
+        if self.game is not None:
+            self.game.close()
+        self.game = create_game(fixed_timestep=False)
+        for name, value in params.items():
+            setattr(self.game.player, name, value)
+        self.steps = 0
+        return self.observe()
+
+    def step(self, commands=(), repeat: int = 1) -> np.ndarray:
+        """
+        Run simulation steps with the given commands held.
+
+        Args:
+            commands: Commands sent on every step, like held keys.
+            repeat (int): Number of simulation steps to run.
+
+        Returns:
+            np.ndarray: Observation after the last step.
+        """
+        game = self.game
+        for _ in range(repeat):
+            for command in commands:
+                game.mediator.queue_command(command)
+            if not commands:
+                game.mediator.queue_command(Command.STOP_MOVING)
+            game.step()
+            self.steps += 1
+
+            if self.render:
+                pygame.event.pump()
+                # Only the current scene's objects are drawn, like Game.run does
+                game.background.draw()
+                game.player.draw()
+                if game.mediator.in_current_scene(game.trolley):
+                    game.trolley.draw()
+                if game.mediator.in_current_scene(game.bag):
+                    game.bag.draw()
+                if game.items is not None:
+                    game.items.draw()
+                pygame.display.update()
+        return self.observe()
+
+    def observe(self) -> np.ndarray:
+        """
+        Return the current game state.
+
+        Returns:
+            np.ndarray: float32 array with the values of OBSERVATION_FIELDS.
+        """
+        game = self.game
+        player = game.player
+        trolley = game.trolley
+        scene_graph = game.mediator.scene_graph
+        return np.array((
+            player.rect.x,
+            player.rect.y,
+            player.rect.width,
+            player.rect.height,
+            player.velocity_y,
+            player.is_jumping,
+            trolley.rect.x,
+            trolley.rect.y,
+            trolley.speed,
+            trolley.taken,
+            scene_graph.scene_id(trolley.scene_name),
+            scene_graph.scene_id(game.mediator.current_scene),
+        ), dtype=np.float32)
+
+    def close(self) -> None:
+        """
+        Close the game and shut down pygame.
+        """
+        if self.game is not None:
+            self.game.close()
+        self.game = None
+        pygame.quit()
+
+
+def _worker(connection, render: bool) -> None:
+    """
+    Serve reset and step requests for one PiccoloEnv in a worker process.
+
+    Args:
+        connection: Pipe end receiving (method, args) requests and sending observations.
+        render (bool): Whether the environment renders.
+    """
+    env = PiccoloEnv(render)
+    try:
+        while True:
+            method, args = connection.recv()
+            if method == "close":
+                break
+            try:
+                connection.send(getattr(env, method)(*args))
+            except Exception as error:
+                # Report the failure to the caller instead of hanging it
+                connection.send(error)
+    finally:
+        env.close()
+        connection.close()
+
+
+class VectorEnv:
+    """
+    Batch of independent PiccoloEnv instances running in worker processes.
+
+    Responsibilities:
+        - Start one worker process per environment
+        - Send reset and step requests to every worker before waiting for any reply,
+          so all environments run in parallel
+        - Stack the observations into one array
+
+    Args:
+        num_envs (int): Number of environments.
+        render (bool): Whether every environment draws to its own window.
+
+    Attributes:
+        num_envs (int): Number of environments.
+        _connections (list): Pipe ends to the workers.
+        _processes (list): Worker processes.
+    """
+
+    def __init__(self, num_envs: int, render: bool = False):
+        self.num_envs = num_envs
+
+        # Spawned workers start without the parent's pygame state
+        context = multiprocessing.get_context("spawn")
+        self._connections = []
+        self._processes = []
+        for _ in range(num_envs):
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker, args=(child, render), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def reset(self, params: list | None = None) -> np.ndarray:
+        """
+        Start a new episode in every environment.
+
+        Args:
+            params (list | None): Player parameters per environment, None keeps the defaults.
+
+        Returns:
+            np.ndarray: Observations of shape (num_envs, len(OBSERVATION_FIELDS)).
+        """
+        params = params if params is not None else [None] * self.num_envs
+        return self._call_all("reset", [(env_params,) for env_params in params])
+
+    def step(self, commands: list, repeat: int = 1) -> np.ndarray:
+        """
+        Run simulation steps in every environment.
+
+        Args:
+            commands (list): Held commands per environment.
+            repeat (int): Number of simulation steps to run, larger values send fewer messages.
+
+        Returns:
+            np.ndarray: Observations of shape (num_envs, len(OBSERVATION_FIELDS)).
+        """
+        return self._call_all("step", [(tuple(env_commands), repeat) for env_commands in commands])
+
+    def close(self) -> None:
+        """
+        Stop every worker process.
+        """
+        for connection in self._connections:
+            try:
+                connection.send(("close", ()))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def _call_all(self, method: str, args: list) -> np.ndarray:
+        """
+        Call a PiccoloEnv method in every worker and stack the results.
+
+        Args:
+            method (str): Method name.
+            args (list): Argument tuple per environment.
+
+        Returns:
+            np.ndarray: Stacked observations.
+
+        Raises:
+            Exception: The first error raised by a worker.
+        """
+        if len(args) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} entries, got {len(args)}.")
+
+        for connection, env_args in zip(self._connections, args):
+            connection.send((method, env_args))
+        results = [connection.recv() for connection in self._connections]
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return np.stack(results)
@@ -10,11 +10,15 @@ class Game:
 
     Responsibilities:
         - Execute the main game loop frame-by-frame
+        - Run the simulation in fixed steps independently of the rendering rate
+        - Skip rendering while the world is static
         - Coordinate input handling, rendering, and game state updates
         - Update player, background, and mediator states
+        - Update and draw only the objects in the current scene
         - Handle edge transitions when player reaches screen edges
         - Maintain framerate via screen clock
         - Serve as the central point connecting screen, background, player, mediator, and input handler
+        - Stop background threads when closed
 
     Attributes:
         screen: Screen instance for display operations.
@@ -22,11 +26,19 @@ class Game:
         player: Player instance for character management.
         trolley: Trolley instance for trolley item management.
         bag: Bag instance for bag item management.
+        items: Optional Items instance for the many items kept in an entity store.
         mediator: Mediator instance for game internal communication.
         input_handler: InputHandler instance for separating user input.
+        renderer: Optional DirtyRectRenderer, None redraws and updates the whole screen every frame.
+        profiler: Optional FrameProfiler that times every phase and draws an overlay.
+        timestep: Optional FixedTimestep, None runs one simulation step per frame.
+        load_stats (dict | None): Statistics of the parallel startup image decoding, None if not preloaded.
+        idle (bool): Whether the world was static at the end of the latest frame.
+        idle_frames (int): Number of frames that skipped rendering because the world was static.
     """
 
-    def __init__(self, screen, background, player, trolley, bag, mediator, input_handler):
+    def __init__(self, screen, background, player, trolley, bag, mediator, input_handler, renderer=None,
+                 profiler=None, timestep=None, items=None, load_stats=None):
         self.screen = screen
         self.background = background
         self.player = player
@@ -34,6 +46,13 @@ class Game:
         self.bag = bag
         self.mediator = mediator
         self.input_handler = input_handler
+        self.renderer = renderer
+        self.profiler = profiler
+        self.timestep = timestep
+        self.items = items
+        self.load_stats = load_stats
+        self.idle = False
+        self.idle_frames = 0
 
     def run(self) -> None:
         """
@@ -41,39 +60,174 @@ class Game:
 
         Performs the following operations in order:
         1. Transform input to handler
-        2. Draw background
-        3. Draw player
-        4. Draw trolley
-        5. Draw bag
-        6. Update player
-        7. Update trolley
-        8. Update bag
-        9. Handle edge transition
-        10. Update Pygame display
-        11. Tick the game clock to maintain framerate
+        2. Run the simulation steps that are due, each of them:
+            a. Dispatch the queued commands
+            b. Update player
+            c. Update trolley when in the current scene
+            d. Update bag when in the current scene and the current scene's items
+            e. Handle edge transition
+        3. Draw background
+        4. Draw player
+        5. Draw trolley when in the current scene
+        6. Draw bag when in the current scene and the current scene's items
+        7. Start music that finished loading
+        8. Update Pygame display and measure input latency
+        9. Tick the game clock to maintain framerate
+
+        Without a timestep exactly one simulation step runs per frame. With a timestep
+        the simulation runs at a fixed rate independently of the framerate, and sprites
+        are drawn interpolated between the two latest simulation steps.
+
+        While the world stays static, steps 3-6 and 8 are skipped because the screen
+        already shows the latest frame, and main.py blocks on events instead of
+        calling run 60 times a second.
+
+        When a renderer is set, steps 3-6 redraw only the changed regions
+        and step 8 updates only the changed rectangles of the display.
+
+        When a profiler is set, the end of every step is marked and its overlay
+        is drawn before the display update.
 
         Should be called continuously in the main.py game loop.
         """
+        profiler = self.profiler
+        if profiler:
+            profiler.start_frame()
+
         # 1. Input
         self.input_handler.process_input()
+        if profiler:
+            profiler.mark()
 
-        # 2.-5. Draw
-        self.background.draw()
-        self.player.draw()
-        self.trolley.draw()
-        self.bag.draw()
+        # 2. Simulation steps
+        if self.timestep is None:
+            steps, alpha = 1, 1.0
+        else:
+            # Time spent blocked while idle is not simulated
+            if self.idle:
+                self.timestep.reset()
+            steps = self.timestep.advance()
+            alpha = self.timestep.alpha
 
-        # 6.-8. Update game state before rendering
-        running = self.mediator.running
-        self.player.update(running)
-        self.trolley.update(self.mediator.move_trolley())
-        self.bag.update()
+        commands = None
+        for step in range(steps):
+            if profiler and step:
+                profiler.repeat("update player")
+            # Held input applies to every step of the frame
+            commands = self.step(commands)
+        if profiler and not steps:
+            # Queued commands wait for the next frame that runs a step
+            for _ in range(4):
+                profiler.mark()
 
-        # 9. Handle edge transition
-        self.mediator.handle_edge_transition()
+        # Screen already shows a static world
+        was_idle = self.idle
+        self.idle = self.mediator.is_static() and (self.items is None or self.items.is_static())
+        skip_render = was_idle and self.idle
+        if skip_render:
+            self.idle_frames += 1
 
-        # 10. Render current frame
-        pygame.display.update()
+        # 3.-6. Draw
+        if skip_render:
+            if profiler:
+                for _ in range(4):
+                    profiler.mark()
+        elif self.renderer is None:
+            self.background.draw()
+            if profiler:
+                profiler.mark()
+            self.player.draw(alpha)
+            if profiler:
+                profiler.mark()
+            if self.mediator.in_current_scene(self.trolley):
+                self.trolley.draw(alpha)
+            if profiler:
+                profiler.mark()
+            if self.mediator.in_current_scene(self.bag):
+                self.bag.draw(alpha)
+            if self.items is not None:
+                self.items.draw(alpha)
+            if profiler:
+                profiler.mark()
+        else:
+            self.renderer.draw(alpha)
+            if profiler:
+                # Renderer draws everything at once, so it is timed as the background phase
+                for _ in range(4):
+                    profiler.mark()
 
-        # 11. Clock slows the game to framerate speed
+        # 7. Audio
+        self.mediator.update_audio()
+        if profiler:
+            profiler.mark()
+
+        # 8. Render current frame
+        if not skip_render:
+            if profiler:
+                overlay_rect = profiler.draw(self.screen.screen)
+                if self.renderer is not None:
+                    self.renderer.add_dirty(overlay_rect)
+            if self.renderer is None:
+                pygame.display.update()
+            else:
+                self.renderer.present()
+            self.input_handler.frame_presented()
+        if profiler:
+            profiler.mark()
+
+        # 9. Clock slows the game to framerate speed
         self.screen.clock.tick(self.screen.framerate)
+        if profiler:
+            profiler.mark()
+
+    def step(self, commands: list | None = None) -> list:
+        """
+        Advance the simulation by one fixed step.
+
+        Args:
+            commands (list | None): Commands to dispatch, None dispatches the mediator's queue.
+
+        Returns:
+            list: Commands that were dispatched.
+        """
+        profiler = self.profiler
+        scene = self.mediator.current_scene
+
+        # Remember where sprites were for interpolated drawing
+        self.player.save_position()
+        self.trolley.save_position()
+        if self.items is not None:
+            self.items.save_position()
+
+        # a.-d. Update game state
+        commands = self.mediator.dispatch_commands(commands)
+        self.player.update(self.mediator.running)
+        if profiler:
+            profiler.mark()
+        if self.mediator.in_current_scene(self.trolley):
+            self.trolley.update(self.mediator.move_trolley())
+        if profiler:
+            profiler.mark()
+        if self.mediator.in_current_scene(self.bag):
+            self.bag.update()
+        if self.items is not None:
+            self.items.update()
+        if profiler:
+            profiler.mark()
+
+        # e. Handle edge transition
+        self.mediator.handle_edge_transition()
+        if profiler:
+            profiler.mark()
+
+        # Sprites jump to the new scene instead of sliding across the screen
+        if self.mediator.current_scene != scene:
+            self.player.save_position()
+            self.trolley.save_position()
+        return commands
+
+    def close(self) -> None:
+        """
+        Stop the scene prefetcher's background thread, called before pygame quits.
+        """
+        self.mediator.prefetcher.close()
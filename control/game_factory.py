@@ -4,14 +4,24 @@ Build and return a game instance.
 from game_objects.audio_manager import AudioManager
 from game_objects.background import Background
 from game_objects.bag import Bag
+from game_objects.items import Items
+from game_objects.loading_screen import LoadingScreen
 from game_objects.player import Player
+from game_objects.renderer import DirtyRectRenderer
 from game_objects.screen import Screen
 from game_objects.trolley import Trolley
 from control.game import Game
 from control.input_handler import InputHandler
 from control.mediator import Mediator
+from control.profiler import FrameProfiler
+from control.timestep import FixedTimestep
+from utils.asset_loader import preload_images, startup_images
+from utils.constants import (DIRTY_RECT_RENDERING, EVENT_DRIVEN_INPUT,
+                             FIXED_TIMESTEP, PRELOAD_ASSETS, PROFILER_ENABLED)
+from utils.scene_graph import load_scene_graph
 
-def create_game() -> Game:
+def create_game(dirty_rects: bool = DIRTY_RECT_RENDERING, profile: bool = PROFILER_ENABLED,
+                fixed_timestep: bool = FIXED_TIMESTEP, preload: bool = PRELOAD_ASSETS) -> Game:
     """
     Build a Game class instance.
 
@@ -23,18 +33,38 @@ def create_game() -> Game:
             * Player
             * Trolley
             * Bag
+            * Items
             * Mediator
             * InputHandler
+            * DirtyRectRenderer (optional)
+            * FrameProfiler (optional)
+            * FixedTimestep (optional)
+        - Load the scene graph once and share it between background and mediator
+        - Decode the startup images in parallel behind a loading screen (optional)
         - Connect mediator to background, player, trolley, bag and audio manager
+        - Connect items to mediator and its scene prefetcher
         - Connect input handler to mediator
         - Return a fully constructed Game instance ready to run
 
+    Args:
+        dirty_rects (bool): Whether to redraw and update only the changed screen regions.
+        profile (bool): Whether to time every game loop phase and show the profiler overlay.
+        fixed_timestep (bool): Whether to simulate at a fixed rate independently of the framerate.
+        preload (bool): Whether to decode the startup images in parallel before building the game objects.
+
     Returns:
-        Game(screen, background, player, trolley, bag, mediator, input_handler): Built game instance.
+        Game(screen, background, player, trolley, bag, mediator, input_handler, items): Built game instance.
     """
     screen = Screen()
     audio_manager = AudioManager()
-    background = Background(screen)
+    scene_graph = load_scene_graph()
+
+    # Optional parallel decoding, the game objects below then find their images in the asset registry
+    load_stats = None
+    if preload:
+        load_stats = preload_images(startup_images(scene_graph), progress=LoadingScreen(screen).draw)
+
+    background = Background(screen, scene_graph)
 
     # 1. Create instances of the player, trolley and bag with no mediator at first
     player = Player(screen, mediator=None)
@@ -42,14 +72,30 @@ def create_game() -> Game:
     bag = Bag(screen, mediator=None)
 
     # 2. Then create the mediator
-    mediator = Mediator(background, player, trolley, bag, audio_manager)
+    mediator = Mediator(background, player, trolley, bag, audio_manager, scene_graph)
 
     # 3. Lastly attach mediator to player, trolley and bag
     player.mediator = mediator
     trolley.mediator = mediator
     bag.mediator = mediator
 
-    input_handler = InputHandler(mediator)
+    # Items look up scene ids from the mediator's scene graph and draw only the current scene's items
+    items = Items(screen, mediator)
+    mediator.scene_index.carry(items)
+    mediator.prefetcher.items = items
+
+    input_handler = InputHandler(mediator, event_driven=EVENT_DRIVEN_INPUT)
+
+    # Optional renderer that redraws only the regions sprites moved across
+    renderer = None
+    if dirty_rects:
+        renderer = DirtyRectRenderer(background, (player, trolley, bag, items), mediator)
+
+    # Optional per-phase frame profiler
+    profiler = FrameProfiler() if profile else None
+
+    # Optional fixed-rate simulation, otherwise one simulation step per frame
+    timestep = FixedTimestep() if fixed_timestep else None
 
     return Game(
         screen=screen,
@@ -58,5 +104,10 @@ def create_game() -> Game:
         trolley=trolley,
         bag=bag,
         mediator=mediator,
-        input_handler=input_handler
+        input_handler=input_handler,
+        renderer=renderer,
+        profiler=profiler,
+        timestep=timestep,
+        items=items,
+        load_stats=load_stats
     )
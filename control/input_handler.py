@@ -1,8 +1,28 @@
 """
 Input handler for separating user input from other game operations.
 """
+from collections import deque
+from time import perf_counter_ns
 import pygame
 from utils.commands import Command
+from utils.constants import INPUT_LATENCY_SAMPLES
+
+# Default key of each command, rebindable per InputHandler
+DEFAULT_KEY_BINDINGS = {
+    pygame.K_LEFT: Command.MOVE_LEFT,
+    pygame.K_RIGHT: Command.MOVE_RIGHT,
+    pygame.K_UP: Command.ENTER_DOOR,
+    pygame.K_DOWN: Command.EXIT_DOOR,
+    pygame.K_SPACE: Command.JUMP,
+    pygame.K_RETURN: Command.TAKE_TROLLEY,
+    pygame.K_RSHIFT: Command.RELEASE_TROLLEY,
+}
+
+# Only the first held command of this group is sent, in this priority order
+EXCLUSIVE_COMMANDS = (Command.MOVE_LEFT, Command.MOVE_RIGHT, Command.ENTER_DOOR, Command.EXIT_DOOR)
+
+# Commands sent whenever their key is held, in this order
+ACTION_COMMANDS = (Command.JUMP, Command.TAKE_TROLLEY, Command.RELEASE_TROLLEY)
 
 
 class InputHandler:
@@ -11,55 +31,145 @@ class InputHandler:
 
     Responsibilities:
         - Capture keyboard input from the user
-        - Map key presses to high-level game commands
-        - Forward commands to the mediator for game object coordination
+        - Map key presses to high-level game commands through a rebindable table
+        - Queue commands in the mediator for game object coordination
         - Decouple input handling from game object logic
+        - In event-driven mode, track held keys from KEYDOWN and KEYUP events
+          instead of polling the whole keyboard state every frame
+        - Measure the time from every input event until its frame is on the display
+
+    Args:
+        mediator: Mediator instance for game internal communication.
+        key_bindings (dict | None): Command of each key, None uses DEFAULT_KEY_BINDINGS.
+        event_driven (bool): Whether held keys come from handle_event instead of polling.
 
     Attributes:
         mediator: Mediator instance for game internal communication.
+        key_bindings (dict): Command of each key.
+        event_driven (bool): Whether held keys come from handle_event instead of polling.
+        held_keys (set): Keys currently held down, kept up to date in event-driven mode.
+        latencies (deque): Latest input to display update times in nanoseconds.
+        _event_ns (list): Timestamps of the input events not yet processed.
+        _frame_event_ns (list): Timestamps of the input events processed this frame.
     """
 
-    def __init__(self, mediator):
+    def __init__(self, mediator, key_bindings: dict | None = None, event_driven: bool = False):
         self.mediator = mediator
+        self.key_bindings = dict(DEFAULT_KEY_BINDINGS if key_bindings is None else key_bindings)
+        self.event_driven = event_driven
+        self.held_keys = set()
+        self.latencies = deque(maxlen=INPUT_LATENCY_SAMPLES)
+        self._event_ns = []
+        self._frame_event_ns = []
+
+    def bind(self, key: int, command: Command) -> None:
+        """
+        Bind a key to a command, replacing the key's previous command.
+
+        Args:
+            key (int): Pygame key code.
+            command (Command): Command sent while the key is held.
+        """
+        self.key_bindings[key] = command
+
+    def unbind(self, key: int) -> None:
+        """
+        Remove the command of a key.
+
+        Args:
+            key (int): Pygame key code.
+        """
+        self.key_bindings.pop(key, None)
+
+    def handle_event(self, event: pygame.event.Event, timestamp_ns: int | None = None) -> None:
+        """
+        Update the held keys from a pygame event.
+
+        Args:
+            event (pygame.event.Event): Event from the pygame event queue.
+            timestamp_ns (int | None): When the event was received, None uses the current time.
+        """
+        if event.type == pygame.KEYDOWN:
+            self.held_keys.add(event.key)
+        elif event.type == pygame.KEYUP:
+            self.held_keys.discard(event.key)
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            # Key releases are not delivered to an unfocused window
+            self.held_keys.clear()
+            return
+        else:
+            return
+
+        # Latency is measured from every input event until its frame is shown
+        self._event_ns.append(perf_counter_ns() if timestamp_ns is None else timestamp_ns)
 
     def process_input(self) -> None:
         """
         Process user input for mediator commands.
 
-        Attributes:
-            keys: Pygame key method.
+        In event-driven mode the held keys come from handle_event, otherwise
+        the whole keyboard state is polled with pygame.key.get_pressed.
         """
-        # Returns a list of boolean values whether each key is pressed or not
-        keys = pygame.key.get_pressed()
+        self._frame_event_ns.extend(self._event_ns)
+        self._event_ns.clear()
 
-        # Left
-        if keys[pygame.K_LEFT]:
-            self.mediator.handle_command(Command.MOVE_LEFT)
+        if self.event_driven:
+            held = self.held_keys
+            nothing_held = not held
+        else:
+            # Returns a list of boolean values whether each key is pressed or not
+            keys = pygame.key.get_pressed()
+            held = [key for key in self.key_bindings if keys[key]]
+            nothing_held = not any(keys)
 
-        # Right
-        elif keys[pygame.K_RIGHT]:
-            self.mediator.handle_command(Command.MOVE_RIGHT)
+        held_commands = {self.key_bindings[key] for key in held if key in self.key_bindings}
 
-        # Up
-        elif keys[pygame.K_UP]:
-            self.mediator.handle_command(Command.ENTER_DOOR)
+        # Left, right, up or down
+        for command in EXCLUSIVE_COMMANDS:
+            if command in held_commands:
+                self._send(command)
+                break
+
+        # Jump, take trolley and release trolley
+        for command in ACTION_COMMANDS:
+            if command in held_commands:
+                self._send(command)
+
+        # Not moving reset command
+        if nothing_held:
+            self._send(Command.STOP_MOVING)
 
-        # Down
-        elif keys[pygame.K_DOWN]:
-            self.mediator.handle_command(Command.EXIT_DOOR)
+    def frame_presented(self) -> None:
+        """
+        Record the input latency of every event of the frame that was just shown on the display.
+        """
+        if self._frame_event_ns:
+            now = perf_counter_ns()
+            self.latencies.extend(now - event_ns for event_ns in self._frame_event_ns)
+            self._frame_event_ns.clear()
 
-        # Jump
-        if keys[pygame.K_SPACE]:
-            self.mediator.handle_command(Command.JUMP)
+    def latency_stats(self) -> dict:
+        """
+        Return input to display update latency percentiles of the latest samples.
 
-        # Take trolley
-        if keys[pygame.K_RETURN]:
-            self.mediator.handle_command(Command.TAKE_TROLLEY)
+        Returns:
+            dict: Number of samples and the p50, p95 and max latency in milliseconds.
+        """
+        latencies = sorted(self.latencies)
+        if not latencies:
+            return {"samples": 0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        return {
+            "samples": len(latencies),
+            "p50_ms": latencies[round((len(latencies) - 1) * 0.50)] / 1_000_000,
+            "p95_ms": latencies[round((len(latencies) - 1) * 0.95)] / 1_000_000,
+            "max_ms": latencies[-1] / 1_000_000,
+        }
 
-        # Release trolley
-        if keys[pygame.K_RSHIFT]:
-            self.mediator.handle_command(Command.RELEASE_TROLLEY)
+    def _send(self, command: Command) -> None:
+        """
+        Queue a command in the mediator.
 
-        # Not moving reset command
-        if not any(keys):
-            self.mediator.handle_command(Command.STOP_MOVING)
+        Args:
+            command (Command): Command to send.
+        """
+        self.mediator.queue_command(command)
@@ -1,12 +1,22 @@
 """
 Mediator pattern implementation for game object communication.
 """
+from functools import partial
+from time import perf_counter_ns
 from typing import Tuple
+from control.command_queue import CommandQueue
+from control.scene_prefetcher import ScenePrefetcher
+from core.scene_index import SceneIndex
+from core.spatial_hash import SpatialHash
+from core.physics import (at_front_door, door_spawn_left, exit_side,
+                          release_speed, trolley_anchor)
 from utils.commands import Command
-from utils.constants import (BALLROOM, CENTER, EDGE_MARGIN, ELEVATOR, ENTRANCE,
-                             FIVE, GARAGE, LUGGAGE, MUSIC_YARD, PUSH_SPEED,
-                             RECEPTION, SCREEN_WIDTH, SOFAS, SOUND_JUMP,
-                             TROLLEY_X, YARD)
+from utils.helpers import sprites_collide
+from utils.constants import (BALLROOM, DOWN, EDGE_MARGIN, ELEVATOR, ENTRANCE,
+                             FIVE, GARAGE, INTERACTION_REACH, LEFT, LUGGAGE,
+                             RECEPTION, RIGHT, SCREEN_WIDTH, SOFAS, SOUND_JUMP,
+                             UP, YARD, ZERO)
+from utils.scene_graph import SceneGraph, load_scene_graph
 
 
 class Mediator:
@@ -15,11 +25,16 @@ class Mediator:
 
     Responsibilities:
         - Route player input commands to the appropriate game object methods
+        - Queue commands from any producer and dispatch them once per frame
         - Manage scene transitions and update the current scene
+        - Resolve neighbouring scenes and scene music from the scene graph
         - Update running state of the player
         - Communicate with AudioManager to play or stop music or sound
+        - Let the scene prefetcher warm the scene ahead of the player
         - Ensure decoupling of input handling from game object behavior
         - Manage trolley actions
+        - Keep the scene index of game objects up to date on scene changes, pickups and drops
+        - Keep interactable objects in a spatial hash and find them near the player
         - Implement guard pattern to interactable game objects
 
     Attributes:
@@ -30,26 +45,47 @@ class Mediator:
         trolley: Trolley instance for trolley item management.
         bag: Bag instance for bag item management.
         audio_manager: AudioManager instance for audio management.
+        scene_graph (SceneGraph): Scenes, their music and how they connect.
+        command_queue (CommandQueue): Commands waiting for the next dispatch.
+        scene_index (SceneIndex): Scenes and the game objects in them, the player is carried everywhere.
+        spatial_hash (SpatialHash): Interactable objects bucketed by scene and position.
+        prefetcher (ScenePrefetcher): Warms the background, music and items of the scene ahead.
+        recorder: Optional CommandRecorder that logs the commands of every dispatch.
+        dispatch_ns (int): Total time spent dispatching queued commands in nanoseconds.
+        last_dispatch_ns (int): Time spent in the latest dispatch in nanoseconds.
         _commands (dict): Dictionary for player methods.
     """
 
-    def __init__(self, background, player, trolley, bag, audio_manager):
+    def __init__(self, background, player, trolley, bag, audio_manager, scene_graph: SceneGraph | None = None):
         self.background = background
         self.running = False
-        self.current_scene = ENTRANCE
+        self.scene_graph = scene_graph if scene_graph is not None else load_scene_graph()
+        self.current_scene = self.scene_graph.start
         self.player = player
         self.trolley = trolley
         self.bag = bag
         self.audio_manager = audio_manager
+        self.command_queue = CommandQueue()
+        self.scene_index = SceneIndex()
+        self.scene_index.carry(player)
+        self.spatial_hash = SpatialHash()
+        self.prefetcher = ScenePrefetcher(background, audio_manager, self.scene_graph)
+        for item in (trolley, bag):
+            if item is not None:
+                self.scene_index.place(item, item.scene_name)
+                self.track(item)
+        self.recorder = None
+        self.dispatch_ns = 0
+        self.last_dispatch_ns = 0
         self._commands = {
-            Command.CHANGE_TO_BALLROOM: (self.change_to_ballroom, False),
-            Command.CHANGE_TO_ELEVATOR: (self.change_to_elevator, False),
-            Command.CHANGE_TO_ENTRANCE: (self.change_to_entrance, False),
-            Command.CHANGE_TO_GARAGE: (self.change_to_garage, False),
-            Command.CHANGE_TO_LUGGAGE: (self.change_to_luggage, False),
-            Command.CHANGE_TO_RECEPTION: (self.change_to_reception, False),
-            Command.CHANGE_TO_SOFAS: (self.change_to_sofas, False),
-            Command.CHANGE_TO_YARD: (self.change_to_yard, False),
+            Command.CHANGE_TO_BALLROOM: (partial(self.change_scene, BALLROOM), False),
+            Command.CHANGE_TO_ELEVATOR: (partial(self.change_scene, ELEVATOR), False),
+            Command.CHANGE_TO_ENTRANCE: (partial(self.change_scene, ENTRANCE), False),
+            Command.CHANGE_TO_GARAGE: (partial(self.change_scene, GARAGE), False),
+            Command.CHANGE_TO_LUGGAGE: (partial(self.change_scene, LUGGAGE), False),
+            Command.CHANGE_TO_RECEPTION: (partial(self.change_scene, RECEPTION), False),
+            Command.CHANGE_TO_SOFAS: (partial(self.change_scene, SOFAS), False),
+            Command.CHANGE_TO_YARD: (partial(self.change_scene, YARD), False),
             Command.ENTER_DOOR: (self.enter_door, False),
             Command.EXIT_DOOR: (self.exit_door, False),
             Command.JUMP: (self.player.jump, False),
@@ -60,147 +96,150 @@ class Mediator:
             Command.TAKE_TROLLEY: (self.take_trolley, True)
         }
 
-    def change_to_ballroom(self) -> None:
+    def change_scene(self, scene: str) -> None:
         """
-        Changes background to ballroom scene.
-        """
-        # If player is already at ballroom scene then return
-        if self.current_scene == BALLROOM:
-            return
-
-        # Set and change current scene and background to ballroom
-        self.current_scene = BALLROOM
-        self.background.change_background(BALLROOM)
-        self.audio_manager.stop_music()
-
-        # Tell trolley its current scene
-        if self.trolley.taken:
-            self.trolley.scene_name = self.current_scene
+        Change the current scene and its background and music.
 
-    def change_to_elevator(self) -> None:
-        """
-        Changes background to elevator scene.
+        Args:
+            scene (str): Name of a scene in the scene graph.
         """
-        # If player is already at elevator scene then return
-        if self.current_scene == ELEVATOR:
+        # If player is already at the scene or the scene is unknown then return
+        if scene == self.current_scene or scene not in self.scene_graph:
             return
 
-        # Set and change current scene and background to elevator
-        self.current_scene = ELEVATOR
-        self.background.change_background(ELEVATOR)
-        self.audio_manager.stop_music()
-
-        # Tell trolley its current scene
-        if self.trolley.taken:
-            self.trolley.scene_name = self.current_scene
-
-    def change_to_entrance(self) -> None:
-        """
-        Changes background to entrance scene.
-        """
-        # If player is already at entrance scene then return
-        if self.current_scene == ENTRANCE:
-            return
+        # Set and change current scene and background, counting whether the prefetcher had it ready
+        self.prefetcher.enter(scene)
+        self.current_scene = scene
+        self.background.change_background(scene)
 
-        # Set and change current scene and background to entrance
-        self.current_scene = ENTRANCE
-        self.background.change_background(ENTRANCE)
-        self.audio_manager.stop_music()
+        # Play the scene's music or stop the previous scene's music
+        music = self.scene_graph.music(scene)
+        if music is not None:
+            self.audio_manager.play_music(music)
+        else:
+            self.audio_manager.stop_music()
 
-        # Tell trolley its current scene
+        # Tell trolley its current scene, the scene index carries it along
         if self.trolley.taken:
             self.trolley.scene_name = self.current_scene
+            self.track(self.trolley)
 
-    def change_to_garage(self) -> None:
-        """
-        Changes background to garage scene.
+    def track(self, entity) -> None:
         """
-        # If player is already at garage scene then return
-        if self.current_scene == GARAGE:
-            return
+        Update the position of an interactable game object in the spatial hash.
 
-        # Set and change current scene and background to garage
-        self.current_scene = GARAGE
-        self.background.change_background(GARAGE)
-        self.audio_manager.stop_music()
+        Should be called whenever the object moves or changes scene.
 
-        # Tell trolley its current scene
-        if self.trolley.taken:
-            self.trolley.scene_name = self.current_scene
-
-    def change_to_luggage(self) -> None:
+        Args:
+            entity: Game object with rect and scene_name attributes.
         """
-        Changes background to luggage scene.
+        self.spatial_hash.update(entity, entity.scene_name, self._bounds(entity))
+
+    def nearest_interactable(self, reach: int = INTERACTION_REACH):
         """
-        # If player is already at luggage scene then return
-        if self.current_scene == LUGGAGE:
-            return
+        Return the interactable object in the current scene nearest to the player.
 
-        # Set and change current scene and background to luggage
-        self.current_scene = LUGGAGE
-        self.background.change_background(LUGGAGE)
-        self.audio_manager.stop_music()
+        Args:
+            reach (int): Pixels around the player rect that are searched.
 
-        # Tell trolley its current scene
-        if self.trolley.taken:
-            self.trolley.scene_name = self.current_scene
+        Returns:
+            Nearest game object or ItemHandle of an item, None if nothing is within reach.
+        """
+        return self.spatial_hash.nearest(self.current_scene, self._bounds(self.player), reach)
 
-    def change_to_reception(self) -> None:
+    def in_current_scene(self, entity) -> bool:
         """
-        Changes background to reception scene.
+        Whether a game object is in the current scene and should be updated and drawn.
+
+        Args:
+            entity: Game object.
         """
-        # If player is already at reception scene then return
-        if self.current_scene == RECEPTION:
-            return
+        return self.scene_index.contains(entity, self.current_scene)
 
-        # Set and change current scene and background to reception
-        self.current_scene = RECEPTION
-        self.background.change_background(RECEPTION)
-        self.audio_manager.stop_music()
+    def is_static(self) -> bool:
+        """
+        Whether nothing in the world moves, animates or waits to happen.
 
-        # Tell trolley its current scene
-        if self.trolley.taken:
-            self.trolley.scene_name = self.current_scene
+        Returns:
+            bool: True when player stands still on the ground, trolley has stopped,
+                no commands are queued and no music is about to start.
+        """
+        player = self.player
+        trolley = self.trolley
+        return (
+            not self.running
+            and not player.is_jumping
+            and player.previous_pos == player.rect.topleft
+            and trolley.speed == 0
+            and trolley.previous_pos == trolley.rect.topleft
+            and not self.command_queue.depth
+            and not self.audio_manager.is_changing_music
+        )
 
-    def change_to_sofas(self) -> None:
+    def play_jump_sound(self) -> None:
         """
-        Changes background to sofas scene.
+        Plays jump sound.
         """
-        # If player is already at sofas scene then return
-        if self.current_scene == SOFAS:
-            return
-
-        # Set and change current scene and background to sofas
-        self.current_scene = SOFAS
-        self.background.change_background(SOFAS)
-        self.audio_manager.stop_music()
-
-        # Tell trolley its current scene
-        if self.trolley.taken:
-            self.trolley.scene_name = self.current_scene
+        self.audio_manager.play_sound(SOUND_JUMP)
 
-    def change_to_yard(self) -> None:
+    def update_audio(self) -> None:
         """
-        Changes background to yard scene.
+        Let audio manager start music that finished loading.
         """
-        # If player is already at yard scene then return
-        if self.current_scene == YARD:
-            return
-
-        # Set and change current scene and background to yard
-        self.current_scene = YARD
-        self.background.change_background(YARD)
-        self.audio_manager.play_music(MUSIC_YARD)
+        self.audio_manager.update()
 
-        # Tell trolley its current scene
-        if self.trolley.taken:
-            self.trolley.scene_name = self.current_scene
+    def queue_command(self, command: Command) -> None:
+        """
+        Queue a command for the next dispatch.
 
-    def play_jump_sound(self) -> None:
+        Args:
+            command (Command): Command from input, AI or a script.
         """
-        Plays jump sound.
+        self.command_queue.push(command)
+
+    def dispatch_commands(self, commands: list | None = None) -> list:
         """
-        self.audio_manager.play_sound(SOUND_JUMP)
+        Handle the coalesced commands queued since the last dispatch.
+
+        Args:
+            commands (list | None): Commands to handle instead of the queue, used to repeat
+                a dispatch on further simulation steps of the same frame.
+
+        Returns:
+            list: Handled commands.
+        """
+        start = perf_counter_ns()
+        if commands is None:
+            commands = self.command_queue.drain()
+        for command in commands:
+            self.handle_command(command)
+        self.last_dispatch_ns = perf_counter_ns() - start
+        self.dispatch_ns += self.last_dispatch_ns
+
+        # One recorded frame per simulation step
+        if self.recorder is not None:
+            for command in commands:
+                self.recorder.record(command)
+            self.recorder.end_frame()
+        return commands
+
+    def command_stats(self) -> dict:
+        """
+        Return the command queue counters.
+
+        Returns:
+            dict: Queue depth, deepest frame, pushed, coalesced and dispatched commands and dispatch time.
+        """
+        queue = self.command_queue
+        return {
+            "depth": queue.depth,
+            "max_depth": queue.max_depth,
+            "pushed": queue.pushed,
+            "coalesced": queue.coalesced,
+            "dispatched": queue.drained,
+            "dispatch_ms": self.dispatch_ns / 1_000_000,
+            "last_dispatch_ms": self.last_dispatch_ns / 1_000_000,
+        }
 
     def handle_command(self, command: Command | None) -> None:
         """
@@ -247,20 +286,13 @@ class Mediator:
         if not isinstance(left, (int, float)) or not isinstance(right, (int, float)):
             return
         
-        # Set constants
-        screen_width = SCREEN_WIDTH
-
-        # Set left and right edge values and save current scene
-        at_left_edge = (left <= EDGE_MARGIN)
-        at_right_edge = (right >= screen_width - EDGE_MARGIN)
+        # Warm the scene ahead before player reaches the edge or walks through the door
+        self.prefetcher.update(self.current_scene, left, right, self.player.is_left)
 
-        # Handle the transition when player exits scene to left
-        if at_left_edge:
-            self._scene_transition(spawn_on_left=False, screen_width=screen_width, margin=EDGE_MARGIN)
-
-        # Handle the transition when player exits scene to right
-        elif at_right_edge:
-            self._scene_transition(spawn_on_left=True, screen_width=screen_width, margin=EDGE_MARGIN)
+        # Handle the transition when player exits scene to left or right
+        side = exit_side(left, right)
+        if side is not None:
+            self._scene_transition(spawn_on_left=side == RIGHT, screen_width=SCREEN_WIDTH, margin=EDGE_MARGIN)
 
     def _scene_transition(self, *, spawn_on_left: bool, screen_width: int, margin: int) -> None:
         """
@@ -272,45 +304,12 @@ class Mediator:
             screen_width (int): The screen width.
             margin (int): The margin between player and screen edge.
         """
-        # Change scene using mediator commands
-        # Exit BALLROOM from Right to GARAGE
-        if self.current_scene == BALLROOM and spawn_on_left:
-            self.handle_command(Command.CHANGE_TO_GARAGE)
-        # Exit ELEVATOR from Left to RECEPTION
-        elif self.current_scene == ELEVATOR and not spawn_on_left:
-            self.handle_command(Command.CHANGE_TO_RECEPTION)
-        # Exit ENTRANCE from Left or Right to YARD
-        elif self.current_scene == ENTRANCE:
-            self.handle_command(Command.CHANGE_TO_YARD)
-        # Exit GARAGE from Left to BALLROOM
-        elif self.current_scene == GARAGE and not spawn_on_left:
-            self.handle_command(Command.CHANGE_TO_BALLROOM)
-        # Exit GARAGE from Right to LUGGAGE
-        elif self.current_scene == GARAGE and spawn_on_left:
-            self.handle_command(Command.CHANGE_TO_LUGGAGE)
-        # Exit LUGGAGE from Left to GARAGE
-        elif self.current_scene == LUGGAGE and not spawn_on_left:
-            self.handle_command(Command.CHANGE_TO_GARAGE)
-        # Exit LUGGAGE from Right to SOFAS
-        elif self.current_scene == LUGGAGE and spawn_on_left:
-            self.handle_command(Command.CHANGE_TO_SOFAS)
-        # Exit RECEPTION from Left to SOFAS
-        elif self.current_scene == RECEPTION and not spawn_on_left:
-            self.handle_command(Command.CHANGE_TO_SOFAS)
-        # Exit RECEPTION from Right to ELEVATOR
-        elif self.current_scene == RECEPTION and spawn_on_left:
-            self.handle_command(Command.CHANGE_TO_ELEVATOR)
-        # Exit SOFAS from Left to LUGGAGE
-        elif self.current_scene == SOFAS and not spawn_on_left:
-            self.handle_command(Command.CHANGE_TO_LUGGAGE)
-        # Exit SOFAS from Right to RECEPTION
-        elif self.current_scene == SOFAS and spawn_on_left:
-            self.handle_command(Command.CHANGE_TO_RECEPTION)
-        # Exit YARD from Left or Right to ENTRANCE
-        elif self.current_scene == YARD:
-            self.handle_command(Command.CHANGE_TO_ENTRANCE)
-        else:
+        # Change scene to the neighbour on the exited side
+        scene = self._neighbour_scene(spawn_on_left=spawn_on_left)
+        if scene is None:
             return
+        self.change_scene(scene)
+        self.running = False
 
         # Spawn player
         if spawn_on_left:
@@ -318,11 +317,27 @@ class Mediator:
         else:
             self.player.rect.right = screen_width - margin - FIVE
 
+    def _neighbour_scene(self, *, spawn_on_left: bool) -> str | None:
+        """
+        Return the scene player enters when exiting the current scene.
+
+        Args:
+            *: Forces following attributes to be called with their name included.
+            spawn_on_left (bool): Whether player exits to right and spawns to left.
+
+        Returns:
+            str | None: Neighbouring scene or None if the scene has no exit on that side.
+        """
+        # Player spawning to left has exited the current scene from right
+        side = RIGHT if spawn_on_left else LEFT
+        return self.scene_graph.neighbour(self.current_scene, side)
+
     def enter_door(self) -> None:
         """
-        Enter reception when player is at the front door and presses up.
+        Enter the scene behind the front door when player is at the door and presses up.
         """
-        if self.current_scene != ENTRANCE:
+        scene = self.scene_graph.neighbour(self.current_scene, UP)
+        if scene is None:
             return
 
         try:
@@ -333,21 +348,20 @@ class Mediator:
         if not isinstance(left, (int, float)):
             return
 
-        at_front_door = (left >= 230 and left <= 460)
-
-        if not at_front_door:
+        if not at_front_door(left):
             return
 
-        self.handle_command(Command.CHANGE_TO_RECEPTION)
+        self.change_scene(scene)
 
-        # Spawn player into reception
-        self.player.rect.left = CENTER
+        # Spawn player into the scene behind the door
+        self.player.rect.left = door_spawn_left()
 
     def exit_door(self) -> None:
         """
-        Exit reception when player is at the front door and presses down.
+        Exit through the front door when player is at the door and presses down.
         """
-        if self.current_scene != RECEPTION:
+        scene = self.scene_graph.neighbour(self.current_scene, DOWN)
+        if scene is None:
             return
 
         try:
@@ -358,15 +372,13 @@ class Mediator:
         if not isinstance(left, (int, float)):
             return
 
-        at_front_door = (left >= 230 and left <= 460)
-
-        if not at_front_door:
+        if not at_front_door(left):
             return
 
-        self.handle_command(Command.CHANGE_TO_ENTRANCE)
+        self.change_scene(scene)
 
-        # Spawn player into entrance
-        self.player.rect.left = CENTER
+        # Spawn player into the scene outside the door
+        self.player.rect.left = door_spawn_left()
 
     def take_trolley(self) -> None:
         """
@@ -382,16 +394,21 @@ class Mediator:
         if self.current_scene != self.trolley.scene_name:
             return
 
-        # When trolley is not yet taken but player's proximity is close enough to take it
-        if self.player.rect.colliderect(self.trolley.rect):
+        # When trolley is not yet taken but player's proximity is close enough to take it,
+        # the spatial hash finds it next to the player and the pixels of both must touch
+        if (self.trolley in self.spatial_hash.query(self.current_scene, self._bounds(self.player))
+                and sprites_collide(self.player, self.trolley)):
             self.trolley.taken = True
+            # A taken trolley moves with the player, speed left from rolling would keep the world from going static
+            self.trolley.speed = ZERO
+            self.scene_index.carry(self.trolley)
 
     def move_trolley(self) -> Tuple[int, int] | None:
         """
         Handle player moving the trolley.
         """
         if self.trolley.taken:
-            return (self.player.rect.centerx + TROLLEY_X, self.player.rect.bottom)
+            return trolley_anchor(self.player.rect.centerx, self.player.rect.bottom)
 
     def release_trolley(self) -> None:
         """
@@ -411,22 +428,34 @@ class Mediator:
         if self.current_scene != self.trolley.scene_name:
             return
 
-        # Release trolley
+        # Release trolley into the current scene
         self.trolley.taken = False
+        self.scene_index.place(self.trolley, self.current_scene)
 
         # Give push
         is_left = getattr(self.player, "is_left", False)
 
-        # Convert bool to int for trolley speed calculation
-        direction = -1 if is_left else 1
-
-        # Add speed to trolley
-        self.trolley.speed = direction * PUSH_SPEED
+        # Add speed to trolley in the facing direction
+        self.trolley.speed = release_speed(is_left)
 
         # DEBUG
         # print(f"Current scene: {self.current_scene}")
         # print(f"Trolley scene: {self.trolley.scene_name}")
 
+    @staticmethod
+    def _bounds(entity) -> tuple[int, int, int, int]:
+        """
+        Return the rect of a game object as (x, y, width, height).
+
+        Args:
+            entity: Game object with a rect attribute.
+
+        Returns:
+            tuple[int, int, int, int]: Bounds of the rect.
+        """
+        rect = entity.rect
+        return (rect.x, rect.y, rect.width, rect.height)
+
     def _can_interact(self) -> bool:
         """
         Guard pattern - Global interaction guard.
@@ -0,0 +1,175 @@
+"""
+Per-phase frame timing for the game loop.
+"""
+import csv
+from array import array
+from time import perf_counter_ns
+import pygame
+from utils.constants import (FONT_PATH, PROFILER_FONT_SIZE, PROFILER_FRAMES,
+                             PROFILER_OVERLAY_INTERVAL, WHITE)
+
+# Phases of Game.run in the order they are marked
+PHASES = (
+    "input",
+    "update player",
+    "update trolley",
+    "update bag",
+    "edge transition",
+    "draw background",
+    "draw player",
+    "draw trolley",
+    "draw bag",
+    "audio",
+    "display update",
+    "clock tick",
+)
+
+
+class FrameProfiler:
+    """
+    Times each phase of the game loop into fixed-size ring buffers.
+
+    Responsibilities:
+        - Record the duration of every phase of the latest frames with perf_counter_ns
+        - Add up phases that are marked more than once in a frame, like repeated simulation steps
+        - Report p50, p95 and p99 durations per phase
+        - Draw the percentiles as an overlay on the screen
+        - Dump the recorded frames to a CSV file
+
+    Game.run only calls the profiler when one is set, so a disabled profiler costs nothing.
+
+    Args:
+        phases (tuple): Phase names in the order they are marked.
+        capacity (int): Number of latest frames kept.
+
+    Attributes:
+        phases (tuple): Phase names in the order they are marked.
+        capacity (int): Number of latest frames kept.
+        frames (int): Number of recorded frames, at most capacity.
+        _samples (list): One ring buffer of nanosecond durations per phase.
+        _index (int): Ring buffer position of the current frame.
+        _phase (int): Index of the next phase to mark.
+        _last_ns (int): Timestamp of the previous mark.
+        _overlay (list): Rendered overlay lines.
+        _overlay_age (int): Frames since the overlay was rendered.
+        _font: Overlay font, loaded on first draw.
+    """
+
+    def __init__(self, phases: tuple = PHASES, capacity: int = PROFILER_FRAMES):
+        self.phases = phases
+        self.capacity = capacity
+        self.frames = 0
+        self._samples = [array("q", [0] * capacity) for _ in phases]
+        self._index = 0
+        self._phase = 0
+        self._last_ns = 0
+        self._overlay = []
+        self._overlay_age = PROFILER_OVERLAY_INTERVAL
+        self._font = None
+
+    def start_frame(self) -> None:
+        """
+        Start timing a new frame.
+        """
+        for samples in self._samples:
+            samples[self._index] = 0
+        self._phase = 0
+        self._last_ns = perf_counter_ns()
+
+    def mark(self) -> None:
+        """
+        Add the time since the previous mark to the duration of the next phase.
+        """
+        now = perf_counter_ns()
+        self._samples[self._phase][self._index] += now - self._last_ns
+        self._last_ns = now
+        self._phase += 1
+
+        # Last phase ends the frame
+        if self._phase == len(self.phases):
+            self._index = (self._index + 1) % self.capacity
+            self.frames = min(self.frames + 1, self.capacity)
+
+    def repeat(self, phase: str) -> None:
+        """
+        Mark phases again starting from a phase, adding to their durations in this frame.
+
+        Args:
+            phase (str): Name of the first phase to mark again.
+        """
+        self._phase = self.phases.index(phase)
+
+    def percentiles(self, phase: str) -> tuple[float, float, float]:
+        """
+        Return the p50, p95 and p99 durations of a phase.
+
+        Args:
+            phase (str): Phase name.
+
+        Returns:
+            tuple[float, float, float]: Durations in milliseconds, zeros before the first frame.
+        """
+        if self.frames == 0:
+            return (0.0, 0.0, 0.0)
+
+        samples = sorted(self._samples[self.phases.index(phase)][:self.frames])
+        last = len(samples) - 1
+        return tuple(samples[round(last * p)] / 1_000_000 for p in (0.50, 0.95, 0.99))
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """
+        Draw the phase percentiles over the top left corner of a surface.
+
+        The text is rendered again only every few frames to keep the overlay cheap.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on.
+
+        Returns:
+            pygame.Rect: Area covered by the overlay.
+        """
+        self._overlay_age += 1
+        if self._overlay_age >= PROFILER_OVERLAY_INTERVAL:
+            self._overlay_age = 0
+            self._render_overlay()
+
+        width = max(line.get_width() for line in self._overlay)
+        height = sum(line.get_height() for line in self._overlay)
+        area = pygame.Rect(0, 0, width, height)
+        surface.fill((0, 0, 0), area)
+
+        y = 0
+        for line in self._overlay:
+            surface.blit(line, (0, y))
+            y += line.get_height()
+        return area
+
+    def _render_overlay(self) -> None:
+        """
+        Render the overlay text lines.
+        """
+        if self._font is None:
+            self._font = pygame.font.Font(FONT_PATH, PROFILER_FONT_SIZE)
+
+        lines = ["phase  p50 / p95 / p99 ms"]
+        for phase in self.phases:
+            p50, p95, p99 = self.percentiles(phase)
+            lines.append(f"{phase}  {p50:.2f} / {p95:.2f} / {p99:.2f}")
+        self._overlay = [self._font.render(line, False, WHITE) for line in lines]
+
+    def dump_csv(self, path: str) -> None:
+        """
+        Write the recorded frames, oldest first, to a CSV file with one column per phase.
+
+        Args:
+            path (str): File path of the CSV file.
+        """
+        # Oldest frame is at the current index once the ring buffer has wrapped
+        start = self._index if self.frames == self.capacity else 0
+        order = [(start + i) % self.capacity for i in range(self.frames)]
+
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame"] + [f"{phase} ns" for phase in self.phases])
+            for frame, index in enumerate(order):
+                writer.writerow([frame] + [samples[index] for samples in self._samples])
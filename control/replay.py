@@ -0,0 +1,139 @@
+"""
+Recording and replaying of the per-step command stream.
+
+A recording is a compact binary log:
+    header: magic b"PICREC", format version (uint8), framerate (uint16)
+    frames: number of commands (uint8) followed by that many Command values (uint8 each)
+"""
+import struct
+from utils.commands import Command
+
+MAGIC = b"PICREC"
+VERSION = 1
+HEADER = struct.Struct("<6sBH")
+
+
+class CommandRecorder:
+    """
+    Writes the commands dispatched on every simulation step to a recording file.
+
+    Responsibilities:
+        - Collect the commands the Mediator dispatches during a simulation step
+        - Append each finished step to the recording file as one frame
+        - Close the file when recording ends
+
+    Args:
+        path (str): File path of the recording.
+        framerate (int): Simulation steps per second the recording was made at.
+
+    Attributes:
+        frames (int): Number of recorded frames.
+        _file: Open recording file.
+        _commands (list): Commands of the current frame.
+    """
+
+    def __init__(self, path: str, framerate: int):
+        self.frames = 0
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, framerate))
+        self._commands = []
+
+    def record(self, command: Command) -> None:
+        """
+        Add a command to the current frame.
+
+        Args:
+            command (Command): Command sent to the mediator.
+        """
+        self._commands.append(command.value)
+
+    def end_frame(self) -> None:
+        """
+        Write the current frame to the recording file.
+        """
+        self._file.write(bytes([len(self._commands)] + self._commands))
+        self._commands = []
+        self.frames += 1
+
+    def close(self) -> None:
+        """
+        Close the recording file.
+        """
+        self._file.close()
+
+
+def load_recording(path: str) -> tuple[int, list]:
+    """
+    Read a recording file.
+
+    Args:
+        path (str): File path of the recording.
+
+    Returns:
+        tuple[int, list]: Framerate and a list of command tuples, one per frame.
+
+    Raises:
+        ValueError: If the file is not a recording of a supported version.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if len(data) < HEADER.size:
+        raise ValueError(f"Not a recording: '{path}'.")
+    magic, version, framerate = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a recording of version {VERSION}: '{path}'.")
+
+    frames = []
+    position = HEADER.size
+    while position < len(data):
+        count = data[position]
+        values = data[position + 1:position + 1 + count]
+        frames.append(tuple(Command(value) for value in values))
+        position += 1 + count
+    return framerate, frames
+
+
+class ReplayInputHandler:
+    """
+    Replaces InputHandler by feeding a recording back to the mediator.
+
+    Responsibilities:
+        - Queue the recorded commands of one frame in the mediator per game loop frame,
+          the game must run one simulation step per frame (no timestep) to replay exactly
+        - Report when the whole recording has been played
+
+    Args:
+        mediator: Mediator instance for game internal communication.
+        frames (list): Command tuples, one per frame.
+
+    Attributes:
+        mediator: Mediator instance for game internal communication.
+        frames (list): Command tuples, one per frame.
+        frame (int): Index of the next frame to play.
+        done (bool): Whether every frame has been played.
+    """
+
+    def __init__(self, mediator, frames: list):
+        self.mediator = mediator
+        self.frames = frames
+        self.frame = 0
+        self.done = not frames
+
+    def process_input(self) -> None:
+        """
+        Queue the next recorded frame's commands in the mediator.
+        """
+        if self.done:
+            return
+
+        for command in self.frames[self.frame]:
+            self.mediator.queue_command(command)
+
+        self.frame += 1
+        self.done = self.frame == len(self.frames)
+
+    def frame_presented(self) -> None:
+        """
+        Replayed input has no input latency to measure.
+        """
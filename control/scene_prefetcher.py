@@ -0,0 +1,215 @@
+"""
+Prefetching of the scene the player is heading to.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter_ns
+import pygame
+from core.physics import approaching_side, at_front_door
+from utils.asset_loader import decode_image, scene_images, stage_image
+from utils.constants import DOWN, LEFT, PIXEL_FORMAT_AUTO, RIGHT, UP
+from utils.scene_graph import SceneGraph
+
+
+def _timed_decode(path: str) -> tuple[pygame.Surface, int]:
+    """
+    Decode an image on the prefetch thread and measure how long it took.
+
+    Args:
+        path (str): File path to the image file.
+
+    Returns:
+        tuple[pygame.Surface, int]: Decoded surface and decoding time in nanoseconds.
+    """
+    start = perf_counter_ns()
+    image = decode_image(path)
+    return image, perf_counter_ns() - start
+
+
+class ScenePrefetcher:
+    """
+    Warms the scene ahead of the player, so the scene change frame finds it ready.
+
+    Responsibilities:
+        - Predict the next scene from the player's position and facing direction:
+          the neighbour behind the screen edge the player faces within the prefetch margin,
+          or the scene behind the front door while the player stands at it
+        - Decode the scene's ground and sky on a background thread and composite
+          them into the background's scene cache on the display thread
+        - Read the scene's music ahead through the audio manager
+        - Build the scene's item index ahead
+        - Count prefetches, hits, late prefetches, misses and the loading time taken off scene changes
+        - Stop its background thread when closed
+
+    Args:
+        background: Background instance owning the composited scene cache.
+        audio_manager: AudioManager instance reading music ahead.
+        scene_graph (SceneGraph): Scenes, their music and how they connect.
+        items: Optional Items instance whose scene index is built ahead.
+
+    Attributes:
+        background: Background instance owning the composited scene cache.
+        audio_manager: AudioManager instance reading music ahead.
+        scene_graph (SceneGraph): Scenes, their music and how they connect.
+        items: Optional Items instance whose scene index is built ahead.
+        requests (int): Number of scenes prefetched.
+        hits (int): Scene changes into a prefetched scene whose background was ready.
+        late (int): Scene changes that waited for a prefetch still decoding.
+        misses (int): Scene changes whose background was neither cached nor prefetched.
+        avoided_stall_ns (int): Loading time of the backgrounds of hits, which would otherwise
+            have been spent in the scene change frame.
+        _requested (set): Scenes prefetched since the latest scene change.
+        _pending (dict): Scene to the futures of its decoding images.
+        _warmed (dict): Scene to the loading time in nanoseconds of its prefetched background.
+        _loader: Background thread pool decoding scene images.
+    """
+
+    def __init__(self, background, audio_manager, scene_graph: SceneGraph, items=None):
+        self.background = background
+        self.audio_manager = audio_manager
+        self.scene_graph = scene_graph
+        self.items = items
+        self.requests = 0
+        self.hits = 0
+        self.late = 0
+        self.misses = 0
+        self.avoided_stall_ns = 0
+        self._requested = set()
+        self._pending = {}
+        self._warmed = {}
+        self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+
+    def update(self, scene: str, left: int, right: int, is_left: bool) -> None:
+        """
+        Finish decoded prefetches and prefetch the scene the player is heading to.
+
+        Should be called once per simulation step.
+
+        Args:
+            scene (str): Current scene.
+            left (int): Left of the player.
+            right (int): Right of the player.
+            is_left (bool): Whether the player is facing left.
+        """
+        self._finish()
+
+        ahead = self.predict(scene, left, right, is_left)
+        if ahead is not None:
+            self.prefetch(ahead)
+
+    def predict(self, scene: str, left: int, right: int, is_left: bool) -> str | None:
+        """
+        Return the scene the player is heading to.
+
+        Args:
+            scene (str): Current scene.
+            left (int): Left of the player.
+            right (int): Right of the player.
+            is_left (bool): Whether the player is facing left.
+
+        Returns:
+            str | None: Neighbour behind the faced edge or the front door, None if the player is heading nowhere.
+        """
+        # Only the edge the player faces, walking away from an edge does not lead there
+        side = approaching_side(left, right)
+        if side is not None and side == (LEFT if is_left else RIGHT):
+            return self.scene_graph.neighbour(scene, side)
+
+        if at_front_door(left):
+            return self.scene_graph.neighbour(scene, UP) or self.scene_graph.neighbour(scene, DOWN)
+        return None
+
+    def prefetch(self, scene: str) -> None:
+        """
+        Start warming a scene's background, music and items, once per scene until the next scene change.
+
+        Args:
+            scene (str): Scene to warm.
+        """
+        if scene in self._requested or scene not in self.scene_graph:
+            return
+        self._requested.add(scene)
+        self.requests += 1
+
+        music = self.scene_graph.music(scene)
+        if music is not None:
+            self.audio_manager.prefetch_music(music)
+
+        if self.items is not None:
+            self.items.prefetch(scene)
+
+        # Decode only backgrounds that are not cached already
+        if scene not in self._pending and not self.background.is_cached(scene):
+            paths = scene_images(self.scene_graph, scene)
+            self._pending[scene] = [(path, self._loader.submit(_timed_decode, path)) for path in paths]
+
+    def enter(self, scene: str) -> None:
+        """
+        Count how ready a scene is, called right before the scene is shown.
+
+        Args:
+            scene (str): Scene about to be shown.
+        """
+        self._requested.clear()
+
+        if scene in self._pending:
+            # Waiting for the rest of the decoding is shorter than decoding again
+            self._finish(wait_for=scene)
+            self._warmed.pop(scene, None)
+            self.late += 1
+        elif scene in self._warmed and self.background.is_cached(scene):
+            self.avoided_stall_ns += self._warmed.pop(scene)
+            self.hits += 1
+        elif not self.background.is_cached(scene):
+            self.misses += 1
+
+    def stats(self) -> dict:
+        """
+        Return the prefetch counters.
+
+        Returns:
+            dict: Number of prefetches, hits, late prefetches and misses, the hit rate
+            of scene changes that needed loading and the loading time avoided in milliseconds.
+        """
+        loads = self.hits + self.late + self.misses
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "late": self.late,
+            "misses": self.misses,
+            "hit_rate": self.hits / loads if loads else 0.0,
+            "avoided_stall_ms": self.avoided_stall_ns / 1_000_000,
+        }
+
+    def close(self) -> None:
+        """
+        Cancel the prefetches still waiting and stop the background thread without waiting for it.
+        """
+        self._pending.clear()
+        self._loader.shutdown(wait=False, cancel_futures=True)
+
+    def _finish(self, wait_for: str | None = None) -> None:
+        """
+        Composite the backgrounds whose images are decoded.
+
+        Args:
+            wait_for (str | None): Scene whose decoding is waited for, others are only finished when done.
+        """
+        for scene, decoding in list(self._pending.items()):
+            if scene != wait_for and not all(future.done() for _, future in decoding):
+                continue
+            del self._pending[scene]
+
+            start = perf_counter_ns()
+            load_ns = 0
+            try:
+                for path, future in decoding:
+                    image, decode_ns = future.result()
+                    stage_image(path, PIXEL_FORMAT_AUTO, image)
+                    load_ns += decode_ns
+            except (pygame.error, FileNotFoundError) as e:
+                # Background loads the scene images again, with their placeholder, when shown
+                logging.error(f"Error prefetching scene '{scene}': {e}")
+                continue
+            self.background.prefetch(scene)
+            self._warmed[scene] = load_ns + perf_counter_ns() - start
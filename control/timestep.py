@@ -0,0 +1,98 @@
+"""
+Fixed-timestep accumulator for decoupling simulation from rendering.
+"""
+from time import perf_counter
+from typing import Callable
+from utils.constants import MAX_STEPS_PER_FRAME, SIMULATION_RATE
+
+
+class FixedTimestep:
+    """
+    Decides how many fixed-length simulation steps to run on each rendered frame.
+
+    Responsibilities:
+        - Accumulate the real time elapsed between rendered frames
+        - Convert the accumulated time into whole simulation steps
+        - Report how far the simulation is into the next step, for interpolated rendering
+        - Apply the frame-skip policy under load: run at most max_steps per frame
+          and drop the remaining time, so the game slows down instead of spiralling
+
+    Args:
+        step_rate (int): Simulation steps per second.
+        max_steps (int): Most simulation steps run for a single rendered frame.
+        clock (Callable): Function returning the current time in seconds.
+
+    Attributes:
+        step_rate (int): Simulation steps per second.
+        step_seconds (float): Length of one simulation step in seconds.
+        max_steps (int): Most simulation steps run for a single rendered frame.
+        alpha (float): Fraction of the next step already elapsed, between 0 and 1.
+        steps (int): Number of simulation steps run.
+        frames (int): Number of rendered frames.
+        dropped_steps (int): Number of simulation steps dropped by the frame-skip policy.
+        _accumulator (float): Elapsed time not yet simulated in seconds.
+        _last_time (float | None): Time of the previous frame.
+    """
+
+    def __init__(self, step_rate: int = SIMULATION_RATE, max_steps: int = MAX_STEPS_PER_FRAME,
+                 clock: Callable[[], float] = perf_counter):
+        self.step_rate = step_rate
+        self.step_seconds = 1 / step_rate
+        self.max_steps = max_steps
+        self.clock = clock
+        self.alpha = 0.0
+        self.steps = 0
+        self.frames = 0
+        self.dropped_steps = 0
+        self._accumulator = 0.0
+        self._last_time = None
+
+    def advance(self) -> int:
+        """
+        Add the time elapsed since the previous frame and return the steps to run.
+
+        Returns:
+            int: Number of simulation steps to run before rendering this frame.
+        """
+        now = self.clock()
+
+        # First frame simulates exactly one step
+        if self._last_time is None:
+            elapsed = self.step_seconds
+        else:
+            elapsed = now - self._last_time
+        self._last_time = now
+        self._accumulator += elapsed
+
+        steps = int(self._accumulator / self.step_seconds)
+        self._accumulator -= steps * self.step_seconds
+
+        # Frame-skip policy: drop the steps that do not fit into this frame
+        if steps > self.max_steps:
+            self.dropped_steps += steps - self.max_steps
+            steps = self.max_steps
+
+        self.alpha = self._accumulator / self.step_seconds
+        self.steps += steps
+        self.frames += 1
+        return steps
+
+    def reset(self) -> None:
+        """
+        Forget the time since the previous frame, the next frame runs exactly one step.
+        """
+        self._accumulator = 0.0
+        self._last_time = None
+
+    def stats(self) -> dict:
+        """
+        Return the timestep counters.
+
+        Returns:
+            dict: Number of rendered frames, simulation steps and dropped steps.
+        """
+        return {
+            "frames": self.frames,
+            "steps": self.steps,
+            "dropped_steps": self.dropped_steps,
+        }
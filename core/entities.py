@@ -0,0 +1,273 @@
+"""
+Struct-of-arrays storage for the many small items placed around the hotel.
+
+EntityStore keeps every item's position, velocity, size, scene id and sprite id in
+contiguous NumPy arrays, so thousands of items are updated with a few vectorized
+operations and filtered by scene without touching Python objects one by one.
+
+Requires NumPy.
+"""
+import numpy as np
+from utils.constants import (EDGE_MARGIN, ENTITY_CAPACITY, GROUND_LEVEL,
+                             SCREEN_WIDTH, TROLLEY_FRICTION, TROLLEY_MIN_SPEED)
+
+
+class EntityStore:
+    """
+    Items stored as parallel NumPy arrays indexed by entity id.
+
+    Responsibilities:
+        - Add and remove entities, reusing the ids of removed ones
+        - Grow the arrays when full
+        - Roll moving entities, slow them down and keep them on screen, all at once
+        - Keep the entity ids of every scene, so one scene is visited without scanning the others
+
+    Args:
+        capacity (int): Number of entities the arrays hold before growing.
+
+    Attributes:
+        x, y (np.ndarray): Top left position, float32.
+        previous_x, previous_y (np.ndarray): Top left position after the previous simulation step.
+        velocity_x, velocity_y (np.ndarray): Velocity in pixels per simulation step, float32.
+        width, height (np.ndarray): Size of the entity's sprite, int16.
+        scene (np.ndarray): Scene id from SceneGraph.scene_id, int16.
+        sprite (np.ndarray): Sprite id, int16.
+        alive (np.ndarray): Whether the slot holds an entity, bool.
+        count (int): Number of entities.
+        _end (int): One past the highest slot ever used.
+        _free (list): Slots of removed entities below _end.
+        _scene_members (dict): Scene id to the set of its entity ids.
+        _scene_arrays (dict): Scene id to its sorted entity ids as an array, rebuilt when the scene changes.
+    """
+
+    FIELDS = (
+        ("x", np.float32),
+        ("y", np.float32),
+        ("previous_x", np.float32),
+        ("previous_y", np.float32),
+        ("velocity_x", np.float32),
+        ("velocity_y", np.float32),
+        ("width", np.int16),
+        ("height", np.int16),
+        ("scene", np.int16),
+        ("sprite", np.int16),
+        ("alive", np.bool_),
+    )
+
+    def __init__(self, capacity: int = ENTITY_CAPACITY):
+        for name, dtype in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.count = 0
+        self._end = 0
+        self._free = []
+        self._scene_members = {}
+        self._scene_arrays = {}
+
+    @property
+    def capacity(self) -> int:
+        """
+        Number of entities the arrays hold before growing.
+        """
+        return len(self.alive)
+
+    def add(self, x: float, y: float, size: tuple[int, int], scene: int, sprite: int,
+            velocity: tuple[float, float] = (0.0, 0.0)) -> int:
+        """
+        Add an entity.
+
+        Args:
+            x (float): Left of the entity.
+            y (float): Top of the entity.
+            size (tuple[int, int]): Width and height of the entity's sprite.
+            scene (int): Scene id.
+            sprite (int): Sprite id.
+            velocity (tuple[float, float]): Starting velocity.
+
+        Returns:
+            int: Entity id, valid until the entity is removed.
+        """
+        if self._free:
+            entity = self._free.pop()
+        else:
+            if self._end == self.capacity:
+                self._grow()
+            entity = self._end
+            self._end += 1
+
+        self.x[entity] = self.previous_x[entity] = x
+        self.y[entity] = self.previous_y[entity] = y
+        self.velocity_x[entity], self.velocity_y[entity] = velocity
+        self.width[entity], self.height[entity] = size
+        self.scene[entity] = scene
+        self.sprite[entity] = sprite
+        self.alive[entity] = True
+        self.count += 1
+        self._join(entity, scene)
+        return entity
+
+    def remove(self, entity: int) -> None:
+        """
+        Remove an entity, its id is reused by a later add.
+
+        Args:
+            entity (int): Entity id.
+
+        Raises:
+            KeyError: If the entity does not exist.
+        """
+        self._check(entity)
+        self._leave(entity)
+        self.alive[entity] = False
+        self.velocity_x[entity] = self.velocity_y[entity] = 0.0
+        self.previous_x[entity] = self.x[entity]
+        self.previous_y[entity] = self.y[entity]
+        self._free.append(entity)
+        self.count -= 1
+
+    def move(self, entity: int, scene: int) -> None:
+        """
+        Move an entity to another scene.
+
+        Args:
+            entity (int): Entity id.
+            scene (int): Scene id.
+
+        Raises:
+            KeyError: If the entity does not exist.
+        """
+        self._check(entity)
+        self._leave(entity)
+        self.scene[entity] = scene
+        self._join(entity, scene)
+
+    def in_scene(self, scene: int) -> np.ndarray:
+        """
+        Return the ids of the entities in a scene.
+
+        Args:
+            scene (int): Scene id.
+
+        Returns:
+            np.ndarray: Entity ids in ascending order, must not be modified.
+        """
+        entities = self._scene_arrays.get(scene)
+        if entities is None:
+            entities = np.array(sorted(self._scene_members.get(scene, ())), dtype=np.intp)
+            self._scene_arrays[scene] = entities
+        return entities
+
+    def save_positions(self, scene: int | None = None) -> None:
+        """
+        Remember the current positions as the previous simulation step's positions.
+
+        Args:
+            scene (int | None): Scene id whose entities are saved, None saves every entity.
+        """
+        if scene is None:
+            end = self._end
+            self.previous_x[:end] = self.x[:end]
+            self.previous_y[:end] = self.y[:end]
+            return
+        entities = self.in_scene(scene)
+        self.previous_x[entities] = self.x[entities]
+        self.previous_y[entities] = self.y[entities]
+
+    def update(self, scene: int | None = None) -> np.ndarray:
+        """
+        Advance the moving entities by one simulation step.
+
+        Entities roll by their velocity, slow down like a released trolley,
+        stop below the minimum speed and stay between the screen edges and above the ground.
+
+        Args:
+            scene (int | None): Scene id whose entities are updated, None updates every entity.
+
+        Returns:
+            np.ndarray: Ids of the entities that moved.
+        """
+        if scene is None:
+            end = self._end
+            velocity_x = self.velocity_x[:end]
+            velocity_y = self.velocity_y[:end]
+            moving = np.flatnonzero((velocity_x != 0) | (velocity_y != 0))
+        else:
+            entities = self.in_scene(scene)
+            velocity_x = self.velocity_x[entities]
+            velocity_y = self.velocity_y[entities]
+            moving = entities[(velocity_x != 0) | (velocity_y != 0)]
+        if not len(moving):
+            return moving
+
+        vx = self.velocity_x[moving]
+        vy = self.velocity_y[moving]
+        x = self.x[moving] + vx
+        y = self.y[moving] + vy
+        vx *= TROLLEY_FRICTION
+        vy *= TROLLEY_FRICTION
+        vx[np.abs(vx) < TROLLEY_MIN_SPEED] = 0.0
+        vy[np.abs(vy) < TROLLEY_MIN_SPEED] = 0.0
+
+        # Keep entities on screen and on the ground
+        np.clip(x, EDGE_MARGIN, SCREEN_WIDTH - EDGE_MARGIN - self.width[moving], out=x)
+        np.minimum(y, GROUND_LEVEL - self.height[moving], out=y)
+
+        self.x[moving] = x
+        self.y[moving] = y
+        self.velocity_x[moving] = vx
+        self.velocity_y[moving] = vy
+        return moving
+
+    def is_static(self, scene: int | None = None) -> bool:
+        """
+        Whether no entity moves.
+
+        Args:
+            scene (int | None): Scene id whose entities are checked, None checks every entity.
+        """
+        entities = slice(self._end) if scene is None else self.in_scene(scene)
+        return not (self.velocity_x[entities].any() or self.velocity_y[entities].any()
+                    or (self.x[entities] != self.previous_x[entities]).any()
+                    or (self.y[entities] != self.previous_y[entities]).any())
+
+    def _check(self, entity: int) -> None:
+        """
+        Raise KeyError if an entity does not exist.
+
+        Args:
+            entity (int): Entity id.
+        """
+        if not 0 <= entity < self._end or not self.alive[entity]:
+            raise KeyError(f"No entity {entity}.")
+
+    def _join(self, entity: int, scene: int) -> None:
+        """
+        Add an entity to the members of a scene.
+
+        Args:
+            entity (int): Entity id.
+            scene (int): Scene id.
+        """
+        scene = int(scene)
+        self._scene_members.setdefault(scene, set()).add(entity)
+        self._scene_arrays.pop(scene, None)
+
+    def _leave(self, entity: int) -> None:
+        """
+        Remove an entity from the members of its scene.
+
+        Args:
+            entity (int): Entity id.
+        """
+        scene = int(self.scene[entity])
+        self._scene_members[scene].discard(entity)
+        self._scene_arrays.pop(scene, None)
+
+    def _grow(self) -> None:
+        """
+        Double the capacity of every array.
+        """
+        capacity = max(1, self.capacity * 2)
+        for name, dtype in self.FIELDS:
+            array = np.zeros(capacity, dtype=dtype)
+            array[:self._end] = getattr(self, name)[:self._end]
+            setattr(self, name, array)
@@ -0,0 +1,244 @@
+"""
+Pure game rules shared by the pygame game objects and the headless World.
+
+Functions here take and return plain numbers and NumPy arrays, so they run
+without pygame and can be unit tested and fuzzed without rects or images.
+"""
+import numpy as np
+from utils.constants import (CENTER, DOOR_LEFT, DOOR_RIGHT, EDGE_MARGIN, FIVE,
+                             GROUND_LEVEL, LEFT, PREFETCH_MARGIN,
+                             PUSH_SPEED, RIGHT, RUN_ANIM_SPEED, SCREEN_WIDTH,
+                             TROLLEY_FRICTION, TROLLEY_MIN_SPEED, TROLLEY_X, ZERO)
+
+
+def walk(x: int, is_left: bool) -> int:
+    """
+    Return the x position after one walking step.
+
+    Args:
+        x (int): Current x position.
+        is_left (bool): Whether walking to the left.
+    """
+    return x - FIVE if is_left else x + FIVE
+
+
+def fall(y: int, height: int, velocity_y: int, is_jumping: bool, gravity: int,
+         jump_ceiling_y: int) -> tuple[int, int, bool]:
+    """
+    Apply one step of jump physics to the player.
+
+    Args:
+        y (int): Top of the player.
+        height (int): Height of the player.
+        velocity_y (int): Vertical velocity, negative is up.
+        is_jumping (bool): Whether the player is in the air.
+        gravity (int): Velocity added per step while jumping.
+        jump_ceiling_y (int): Highest top position of a jump.
+
+    Returns:
+        tuple[int, int, bool]: New top, vertical velocity and jumping state.
+    """
+    # Jumping
+    if is_jumping:
+        velocity_y += gravity
+        y += velocity_y
+
+        # Prevent piccolo from going over maximum height
+        if y <= jump_ceiling_y:
+            y = jump_ceiling_y
+            velocity_y = 0
+
+    # Descending
+    if y + height >= GROUND_LEVEL:
+        y = GROUND_LEVEL - height
+        is_jumping = False
+        velocity_y = 0
+
+    return y, velocity_y, is_jumping
+
+
+def run_animation(frame: int, running: bool, frames: int) -> tuple[int, int | None]:
+    """
+    Apply one step of the player's running animation.
+
+    Args:
+        frame (int): Running animation step counter.
+        running (bool): Whether the player is running.
+        frames (int): Number of running images.
+
+    Returns:
+        tuple[int, int | None]: New step counter and index of the running image, None when standing.
+    """
+    if not running:
+        return frame, None
+
+    # Every running image is shown for RUN_ANIM_SPEED steps, then the cycle starts over
+    frame += 1
+    if frame >= frames * RUN_ANIM_SPEED:
+        frame = 0
+    return frame, frame // RUN_ANIM_SPEED
+
+
+def roll(x: int, speed: float, taken: bool) -> tuple[int, float]:
+    """
+    Apply one step of trolley movement.
+
+    Args:
+        x (int): Left of the trolley.
+        speed (float): Horizontal speed of a released trolley.
+        taken (bool): Whether the player is pushing the trolley.
+
+    Returns:
+        tuple[int, float]: New left and speed.
+    """
+    # Trolley is not taken, so it rolls and slows down
+    if not taken:
+        x += int(speed)
+        speed *= TROLLEY_FRICTION
+
+        if abs(speed) < TROLLEY_MIN_SPEED:
+            speed = ZERO
+
+    # Prevent losing trolley when released next to screen edges
+    if x <= EDGE_MARGIN:
+        x = EDGE_MARGIN
+    elif not taken and x >= SCREEN_WIDTH - (EDGE_MARGIN * FIVE):
+        x = SCREEN_WIDTH - (EDGE_MARGIN * FIVE)
+
+    return x, speed
+
+
+def trolley_anchor(player_centerx: int, player_bottom: int) -> tuple[int, int]:
+    """
+    Return the midbottom position of a trolley the player is pushing.
+
+    Args:
+        player_centerx (int): Horizontal center of the player.
+        player_bottom (int): Bottom of the player.
+    """
+    return (player_centerx + TROLLEY_X, player_bottom)
+
+
+def release_speed(is_left: bool) -> int:
+    """
+    Return the speed of a trolley released by a player facing left or right.
+
+    Args:
+        is_left (bool): Whether the player faces left.
+    """
+    return (-1 if is_left else 1) * PUSH_SPEED
+
+
+def exit_side(left: int, right: int) -> str | None:
+    """
+    Return the screen edge the player is exiting the scene from.
+
+    Args:
+        left (int): Left of the player.
+        right (int): Right of the player.
+
+    Returns:
+        str | None: LEFT, RIGHT or None when not at an edge.
+    """
+    if left <= EDGE_MARGIN:
+        return LEFT
+    if right >= SCREEN_WIDTH - EDGE_MARGIN:
+        return RIGHT
+    return None
+
+
+def approaching_side(left: int, right: int) -> str | None:
+    """
+    Return the screen edge the player is close enough to for reading the next scene ahead.
+
+    Args:
+        left (int): Left of the player.
+        right (int): Right of the player.
+
+    Returns:
+        str | None: LEFT, RIGHT or None when far from both edges.
+    """
+    prefetch_margin = EDGE_MARGIN + PREFETCH_MARGIN
+    if left <= prefetch_margin:
+        return LEFT
+    if right >= SCREEN_WIDTH - prefetch_margin:
+        return RIGHT
+    return None
+
+
+def spawn_left(side: str, width: int) -> int:
+    """
+    Return the left of the player entering a scene after exiting the previous one from a side.
+
+    Args:
+        side (str): Side the previous scene was exited from.
+        width (int): Width of the player.
+    """
+    # Exiting to the left enters the next scene from its right edge
+    if side == LEFT:
+        return SCREEN_WIDTH - EDGE_MARGIN - FIVE - width
+    return EDGE_MARGIN + FIVE
+
+
+def at_front_door(left: int) -> bool:
+    """
+    Return whether the player stands at the front door.
+
+    Args:
+        left (int): Left of the player.
+    """
+    return DOOR_LEFT <= left <= DOOR_RIGHT
+
+
+def door_spawn_left() -> int:
+    """
+    Return the left of the player after walking through the front door.
+    """
+    return CENTER
+
+
+def overlaps(a: tuple, b: tuple) -> bool:
+    """
+    Return whether two (x, y, width, height) rectangles overlap, like pygame.Rect.colliderect.
+
+    Args:
+        a (tuple): First rectangle.
+        b (tuple): Second rectangle.
+    """
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    if aw <= 0 or ah <= 0 or bw <= 0 or bh <= 0:
+        return False
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+def pixels_overlap(a: tuple, a_pixels: np.ndarray | None, b: tuple, b_pixels: np.ndarray | None) -> bool:
+    """
+    Return whether the opaque pixels of two overlapping rectangles touch, like comparing pygame masks.
+
+    Footprints are placed at their rectangle's top left and may be larger than the rectangle,
+    like a sprite image drawn at its rect, so call overlaps first as the broad phase.
+
+    Args:
+        a (tuple): First (x, y, width, height) rectangle.
+        a_pixels (np.ndarray | None): Opaque pixels of the first sprite as a boolean [y, x] array,
+            None treats the whole rectangle as opaque.
+        b (tuple): Second (x, y, width, height) rectangle.
+        b_pixels (np.ndarray | None): Opaque pixels of the second sprite, like a_pixels.
+    """
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    if a_pixels is None:
+        a_pixels = np.ones((ah, aw), dtype=bool)
+    if b_pixels is None:
+        b_pixels = np.ones((bh, bw), dtype=bool)
+
+    # Only the intersection of both footprints can hold touching pixels
+    left = max(ax, bx)
+    top = max(ay, by)
+    right = min(ax + a_pixels.shape[1], bx + b_pixels.shape[1])
+    bottom = min(ay + a_pixels.shape[0], by + b_pixels.shape[0])
+    if left >= right or top >= bottom:
+        return False
+    return bool(np.any(a_pixels[top - ay:bottom - ay, left - ax:right - ax]
+                       & b_pixels[top - by:bottom - by, left - bx:right - bx]))
@@ -0,0 +1,98 @@
+"""
+Index of which game objects are in which scene.
+"""
+
+
+class SceneIndex:
+    """
+    Maps scenes to the game objects in them.
+
+    Objects are either placed in one scene or carried, carried objects
+    (e.g. the player or a taken trolley) are members of every scene.
+
+    Responsibilities:
+        - Place objects in scenes and move them between scenes
+        - Keep carried objects in every scene
+        - Answer scene membership in constant time
+
+    Attributes:
+        _members (dict): Scene name to an insertion-ordered dict of its objects.
+        _scenes (dict): Object to its scene name, CARRIED for carried objects.
+    """
+
+    CARRIED = None
+
+    def __init__(self):
+        self._members = {}
+        self._scenes = {}
+
+    def place(self, entity, scene: str) -> None:
+        """
+        Put an object in a scene, removing it from its previous scene.
+
+        Args:
+            entity: Game object.
+            scene (str): Scene name.
+        """
+        self._move(entity, scene)
+
+    def carry(self, entity) -> None:
+        """
+        Make an object a member of every scene until it is placed again.
+
+        Args:
+            entity: Game object.
+        """
+        self._move(entity, self.CARRIED)
+
+    def remove(self, entity) -> None:
+        """
+        Remove an object from the index.
+
+        Args:
+            entity: Game object.
+        """
+        if entity in self._scenes:
+            del self._members[self._scenes.pop(entity)][entity]
+
+    def contains(self, entity, scene: str) -> bool:
+        """
+        Return whether an object is in a scene or carried.
+
+        Args:
+            entity: Game object.
+            scene (str): Scene name.
+        """
+        if entity not in self._scenes:
+            return False
+        return self._scenes[entity] in (scene, self.CARRIED)
+
+    def members(self, scene: str) -> list:
+        """
+        Return the objects placed in a scene followed by the carried objects.
+
+        Args:
+            scene (str): Scene name.
+        """
+        return [*self._members.get(scene, ()), *self._members.get(self.CARRIED, ())]
+
+    def scene_of(self, entity) -> str | None:
+        """
+        Return the scene an object is placed in, None if it is carried or unknown.
+
+        Args:
+            entity: Game object.
+        """
+        return self._scenes.get(entity)
+
+    def _move(self, entity, scene: str | None) -> None:
+        """
+        Move an object to a scene or to the carried objects.
+
+        Args:
+            entity: Game object.
+            scene (str | None): Scene name, CARRIED for carried objects.
+        """
+        self.remove(entity)
+        self._scenes[entity] = scene
+        self._members.setdefault(scene, {})[entity] = None
@@ -0,0 +1,188 @@
+"""
+Uniform grid spatial hash for finding game objects near a rectangle.
+"""
+from core.physics import overlaps
+from utils.constants import SPATIAL_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Buckets game objects into grid cells per scene, so a query visits only the cells it overlaps.
+
+    Responsibilities:
+        - Insert, move and remove objects, re-bucketing only when their covered cells change
+        - Return the objects overlapping a rectangle in a scene
+        - Return the nearest object within reach of a rectangle
+        - Count queries, visited cells and checked candidates
+
+    Args:
+        cell_size (int): Width and height of a grid cell in pixels.
+
+    Attributes:
+        cell_size (int): Width and height of a grid cell in pixels.
+        queries (int): Number of queries.
+        cells_visited (int): Number of cells visited by queries.
+        candidates (int): Number of objects checked by queries.
+        rebuckets (int): Number of updates that moved an object to other cells.
+        _cells (dict): Scene to a dict of (column, row) cells to insertion-ordered dicts of objects.
+        _entries (dict): Object to its scene, bounds and covered cells.
+    """
+
+    def __init__(self, cell_size: int = SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.queries = 0
+        self.cells_visited = 0
+        self.candidates = 0
+        self.rebuckets = 0
+        self._cells = {}
+        self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, entity) -> bool:
+        return entity in self._entries
+
+    def update(self, entity, scene: str, bounds: tuple) -> None:
+        """
+        Insert an object or move it to new bounds.
+
+        Args:
+            entity: Hashable game object or entity id.
+            scene (str): Scene the object is in.
+            bounds (tuple): Object rectangle as (x, y, width, height).
+        """
+        cells = self._cells_of(bounds)
+        entry = self._entries.get(entity)
+        if entry is not None and entry[0] == scene and entry[2] == cells:
+            self._entries[entity] = (scene, bounds, cells)
+            return
+
+        if entry is not None:
+            self.remove(entity)
+            self.rebuckets += 1
+        scene_cells = self._cells.setdefault(scene, {})
+        for cell in cells:
+            scene_cells.setdefault(cell, {})[entity] = None
+        self._entries[entity] = (scene, bounds, cells)
+
+    def remove(self, entity) -> None:
+        """
+        Remove an object.
+
+        Args:
+            entity: Hashable game object or entity id.
+        """
+        entry = self._entries.pop(entity, None)
+        if entry is None:
+            return
+        scene_cells = self._cells[entry[0]]
+        for cell in entry[2]:
+            bucket = scene_cells[cell]
+            del bucket[entity]
+            if not bucket:
+                del scene_cells[cell]
+
+    def query(self, scene: str, bounds: tuple) -> list:
+        """
+        Return the objects overlapping a rectangle.
+
+        Args:
+            scene (str): Scene to search.
+            bounds (tuple): Rectangle as (x, y, width, height).
+
+        Returns:
+            list: Overlapping objects.
+        """
+        return [entity for entity, _ in self._overlapping(scene, bounds)]
+
+    def nearest(self, scene: str, bounds: tuple, reach: int = 0):
+        """
+        Return the object nearest to a rectangle among those within reach.
+
+        Args:
+            scene (str): Scene to search.
+            bounds (tuple): Rectangle as (x, y, width, height).
+            reach (int): Pixels the rectangle is grown by on every side.
+
+        Returns:
+            Object whose center is closest to the rectangle's center, None if nothing is within reach.
+        """
+        x, y, width, height = bounds
+        reach_bounds = (x - reach, y - reach, width + 2 * reach, height + 2 * reach)
+        center_x = x + width / 2
+        center_y = y + height / 2
+
+        nearest = None
+        nearest_distance = None
+        for entity, (ex, ey, ew, eh) in self._overlapping(scene, reach_bounds):
+            distance = (ex + ew / 2 - center_x) ** 2 + (ey + eh / 2 - center_y) ** 2
+            if nearest_distance is None or distance < nearest_distance:
+                nearest, nearest_distance = entity, distance
+        return nearest
+
+    def stats(self) -> dict:
+        """
+        Return the query counters.
+
+        Returns:
+            dict: Objects, queries, visited cells, checked candidates and re-bucketed updates.
+        """
+        return {
+            "objects": len(self._entries),
+            "queries": self.queries,
+            "cells_visited": self.cells_visited,
+            "candidates": self.candidates,
+            "rebuckets": self.rebuckets,
+        }
+
+    def _overlapping(self, scene: str, bounds: tuple) -> list:
+        """
+        Return the objects overlapping a rectangle with their bounds, counting the work done.
+
+        Args:
+            scene (str): Scene to search.
+            bounds (tuple): Rectangle as (x, y, width, height).
+
+        Returns:
+            list: (object, bounds) pairs.
+        """
+        self.queries += 1
+        scene_cells = self._cells.get(scene)
+        if not scene_cells:
+            return []
+
+        seen = set()
+        found = []
+        for cell in self._cells_of(bounds):
+            bucket = scene_cells.get(cell)
+            self.cells_visited += 1
+            if not bucket:
+                continue
+            for entity in bucket:
+                if entity in seen:
+                    continue
+                seen.add(entity)
+                self.candidates += 1
+                entity_bounds = self._entries[entity][1]
+                if overlaps(bounds, entity_bounds):
+                    found.append((entity, entity_bounds))
+        return found
+
+    def _cells_of(self, bounds: tuple) -> tuple:
+        """
+        Return the grid cells a rectangle covers.
+
+        Args:
+            bounds (tuple): Rectangle as (x, y, width, height).
+
+        Returns:
+            tuple: (column, row) cells.
+        """
+        x, y, width, height = bounds
+        size = self.cell_size
+        left = int(x) // size
+        top = int(y) // size
+        right = int(x + max(width, 1) - 1) // size
+        bottom = int(y + max(height, 1) - 1) // size
+        return tuple((column, row) for column in range(left, right + 1) for row in range(top, bottom + 1))
@@ -0,0 +1,272 @@
+"""
+Pygame-free state of the game world.
+
+World holds the positions, velocities, scene and trolley ownership that the pygame
+game objects otherwise keep in rects, and steps them with the rules of core.physics
+exactly like Game.step does. It loads no images or sounds, so it can run simulations
+and fuzzing far faster than real time. Collisions compare the opaque pixel footprints
+from_game copies from the sprites' collision masks once.
+"""
+import numpy as np
+from core.physics import (at_front_door, door_spawn_left, exit_side, fall,
+                          overlaps, pixels_overlap, release_speed, roll,
+                          run_animation, spawn_left, trolley_anchor, walk)
+from utils.commands import Command
+from utils.constants import (BALLROOM, DOWN, ELEVATOR, ENTRANCE, FIVE, GARAGE,
+                             GRAVITY, GROUND_LEVEL, JUMP_CEILING_Y, JUMP_HEIGHT,
+                             LUGGAGE, PLAYER_RUN_IMAGES, PLAYER_X, RECEPTION,
+                             SOFAS, TROLLEY_X, UP, YARD, ZERO)
+from utils.scene_graph import SceneGraph, load_scene_graph
+
+# Commands that keep the player running, like the Mediator's running states
+RUNNING_COMMANDS = frozenset((Command.MOVE_LEFT, Command.MOVE_RIGHT, Command.TAKE_TROLLEY))
+
+# Scene changing commands and their target scenes
+SCENE_COMMANDS = {
+    Command.CHANGE_TO_BALLROOM: BALLROOM,
+    Command.CHANGE_TO_ELEVATOR: ELEVATOR,
+    Command.CHANGE_TO_ENTRANCE: ENTRANCE,
+    Command.CHANGE_TO_GARAGE: GARAGE,
+    Command.CHANGE_TO_LUGGAGE: LUGGAGE,
+    Command.CHANGE_TO_RECEPTION: RECEPTION,
+    Command.CHANGE_TO_SOFAS: SOFAS,
+    Command.CHANGE_TO_YARD: YARD,
+}
+
+
+class World:
+    """
+    Game state and rules without pygame.
+
+    Responsibilities:
+        - Hold player and trolley positions, velocities, facing, animation and ownership
+        - Handle commands the same way the Mediator does
+        - Advance the state by one simulation step the same way Game.step does
+
+    Args:
+        player_size (tuple[int, int]): Width and height of the player image.
+        trolley_size (tuple[int, int]): Width and height of the trolley image.
+        scene_graph (SceneGraph | None): Scenes and their exits, None loads the default graph.
+        player_footprints (dict | None): Opaque pixels of every player image as boolean [y, x] arrays,
+            keyed by (is_left, running image index or None when standing). None counts the whole rect.
+        trolley_footprint (np.ndarray | None): Opaque pixels of the trolley image, None counts the whole rect.
+
+    Attributes:
+        scene_graph (SceneGraph): Scenes and their exits.
+        current_scene (str): Scene the player is in.
+        running (bool): Whether the latest command keeps the player running.
+        player_x (int): Left of the player.
+        player_y (int): Top of the player.
+        player_width (int): Width of the player.
+        player_height (int): Height of the player.
+        velocity_y (int): Vertical velocity of the player, negative is up.
+        is_jumping (bool): Whether the player is in the air.
+        is_left (bool): Whether the player faces left.
+        running_frame (int): Running animation step counter, like Player.running_frame.
+        player_sprite (tuple[bool, int | None]): Key of the player image shown, in player_footprints.
+        player_footprints (dict | None): Opaque pixels of every player image.
+        gravity (int): Velocity added per step while jumping.
+        jump_height (int): Starting velocity of a jump.
+        jump_ceiling_y (int): Highest top position of a jump.
+        trolley_x (int): Left of the trolley.
+        trolley_y (int): Top of the trolley.
+        trolley_width (int): Width of the trolley.
+        trolley_height (int): Height of the trolley.
+        trolley_speed (float): Horizontal speed of a released trolley.
+        trolley_taken (bool): Whether the player is pushing the trolley.
+        trolley_scene (str): Scene the trolley is in.
+        trolley_footprint (np.ndarray | None): Opaque pixels of the trolley image.
+        steps (int): Simulation steps run.
+    """
+
+    def __init__(self, player_size: tuple[int, int], trolley_size: tuple[int, int],
+                 scene_graph: SceneGraph | None = None, player_footprints: dict | None = None,
+                 trolley_footprint: np.ndarray | None = None):
+        self.scene_graph = scene_graph if scene_graph is not None else load_scene_graph()
+        self.current_scene = self.scene_graph.start
+        self.running = False
+        self.steps = 0
+
+        # Player stands on the ground like Player places its rect from midbottom
+        self.player_width, self.player_height = player_size
+        self.player_x = PLAYER_X - self.player_width // 2
+        self.player_y = GROUND_LEVEL - self.player_height
+        self.velocity_y = ZERO
+        self.is_jumping = False
+        self.is_left = False
+        self.running_frame = ZERO
+        self.player_sprite = (False, None)
+        self.player_footprints = player_footprints
+        self.gravity = GRAVITY
+        self.jump_height = JUMP_HEIGHT
+        self.jump_ceiling_y = JUMP_CEILING_Y
+
+        # Trolley starts rolling in the entrance like Trolley
+        self.trolley_width, self.trolley_height = trolley_size
+        self.trolley_x = TROLLEY_X - self.trolley_width // 2
+        self.trolley_y = GROUND_LEVEL - self.trolley_height
+        self.trolley_speed = FIVE
+        self.trolley_taken = False
+        self.trolley_scene = ENTRANCE
+        self.trolley_footprint = trolley_footprint
+
+    @classmethod
+    def from_game(cls, game) -> "World":
+        """
+        Build a world holding the current state of a game and the footprints of its sprites.
+
+        Args:
+            game: Game instance whose player, trolley and mediator state is copied.
+        """
+        # Imported here so the world itself stays pygame-free
+        from utils.helpers import opaque_pixels
+
+        player = game.player
+        trolley = game.trolley
+        mediator = game.mediator
+        sprites = {(False, None): player.stand_image, (True, None): player.left_stand_image}
+        sprites.update(((False, index), image) for index, image in enumerate(player.running_images))
+        sprites.update(((True, index), image) for index, image in enumerate(player.left_running_images))
+        world = cls(player.rect.size, trolley.rect.size, mediator.scene_graph,
+                    {key: opaque_pixels(image) for key, image in sprites.items()},
+                    opaque_pixels(trolley.image))
+        world.current_scene = mediator.current_scene
+        world.running = mediator.running
+        world.player_x, world.player_y = player.rect.topleft
+        world.velocity_y = player.velocity_y
+        world.is_jumping = player.is_jumping
+        world.is_left = player.is_left
+        world.running_frame = player.running_frame
+        world.player_sprite = next(key for key, image in sprites.items() if image is player.image)
+        world.gravity = player.gravity
+        world.jump_height = player.jump_height
+        world.jump_ceiling_y = player.jump_ceiling_y
+        world.trolley_x, world.trolley_y = trolley.rect.topleft
+        world.trolley_speed = trolley.speed
+        world.trolley_taken = trolley.taken
+        world.trolley_scene = trolley.scene_name
+        return world
+
+    def step(self, commands=()) -> None:
+        """
+        Advance the world by one simulation step.
+
+        Args:
+            commands: Commands dispatched on this step, in order.
+        """
+        for command in commands:
+            self.handle_command(command)
+
+        # Player physics
+        self.player_y, self.velocity_y, self.is_jumping = fall(
+            self.player_y, self.player_height, self.velocity_y, self.is_jumping,
+            self.gravity, self.jump_ceiling_y)
+        self.running_frame, running_image = run_animation(self.running_frame, self.running, PLAYER_RUN_IMAGES)
+        self.player_sprite = (self.is_left, running_image)
+
+        # Trolley follows the player when taken and rolls when released,
+        # a trolley left in another scene waits for the player to come back
+        if self.trolley_taken:
+            centerx, bottom = trolley_anchor(self.player_x + self.player_width // 2,
+                                             self.player_y + self.player_height)
+            self.trolley_x = centerx - self.trolley_width // 2
+            self.trolley_y = bottom - self.trolley_height
+        if self.trolley_taken or self.trolley_scene == self.current_scene:
+            self.trolley_x, self.trolley_speed = roll(self.trolley_x, self.trolley_speed, self.trolley_taken)
+
+        self._edge_transition()
+        self.steps += 1
+
+    def handle_command(self, command: Command | None) -> None:
+        """
+        Handle a command like Mediator.handle_command.
+
+        Args:
+            command (Command | None): Command to handle.
+        """
+        if command is Command.MOVE_LEFT or command is Command.MOVE_RIGHT:
+            self.is_left = command is Command.MOVE_LEFT
+            self.player_x = walk(self.player_x, self.is_left)
+        elif command is Command.JUMP:
+            if not self.is_jumping:
+                self.is_jumping = True
+                self.velocity_y = self.jump_height
+        elif command is Command.TAKE_TROLLEY:
+            if self.current_scene == self.trolley_scene and self._touches_trolley():
+                self.trolley_taken = True
+                self.trolley_speed = ZERO
+        elif command is Command.RELEASE_TROLLEY:
+            if self.trolley_taken and self.current_scene == self.trolley_scene:
+                self.trolley_taken = False
+                self.trolley_speed = release_speed(self.is_left)
+        elif command is Command.ENTER_DOOR:
+            self._walk_through_door(UP)
+        elif command is Command.EXIT_DOOR:
+            self._walk_through_door(DOWN)
+        elif command in SCENE_COMMANDS:
+            self.change_scene(SCENE_COMMANDS[command])
+
+        self.running = command in RUNNING_COMMANDS
+
+    def change_scene(self, scene: str) -> None:
+        """
+        Change the current scene, the trolley moves along when taken.
+
+        Args:
+            scene (str): Name of a scene in the scene graph.
+        """
+        if scene == self.current_scene or scene not in self.scene_graph:
+            return
+        self.current_scene = scene
+        if self.trolley_taken:
+            self.trolley_scene = scene
+
+    @property
+    def player_bounds(self) -> tuple[int, int, int, int]:
+        """
+        Player rectangle as (x, y, width, height).
+        """
+        return (self.player_x, self.player_y, self.player_width, self.player_height)
+
+    @property
+    def trolley_bounds(self) -> tuple[int, int, int, int]:
+        """
+        Trolley rectangle as (x, y, width, height).
+        """
+        return (self.trolley_x, self.trolley_y, self.trolley_width, self.trolley_height)
+
+    def _touches_trolley(self) -> bool:
+        """
+        Return whether the opaque pixels of the player and the trolley overlap, like sprites_collide.
+        """
+        if not overlaps(self.player_bounds, self.trolley_bounds):
+            return False
+        player_pixels = None if self.player_footprints is None else self.player_footprints[self.player_sprite]
+        return pixels_overlap(self.player_bounds, player_pixels, self.trolley_bounds, self.trolley_footprint)
+
+    def _walk_through_door(self, side: str) -> None:
+        """
+        Change to the scene behind the front door when the player stands at it.
+
+        Args:
+            side (str): UP to enter and DOWN to exit through the door.
+        """
+        scene = self.scene_graph.neighbour(self.current_scene, side)
+        if scene is None or not at_front_door(self.player_x):
+            return
+        self.change_scene(scene)
+        self.player_x = door_spawn_left()
+
+    def _edge_transition(self) -> None:
+        """
+        Move the player to the neighbouring scene when they exit from a screen edge.
+        """
+        side = exit_side(self.player_x, self.player_x + self.player_width)
+        if side is None:
+            return
+        scene = self.scene_graph.neighbour(self.current_scene, side)
+        if scene is None:
+            return
+        self.change_scene(scene)
+        self.running = False
+        self.player_x = spawn_left(side, self.player_width)
@@ -1,9 +1,15 @@
 """
 Music and sound effects for the game.
 """
+import io
+import logging
 import os
 import pygame
-from utils.constants import (SOUNDS_PATH, SOUND_VOLUME)
+from concurrent.futures import ThreadPoolExecutor
+from utils.asset_pack import asset_pack
+from utils.constants import (MUSIC_FADE_MS, PRELOADED_SOUNDS, SOUND_CACHE_SIZE,
+                             SOUND_CHANNELS, SOUNDS_PATH, SOUND_VOLUME)
+from utils.lru_cache import LRUCache
 
 
 class AudioManager:
@@ -12,29 +18,79 @@ class AudioManager:
 
     Responsibilities:
         - Play background music (looped or selected times)
-        - Stop or switch music tracks
+        - Stop or switch music tracks with a fade-out and fade-in
+        - Read music files on a background thread so switching never blocks the frame
         - Play short sound effects
         - Avoid reloading the same track unnecessarily
         - Maintain currently playing track state
+        - Keep decoded sound effects in a bounded cache so they are read from disk once
+        - Read music and sound effects from the asset pack when they are packed
+        - Play sound effects on a fixed pool of channels, stealing lower priority voices when full
 
     Args:
         sound_volume (float): The volume level of the sound
+        num_channels (int): Number of channels reserved for sound effects
+        cache_size (int): Maximum number of decoded sound effects kept in memory
+        preload (tuple): Sound effect file names decoded at startup
+        fade_ms (int): Music fade-out and fade-in time in milliseconds
 
     Attributes:
         currently_playing (str | None): Path to currently playing sound file
+        fade_ms (int): Music fade-out and fade-in time in milliseconds
+        loads (int): Number of sound effects decoded from disk
+        hits (int): Number of sound effects served from the cache
+        dropped (int): Number of sound effects not played because every channel was busy
+        steals (int): Number of playing sound effects cut off for a higher priority one
+        _sounds (LRUCache): Decoded sound effects by file name
+        _channels (list): Channels reserved for sound effects
+        _channel_priority (list): Priority of the sound playing on each channel
+        _channel_order (list): Play order of the sound playing on each channel
+        _plays (int): Number of sound effects started, used as play order
+        _music_data (dict): Futures of music file contents by file name, the pending and the next track only
+        _pending_music (tuple | None): File name and loops of music waiting to start
+        _loader: Background thread pool reading music files
     """
 
-    def __init__(self, sound_volume: float = SOUND_VOLUME):
+    def __init__(self, sound_volume: float = SOUND_VOLUME, num_channels: int = SOUND_CHANNELS,
+                 cache_size: int = SOUND_CACHE_SIZE, preload: tuple = PRELOADED_SOUNDS,
+                 fade_ms: int = MUSIC_FADE_MS):
         # Initialize Pygame mixer
         pygame.mixer.init()
 
         self.currently_playing = None
         self.sound_volume = sound_volume
 
+        # Music is read into memory off the game loop and started once ready
+        self.fade_ms = fade_ms
+        self._music_data = {}
+        self._pending_music = None
+        self._loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music")
+
+        # Reserve a fixed pool of channels so pygame never picks them on its own
+        pygame.mixer.set_num_channels(max(num_channels, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(num_channels)
+        self._channels = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        self._channel_priority = [0] * num_channels
+        self._channel_order = [0] * num_channels
+        self._plays = 0
+
+        # Sound effect cache and its counters
+        self._sounds = LRUCache(cache_size)
+        self.loads = 0
+        self.hits = 0
+        self.dropped = 0
+        self.steals = 0
+
+        for filename in preload:
+            self._get_sound(filename)
+
     def play_music(self, filename: str, loops=-1) -> None:
         """
         Play a music track, looping if desired.
 
+        The current track fades out and the new one fades in once its file has been
+        read on the background thread, see update().
+
         Args:
             filename (str): Name of the music file
             loops (int): Number of loops (-1 = infinite)
@@ -42,25 +98,171 @@ class AudioManager:
         music_file = os.path.join(SOUNDS_PATH, filename)
 
         if self.currently_playing != music_file:
-            pygame.mixer.music.load(music_file)
-            pygame.mixer.music.play(loops)
+            self.prefetch_music(filename)
+            pygame.mixer.music.fadeout(self.fade_ms)
+            self._pending_music = (filename, loops)
             self.currently_playing = music_file
+            self.update()
+
+    @property
+    def is_changing_music(self) -> bool:
+        """
+        Whether a music track is waiting to start.
+        """
+        return self._pending_music is not None
+
+    def prefetch_music(self, filename: str) -> None:
+        """
+        Start reading a music file into memory on the background thread.
+
+        Only the pending track is kept besides the new one, earlier prefetches are dropped.
+
+        Args:
+            filename (str): Name of the music file
+        """
+        if filename not in self._music_data:
+            pending = self._pending_music[0] if self._pending_music is not None else None
+            for name in [name for name in self._music_data if name != pending]:
+                self._music_data.pop(name).cancel()
+            music_file = os.path.join(SOUNDS_PATH, filename)
+            self._music_data[filename] = self._loader.submit(self._read_file, music_file)
+
+    @staticmethod
+    def _read_file(path: str) -> bytes:
+        """
+        Read a whole file from the asset pack or from disk, run on the background thread.
+
+        Args:
+            path (str): File path.
+
+        Returns:
+            bytes: File contents.
+        """
+        name = asset_pack.name_of(path)
+        if name is not None:
+            return bytes(asset_pack.read(name))
+        with open(path, "rb") as file:
+            return file.read()
+
+    def update(self) -> None:
+        """
+        Start pending music once its file is read and the previous track has faded out.
+
+        Should be called once per frame.
+        """
+        if self._pending_music is None:
+            return
+
+        filename, loops = self._pending_music
+        music_data = self._music_data[filename]
+        if not music_data.done() or pygame.mixer.music.get_busy():
+            return
+
+        # The mixer keeps the loaded track, so the read is dropped either way
+        self._pending_music = None
+        del self._music_data[filename]
+        try:
+            data = music_data.result()
+        except OSError as e:
+            error_message = f"Error loading music from '{filename}': {e}"
+            logging.error(error_message)
+            self.currently_playing = None
+            return
+
+        pygame.mixer.music.load(io.BytesIO(data), os.path.splitext(filename)[1][1:])
+        pygame.mixer.music.play(loops, fade_ms=self.fade_ms)
 
     def stop_music(self) -> None:
         """
-        Stop current music playback.
+        Fade out current music playback.
         """
-        pygame.mixer.music.stop()
+        pygame.mixer.music.fadeout(self.fade_ms)
+        self._pending_music = None
         self.currently_playing = None
 
-    def play_sound(self, filename: str) -> None:
+    def play_sound(self, filename: str, priority: int = 0) -> None:
         """
         Play a short sound effect (non-blocking).
 
+        When every channel is busy, the oldest sound with the lowest priority not
+        above the requested one is cut off. If there is none, the sound is dropped.
+
         Args:
             filename (str): Name of the sound file.
+            priority (int): Higher priority sounds may cut off lower priority ones.
+        """
+        sound = self._get_sound(filename)
+
+        index = self._find_channel(priority)
+        if index is None:
+            self.dropped += 1
+            return
+
+        self._plays += 1
+        self._channel_priority[index] = priority
+        self._channel_order[index] = self._plays
+        self._channels[index].play(sound)
+
+    def _get_sound(self, filename: str) -> pygame.mixer.Sound:
         """
-        sound_file = os.path.join(SOUNDS_PATH, filename)
-        sound = pygame.mixer.Sound(sound_file)
+        Return a decoded sound effect, reading it from disk only on a cache miss.
+
+        Args:
+            filename (str): Name of the sound file.
+
+        Returns:
+            pygame.mixer.Sound: Decoded sound effect with the sound volume set.
+        """
+        sound = self._sounds.get(filename)
+        if sound is not None:
+            self.hits += 1
+            return sound
+
+        sound = pygame.mixer.Sound(asset_pack.open(os.path.join(SOUNDS_PATH, filename)))
         sound.set_volume(self.sound_volume)
-        sound.play()
+        self._sounds.put(filename, sound)
+        self.loads += 1
+        return sound
+
+    def _find_channel(self, priority: int) -> int | None:
+        """
+        Find the channel index for a new sound effect.
+
+        Args:
+            priority (int): Priority of the new sound effect.
+
+        Returns:
+            int | None: Index of a free or stealable channel, None if the sound should be dropped.
+        """
+        victim = None
+        victim_rank = None
+        for index, channel in enumerate(self._channels):
+            # Free channel
+            if not channel.get_busy():
+                return index
+
+            # Busy channel playing a sound that may be cut off, lowest priority and oldest first
+            if self._channel_priority[index] > priority:
+                continue
+            rank = (self._channel_priority[index], self._channel_order[index])
+            if victim is None or rank < victim_rank:
+                victim = index
+                victim_rank = rank
+
+        if victim is not None:
+            self.steals += 1
+        return victim
+
+    def stats(self) -> dict:
+        """
+        Return the sound effect counters.
+
+        Returns:
+            dict: Number of loads, cache hits, dropped and stolen sound effects.
+        """
+        return {
+            "loads": self.loads,
+            "hits": self.hits,
+            "dropped": self.dropped,
+            "steals": self.steals,
+        }
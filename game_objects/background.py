@@ -1,12 +1,15 @@
 """
 Background for the game.
 """
-import os
+import pygame
 from game_objects.screen import Screen
-from utils.constants import (BALLROOM, GRAPHICS_PATH, GROUND_X, GROUND_Y,
-                             ELEVATOR, ENTRANCE, GARAGE, LUGGAGE, RECEPTION,
-                             SKY_X, SKY_Y, SOFAS, YARD)
+from utils.asset_loader import scene_images
+from utils.constants import (DISPLAY_SIZE, GROUND_X, GROUND_Y,
+                             SCENE_CACHE_BUDGET, SKY_X, SKY_Y, ZERO)
+from utils.asset_registry import surface_bytes
 from utils.helpers import load_image
+from utils.lru_cache import LRUCache
+from utils.scene_graph import SceneGraph, load_scene_graph
 
 
 class Background:
@@ -18,109 +21,111 @@ class Background:
         - Provide a method to change scenes (entrance, yard, etc.)
         - Serve as a communication point for Mediator to update visuals
         - Keep track of current scene state to prevent unnecessary redraws
+        - Resolve the ground and sky images of a scene from the scene graph
+        - Load scene images only when a scene is first shown or prefetched
+        - Cache one pre-composited opaque surface per scene within a memory budget
+
+    Args:
+        screen: Screen instance for drawing operations.
+        scene_graph (SceneGraph | None): Scene graph, None loads the default one.
+        cache_budget (int): Maximum bytes of composited scene surfaces kept in memory.
 
     Attributes:
         screen: Screen instance for drawing operations.
-        outdoor_ground_surf: Ground surface for outdoor scenes.
-        entrance_sky_surf: Sky surface for entrance scene.
-        indoor_ground_surf: Ground surface for indoor scenes.
-        ballroom_sky_surf: Sky surface for ballroom scene.
-        elevator_sky_surf: Sky surface for elevator scene.
-        garage_sky_surf: Sky surface for garage scene.
-        luggage_sky_surf: Sky surface for luggage scene.
-        reception_sky_surf: Sky surface for reception scene.
-        sofas_sky_surf: Sofas surface for reception scene.
-        yard_sky_surf: Sky surface for yard scene.
-        ground_surf: Currently active ground surface.
-        sky_surf: Currently active sky surface.
+        scene_graph (SceneGraph): Scene graph the scene images are read from.
+        scene (str): Currently active scene.
+        scene_surf: Currently active ground and sky surfaces composited into one surface.
+        _scene_surfs (LRUCache): Least recently used cache of composited surfaces by scene.
     """
 
-    def __init__(self, screen: Screen):
+    def __init__(self, screen: Screen, scene_graph: SceneGraph | None = None,
+                 cache_budget: int = SCENE_CACHE_BUDGET):
         self.screen = screen
+        self.scene_graph = scene_graph if scene_graph is not None else load_scene_graph()
+        self._scene_surfs = LRUCache(cache_budget, surface_bytes)
 
-        # Initial background ground and sky surfaces (hotel entrance)
-        self.outdoor_ground_surf = load_image(
-            os.path.join(GRAPHICS_PATH,
-                "hotel",
-                "outdoor_ground.png"))
-        self.entrance_sky_surf = load_image(
-            os.path.join(GRAPHICS_PATH,
-                "hotel",
-                "entrance.png"))
-        
-        # Other surfaces
-        self.indoor_ground_surf = load_image(
-            os.path.join(GRAPHICS_PATH,
-                "hotel",
-                "indoor_ground.png"))
-        self.ballroom_sky_surf = load_image(
-            os.path.join(GRAPHICS_PATH,
-                "hotel",
-                "ballroom.png"))
-        self.elevator_sky_surf = load_image(
-            os.path.join(GRAPHICS_PATH,
-                "hotel",
-                "elevator.png"))
-        self.garage_sky_surf = load_image(
-            os.path.join(GRAPHICS_PATH,
-                "hotel",
-                "garage.png"))
-        self.luggage_sky_surf = load_image(
-            os.path.join(GRAPHICS_PATH,
-                "hotel",
-                "luggage.png"))
-        self.reception_sky_surf = load_image(
-            os.path.join(GRAPHICS_PATH,
-                "hotel",
-                "reception.png"))
-        self.sofas_sky_surf = load_image(
-            os.path.join(GRAPHICS_PATH,
-                "hotel",
-                "sofas.png"))
-        self.yard_sky_surf = load_image(
-            os.path.join(GRAPHICS_PATH,
-                "hotel",
-                "yard.png"))
-
-        # Set initial surfaces
-        self.ground_surf = self.outdoor_ground_surf
-        self.sky_surf = self.entrance_sky_surf
+        # Set initial composited scene surface (hotel entrance)
+        self.scene = self.scene_graph.start
+        self.scene_surf = self._get_scene_surf(self.scene)
 
     def change_background(self, scene: str) -> None:
         """
-        Change the background ground and sky sufraces.
+        Change the background to the composited surface of a scene.
 
         Args:
             scene (str): Scene string representing background surface.
         """
-        if scene == BALLROOM:
-            self.ground_surf = self.indoor_ground_surf
-            self.sky_surf = self.ballroom_sky_surf
-        elif scene == ELEVATOR:
-            self.ground_surf = self.indoor_ground_surf
-            self.sky_surf = self.elevator_sky_surf
-        elif scene == ENTRANCE:
-            self.ground_surf = self.outdoor_ground_surf
-            self.sky_surf = self.entrance_sky_surf
-        elif scene == GARAGE:
-            self.ground_surf = self.indoor_ground_surf
-            self.sky_surf = self.garage_sky_surf
-        elif scene == LUGGAGE:
-            self.ground_surf = self.indoor_ground_surf
-            self.sky_surf = self.luggage_sky_surf
-        elif scene == RECEPTION:
-            self.ground_surf = self.indoor_ground_surf
-            self.sky_surf = self.reception_sky_surf
-        elif scene == SOFAS:
-            self.ground_surf = self.indoor_ground_surf
-            self.sky_surf = self.sofas_sky_surf
-        elif scene == YARD:
-            self.ground_surf = self.outdoor_ground_surf
-            self.sky_surf = self.yard_sky_surf
+        if scene not in self.scene_graph:
+            return
+
+        self.scene = scene
+        self.scene_surf = self._get_scene_surf(scene)
+
+    def _get_scene_surf(self, scene: str) -> pygame.Surface:
+        """
+        Return the composited surface of a scene, loading its images on first use.
+
+        Args:
+            scene (str): Scene string representing background surface.
+
+        Returns:
+            pygame.Surface: Opaque surface with the ground and sky already blitted.
+        """
+        scene_surf = self._scene_surfs.get(scene)
+        if scene_surf is not None:
+            return scene_surf
+
+        ground_path, sky_path = scene_images(self.scene_graph, scene)
+        # Scene images are only needed until composited, so they are not kept in the asset registry
+        ground_surf = load_image(ground_path, shared=False)
+        sky_surf = load_image(sky_path, shared=False)
+
+        # New surfaces match the display pixel format, so blitting needs no conversion
+        scene_surf = pygame.Surface(DISPLAY_SIZE)
+        scene_surf.blit(ground_surf, (GROUND_X, GROUND_Y))
+        scene_surf.blit(sky_surf, (SKY_X, SKY_Y))
+        self._scene_surfs.put(scene, scene_surf)
+        return scene_surf
+
+    def is_cached(self, scene: str) -> bool:
+        """
+        Return whether the composited surface of a scene is ready in the cache.
+
+        Args:
+            scene (str): Scene string representing background surface.
+        """
+        return scene in self._scene_surfs
+
+    def prefetch(self, scene: str) -> None:
+        """
+        Composite the surface of a scene into the cache without showing it.
+
+        Args:
+            scene (str): Scene string representing background surface.
+        """
+        if scene in self.scene_graph:
+            self._get_scene_surf(scene)
+
+    def cache_size_bytes(self) -> int:
+        """
+        Return the memory used by the composited scene surface cache.
+
+        Returns:
+            int: Pixel data size of all cached scene surfaces in bytes.
+        """
+        return self._scene_surfs.size
 
     def draw(self) -> None:
         """
-        Draw the background ground and sky sufraces to the screen.
+        Draw the composited background of the current scene to the screen.
+        """
+        self.screen.screen.blit(self.scene_surf, (ZERO, ZERO))
+
+    def restore(self, rect: pygame.Rect) -> None:
+        """
+        Redraw only the given screen area of the background.
+
+        Args:
+            rect (pygame.Rect): Screen area to restore.
         """
-        self.screen.screen.blit(self.ground_surf, (GROUND_X, GROUND_Y))
-        self.screen.screen.blit(self.sky_surf, (SKY_X, SKY_Y))
+        self.screen.screen.blit(self.scene_surf, rect, rect)
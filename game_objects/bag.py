@@ -2,6 +2,7 @@
 Bag item implementation for the Piccolo game.
 """
 import os
+import pygame
 from control.mediator import Mediator
 from game_objects.screen import Screen
 from utils.constants import (BAG_X, ENTRANCE, GRAPHICS_PATH, GROUND_LEVEL)
@@ -41,10 +42,15 @@ class Bag:
         """
         pass
 
-    def draw(self) -> None:
+    def draw(self, alpha: float = 1.0) -> pygame.Rect:
         """
         Draw the bag to the screen.
+
+        Args:
+            alpha (float): Unused, the bag does not move between simulation steps.
+
+        Returns:
+            pygame.Rect: Screen area covered by the bag.
         """
-        # Draw the bag only if it's in the current scene
-        if self.mediator and self.scene_name == self.mediator.current_scene:
-            self.screen.screen.blit(self.image, self.rect)
+        # Game and renderer draw the bag only when the scene index has it in the current scene
+        return self.screen.screen.blit(self.image, self.rect)
@@ -0,0 +1,150 @@
+"""
+Items placed around the hotel, like luggage, coins and trash.
+"""
+import os
+from typing import NamedTuple
+import numpy as np
+from control.mediator import Mediator
+from core.entities import EntityStore
+from game_objects.screen import Screen
+from utils.constants import GRAPHICS_PATH, GROUND_LEVEL, ITEM_SPRITES
+from utils.helpers import load_image
+
+
+class ItemHandle(NamedTuple):
+    """
+    Key of an item in the mediator's spatial hash, told apart from game objects by its type.
+
+    Args:
+        items (Items): Items instance whose store holds the item.
+        entity (int): Entity id of the item in the store.
+    """
+    items: "Items"
+    entity: int
+
+
+class Items:
+    """
+    Draws and updates every item kept in an EntityStore.
+
+    Responsibilities:
+        - Load one image per item sprite
+        - Add items to the store by sprite and scene name
+        - Update the items of the current scene at once on every simulation step,
+          items in other scenes wait until the player comes back
+        - Draw only the items of the current scene with a single blits call
+        - Keep the items in the mediator's spatial hash as interactables, keyed by ItemHandle
+
+    Args:
+        screen: Screen instance for drawing.
+        mediator: Mediator instance for game internal communication.
+        store (EntityStore | None): Store holding the items, None creates an empty one.
+
+    Attributes:
+        screen: Screen instance for drawing.
+        mediator: Mediator instance for game internal communication.
+        store (EntityStore): Positions, velocities, scene ids and sprite ids of the items.
+        images (list): Item images indexed by sprite id.
+    """
+
+    def __init__(self, screen: Screen, mediator: Mediator | None, store: EntityStore | None = None):
+        self.screen = screen
+        self.mediator = mediator
+        self.store = store if store is not None else EntityStore()
+        self.images = [
+            load_image(os.path.join(GRAPHICS_PATH, "items", f"{sprite}.png"))
+            for sprite in ITEM_SPRITES
+        ]
+
+    def add(self, sprite: str, scene: str, x: int, velocity: tuple[float, float] = (0.0, 0.0)) -> int:
+        """
+        Put an item on the ground of a scene.
+
+        Args:
+            sprite (str): Name of an item sprite in ITEM_SPRITES.
+            scene (str): Name of a scene in the mediator's scene graph.
+            x (int): Horizontal center of the item.
+            velocity (tuple[float, float]): Starting velocity.
+
+        Returns:
+            int: Entity id of the item.
+        """
+        sprite_id = ITEM_SPRITES.index(sprite)
+        width, height = self.images[sprite_id].get_size()
+        left = x - width // 2
+        top = GROUND_LEVEL - height
+        entity = self.store.add(left, top, (width, height),
+                                self.mediator.scene_graph.scene_id(scene), sprite_id, velocity)
+        self.mediator.spatial_hash.update(ItemHandle(self, entity), scene, (left, top, width, height))
+        return entity
+
+    def prefetch(self, scene: str) -> None:
+        """
+        Build the entity index of a scene before the player enters it.
+
+        Args:
+            scene (str): Name of a scene in the mediator's scene graph.
+        """
+        self.store.in_scene(self.mediator.scene_graph.scene_id(scene))
+
+    def save_position(self) -> None:
+        """
+        Remember the current scene's positions as the previous simulation step's positions.
+        """
+        self.store.save_positions(self._scene_id())
+
+    def update(self) -> None:
+        """
+        Update the current scene's item positions on every simulation step.
+        """
+        moved = self.store.update(self._scene_id())
+        if not len(moved):
+            return
+
+        # Move only the items that moved in the spatial hash
+        store = self.store
+        scene = self.mediator.current_scene
+        for entity, x, y, width, height in zip(moved.tolist(), store.x[moved].tolist(), store.y[moved].tolist(),
+                                               store.width[moved].tolist(), store.height[moved].tolist()):
+            self.mediator.spatial_hash.update(ItemHandle(self, entity), scene, (x, y, width, height))
+
+    def is_static(self) -> bool:
+        """
+        Whether no item of the current scene moves.
+        """
+        return self.store.is_static(self._scene_id())
+
+    def draw(self, alpha: float = 1.0) -> list | None:
+        """
+        Draw the items of the current scene to the screen.
+
+        Args:
+            alpha (float): Fraction of the way from the previous to the current simulation step.
+
+        Returns:
+            list | None: Screen areas covered by the items, None if none were drawn.
+        """
+        if not self.mediator:
+            return None
+
+        store = self.store
+        entities = store.in_scene(self._scene_id())
+        if not len(entities):
+            return None
+
+        # Interpolate every visible item at once
+        previous_x = store.previous_x[entities]
+        previous_y = store.previous_y[entities]
+        x = np.rint(previous_x + (store.x[entities] - previous_x) * alpha).astype(int)
+        y = np.rint(previous_y + (store.y[entities] - previous_y) * alpha).astype(int)
+
+        images = self.images
+        return self.screen.screen.blits(
+            [(images[sprite], (left, top)) for sprite, left, top
+             in zip(store.sprite[entities].tolist(), x.tolist(), y.tolist())])
+
+    def _scene_id(self) -> int:
+        """
+        Return the id of the current scene.
+        """
+        return self.mediator.scene_graph.scene_id(self.mediator.current_scene)
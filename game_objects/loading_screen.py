@@ -0,0 +1,61 @@
+"""
+Loading screen shown while the game's images are decoded.
+"""
+import pygame
+from game_objects.screen import Screen
+from utils.constants import (DISPLAY_SIZE, FONT_PATH, LOADING_BAR_COLOR,
+                             LOADING_BAR_SIZE, LOADING_FONT_SIZE, WHITE)
+
+
+class LoadingScreen:
+    """
+    Draws the loading progress while assets are decoded.
+
+    Responsibilities:
+        - Draw a "Loading" caption and a progress bar
+        - Update the display and keep the window responsive between images
+
+    Args:
+        screen: Screen instance for drawing.
+
+    Attributes:
+        screen: Screen instance for drawing.
+        frames (int): Number of progress frames drawn.
+        _font: Pixeltype font of the caption.
+    """
+
+    def __init__(self, screen: Screen):
+        self.screen = screen
+        self.frames = 0
+        # Does nothing if the font module is already initialized
+        pygame.font.init()
+        self._font = pygame.font.Font(FONT_PATH, LOADING_FONT_SIZE)
+
+    def draw(self, done: int, total: int) -> None:
+        """
+        Draw the progress and update the display.
+
+        Args:
+            done (int): Number of loaded assets.
+            total (int): Number of assets to load.
+        """
+        surface = self.screen.screen
+        surface.fill((0, 0, 0))
+
+        center_x = DISPLAY_SIZE[0] // 2
+        center_y = DISPLAY_SIZE[1] // 2
+        caption = self._font.render("Loading", False, WHITE)
+        surface.blit(caption, caption.get_rect(midbottom=(center_x, center_y - LOADING_BAR_SIZE[1])))
+
+        # Outline of the whole bar, filled up to the progress
+        bar = pygame.Rect((0, 0), LOADING_BAR_SIZE)
+        bar.center = (center_x, center_y)
+        pygame.draw.rect(surface, LOADING_BAR_COLOR, bar, 1)
+        filled = bar.copy()
+        filled.width = bar.width * done // total if total else bar.width
+        pygame.draw.rect(surface, LOADING_BAR_COLOR, filled)
+
+        pygame.display.update()
+        # Keep the window responsive while the main thread waits for decoded images
+        pygame.event.pump()
+        self.frames += 1
@@ -2,13 +2,14 @@
 Player character implementation for the Piccolo game.
 """
 import os
+import pygame
 from control.mediator import Mediator
+from core.physics import fall, run_animation, walk
 from game_objects.screen import Screen
 from utils.commands import Command
-from utils.constants import (FIVE, GRAPHICS_PATH, GRAVITY, GROUND_LEVEL,
-                            JUMP_CEILING_Y, JUMP_HEIGHT, PLAYER_X,
-                            RUN_ANIM_SPEED, ZERO)
-from utils.helpers import load_image
+from utils.constants import (GRAPHICS_PATH, GRAVITY, GROUND_LEVEL,
+                            JUMP_CEILING_Y, JUMP_HEIGHT, PLAYER_X, ZERO)
+from utils.helpers import interpolate_position, load_image
 
 
 class Player:
@@ -17,7 +18,7 @@ class Player:
 
     Responsibilities:
         - Handle player movement (left, right, jump) within the game world
-        - Apply physics, like gravity and jump ceilings
+        - Apply physics, like gravity and jump ceilings, using the pure rules of core.physics
         - Update internal state based on movement and game rules
         - Draw itself on the screen at the correct position
         - Provide an interface for Mediator to control player actions
@@ -38,6 +39,7 @@ class Player:
         running_frame (int): The frame which is either 0 or 1 for running_images list.
         image: Currently active image surface.
         rect: Pygame rect object for collision detection and determining where the image will be drawn.
+        previous_pos (tuple[int, int]): Top left position after the previous simulation step.
     """
 
     def __init__(self, screen: Screen, mediator: Mediator | None):
@@ -90,6 +92,13 @@ class Player:
 
         # Set initial rectangle object over surface and place it from midbottom
         self.rect = self.image.get_rect(midbottom = (PLAYER_X, GROUND_LEVEL))
+        self.previous_pos = self.rect.topleft
+
+    def save_position(self) -> None:
+        """
+        Remember the current position as the previous simulation step's position.
+        """
+        self.previous_pos = self.rect.topleft
 
     def move_left(self) -> None:
         """
@@ -97,7 +106,7 @@ class Player:
         Move the player to the left.
         """
         self.is_left = True
-        self.rect.x -= FIVE
+        self.rect.x = walk(self.rect.x, self.is_left)
 
     def move_right(self) -> None:
         """
@@ -105,7 +114,7 @@ class Player:
         Move the player to the right.
         """
         self.is_left = False
-        self.rect.x += FIVE
+        self.rect.x = walk(self.rect.x, self.is_left)
 
     def jump(self) -> None:
         """
@@ -125,39 +134,20 @@ class Player:
         """
         Update player physics on every frame.
         """
-        # Jumping
-        if self.is_jumping:
-            self.velocity_y += self.gravity
-            self.rect.y += self.velocity_y
-
-            # Prevent piccolo from going over maximum height
-            if self.rect.y <= self.jump_ceiling_y:
-                self.rect.y = self.jump_ceiling_y
-                self.velocity_y = 0
-
-        # Descending
-        if self.rect.bottom >= GROUND_LEVEL:
-            self.rect.bottom = GROUND_LEVEL
-            self.is_jumping = False
-            self.velocity_y = 0
+        # Jumping and descending
+        self.rect.y, self.velocity_y, self.is_jumping = fall(
+            self.rect.y, self.rect.height, self.velocity_y, self.is_jumping,
+            self.gravity, self.jump_ceiling_y)
 
         # Running
-        if running:
-            # Update running frame
-            self.running_frame += 1
+        self.running_frame, running_image = run_animation(self.running_frame, running, len(self.running_images))
+        if running_image is not None:
             # If facing left
             if self.is_left:
-                # Slow down image change frequency by multiplying running image list length
-                if self.running_frame >= len(self.left_running_images) * RUN_ANIM_SPEED:
-                    # Reset running frame when all images have been cycled through
-                    self.running_frame = 0
-                # Avoid list index out of range by dividing the frame index
-                self.image = self.left_running_images[self.running_frame // RUN_ANIM_SPEED]
+                self.image = self.left_running_images[running_image]
             # If facing right
             else:
-                if self.running_frame >= len(self.running_images) * RUN_ANIM_SPEED:
-                    self.running_frame = 0
-                self.image = self.running_images[self.running_frame // RUN_ANIM_SPEED]
+                self.image = self.running_images[running_image]
 
         # Standing
         else:
@@ -174,8 +164,14 @@ class Player:
         # print(f"Position Y: {self.rect.y}, Velocity: {self.velocity_y}, Jumping: {self.is_jumping}, , Running: {running}")
         # print(f"Foot Y: {self.rect.bottom}")
 
-    def draw(self) -> None:
+    def draw(self, alpha: float = 1.0) -> pygame.Rect:
         """
         Draw the player to the screen.
+
+        Args:
+            alpha (float): Fraction of the way from the previous to the current simulation step.
+
+        Returns:
+            pygame.Rect: Screen area covered by the player.
         """
-        self.screen.screen.blit(self.image, self.rect)
+        return self.screen.screen.blit(self.image, interpolate_position(self.rect, self.previous_pos, alpha))
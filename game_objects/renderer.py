@@ -0,0 +1,109 @@
+"""
+Dirty-rectangle rendering for the game.
+"""
+import pygame
+
+
+class DirtyRectRenderer:
+    """
+    Renders only the parts of the screen that changed since the previous frame.
+
+    Responsibilities:
+        - Redraw the whole scene on the first frame and after every scene change
+        - Restore the scene background under each sprite's previous position
+          and under areas drawn outside of the renderer, like the profiler overlay
+        - Draw the sprites in the current scene and remember the rectangles they covered
+        - Push only the changed rectangles to the display
+
+    Attributes:
+        background: Background instance used to restore dirty regions.
+        sprites (list): Game objects whose draw() returns the blitted rect, a list of blitted rects or None.
+        mediator: Mediator instance for reading the current scene.
+        _last_scene (str | None): Scene that was rendered on the previous frame.
+        _last_rects (list): Rects covered by sprites and outside drawing on the previous frame.
+        _dirty_rects (list | None): Rects to update on present(), None means full update.
+    """
+
+    def __init__(self, background, sprites, mediator):
+        self.background = background
+        self.sprites = list(sprites)
+        self.mediator = mediator
+        self._last_scene = None
+        self._last_rects = []
+        self._dirty_rects = None
+
+    def invalidate(self) -> None:
+        """
+        Force a full redraw on the next frame.
+        """
+        self._last_scene = None
+
+    def draw(self, alpha: float = 1.0) -> None:
+        """
+        Draw the changed parts of the frame to the screen surface.
+
+        Args:
+            alpha (float): Fraction of the way from the previous to the current simulation step.
+        """
+        scene = self.mediator.current_scene
+
+        # Scene changed, so the whole background is different
+        if scene != self._last_scene:
+            self.background.draw()
+            self._last_rects = self._draw_sprites(alpha)
+            self._last_scene = scene
+            self._dirty_rects = None
+            return
+
+        # Erase sprites from their previous positions
+        for rect in self._last_rects:
+            self.background.restore(rect)
+
+        # Draw sprites at their new positions
+        rects = self._draw_sprites(alpha)
+        self._dirty_rects = self._last_rects + rects
+        self._last_rects = rects
+
+    def add_dirty(self, rect: pygame.Rect) -> None:
+        """
+        Add an area drawn outside of the renderer to this frame's display update.
+
+        The background is restored under the area on the next frame, so
+        drawing that shrinks or moves leaves nothing behind.
+
+        Args:
+            rect (pygame.Rect): Screen area to update.
+        """
+        self._last_rects.append(rect)
+        if self._dirty_rects is not None:
+            self._dirty_rects.append(rect)
+
+    def present(self) -> None:
+        """
+        Update the changed rectangles of the display.
+        """
+        if self._dirty_rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(self._dirty_rects)
+
+    def _draw_sprites(self, alpha: float) -> list:
+        """
+        Draw the sprites in the current scene and collect the rects they were drawn to.
+
+        Args:
+            alpha (float): Fraction of the way from the previous to the current simulation step.
+
+        Returns:
+            list: Rects covered by visible sprites.
+        """
+        rects = []
+        for sprite in self.sprites:
+            if not self.mediator.in_current_scene(sprite):
+                continue
+            rect = sprite.draw(alpha)
+            if isinstance(rect, list):
+                rects.extend(rect)
+            elif rect is not None:
+                rects.append(rect)
+        return rects
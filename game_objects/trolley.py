@@ -2,12 +2,14 @@
 Trolley item implementation for the Piccolo game.
 """
 import os
+import pygame
 from typing import Tuple
 from control.mediator import Mediator
+from core.physics import roll
 from game_objects.screen import Screen
-from utils.constants import (EDGE_MARGIN, ENTRANCE, FIVE, GRAPHICS_PATH,
-                             GROUND_LEVEL, SCREEN_WIDTH, TROLLEY_X, ZERO)
-from utils.helpers import load_image
+from utils.constants import (ENTRANCE, FIVE, GRAPHICS_PATH, GROUND_LEVEL,
+                             TROLLEY_X)
+from utils.helpers import interpolate_position, load_image
 
 
 class Trolley:
@@ -28,6 +30,7 @@ class Trolley:
         trolley_image: Surface for trolley.
         image: Currently active image surface.
         rect: Pygame rect object for collision detection and determining where the image will be drawn.
+        previous_pos (tuple[int, int]): Top left position after the previous simulation step.
     """
 
     def __init__(self, screen: Screen, mediator: Mediator | None):
@@ -48,6 +51,13 @@ class Trolley:
 
         # Set initial rectangle object over surface and place it from midbottom
         self.rect = self.image.get_rect(midbottom=(TROLLEY_X, GROUND_LEVEL))
+        self.previous_pos = self.rect.topleft
+
+    def save_position(self) -> None:
+        """
+        Remember the current position as the previous simulation step's position.
+        """
+        self.previous_pos = self.rect.topleft
 
     def update(self, player_pos: Tuple[int, int] | None) -> None:
         """
@@ -57,26 +67,22 @@ class Trolley:
         if player_pos is not None:
             self.rect.midbottom = player_pos
 
-        # Trolley is not taken
-        if not self.taken:
-            self.rect.x += int(self.speed)
-            self.speed *= 0.97
+        # Roll a released trolley and keep it away from screen edges
+        self.rect.x, self.speed = roll(self.rect.x, self.speed, self.taken)
 
-            if abs(self.speed) < 0.5:
-                self.speed = ZERO
+        # Keep the mediator's spatial hash in sync
+        if self.mediator:
+            self.mediator.track(self)
 
-        # Prevent losing trolley when released next to screen edges
-        # Left screen edge
-        if self.rect.x <= EDGE_MARGIN:
-            self.rect.x = EDGE_MARGIN
-        # Right screen edge
-        elif not self.taken and self.rect.x >= SCREEN_WIDTH - (EDGE_MARGIN * FIVE):
-            self.rect.x = SCREEN_WIDTH - (EDGE_MARGIN * FIVE)
-
-    def draw(self) -> None:
+    def draw(self, alpha: float = 1.0) -> pygame.Rect:
         """
         Draw the trolley to the screen.
+
+        Args:
+            alpha (float): Fraction of the way from the previous to the current simulation step.
+
+        Returns:
+            pygame.Rect: Screen area covered by the trolley.
         """
-        # Draw the trolley only if player has taken it or if it's in the current scene
-        if self.mediator and (self.taken or self.scene_name == self.mediator.current_scene):
-            self.screen.screen.blit(self.image, self.rect)
+        # Game and renderer draw the trolley only when the scene index has it in the current scene
+        return self.screen.screen.blit(self.image, interpolate_position(self.rect, self.previous_pos, alpha))
@@ -4,18 +4,32 @@ Main entry point for the Piccolo game.
 This module initializes and runs the game loop and delegates game logic
 to the Game class. The game continues running until the user closes the window.
 """
+import argparse
+import os
 import pygame
 import sys
 from control.game_factory import create_game
+from control.replay import CommandRecorder, ReplayInputHandler, load_recording
+from utils.constants import IDLE_WAIT_MS, PROFILER_CSV_PATH, SIMULATION_RATE
 from utils.logging_config import configure_logging
 
 configure_logging()
 
 # This function starts the game
-def run_game() -> None:
+def run_game(record: str | None = None, replay: str | None = None, headless: bool = False) -> None:
     """
     Main game loop.
+
+    Args:
+        record (str | None): File path to record the per-frame commands to.
+        replay (str | None): File path of a recording to play instead of keyboard input.
+        headless (bool): Whether to replay without a window as fast as possible.
     """
+    # Without a window the dummy video driver must be chosen before the display is initialized
+    if headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
     # Initialize all required Pygame modules before creating the game
     pygame.init()
     pygame.font.init()
@@ -24,17 +38,67 @@ def run_game() -> None:
     game = create_game()
     game_is_on = True
 
+    # Replace keyboard input with a recording, one recorded simulation step per game loop frame
+    if replay is not None:
+        framerate, frames = load_recording(replay)
+        game.input_handler = ReplayInputHandler(game.mediator, frames)
+        game.timestep = None
+        game.screen.framerate = 0 if headless else framerate
+
+    # Log the commands of every simulation step
+    if record is not None:
+        game.mediator.recorder = CommandRecorder(record, SIMULATION_RATE)
+
     # Game loop
     while game_is_on:
-        for event in pygame.event.get():
+        if game.idle and replay is None:
+            # Nothing moves, so sleep until an event arrives instead of redrawing the same frame
+            events = [pygame.event.wait(IDLE_WAIT_MS)] + pygame.event.get()
+        else:
+            events = pygame.event.get()
+
+        for event in events:
             if event.type == pygame.QUIT:
                 game_is_on = False
+            elif replay is None:
+                # Keyboard events keep the input handler's held keys up to date
+                game.input_handler.handle_event(event)
         game.run()
 
+        # Stop when the recording has been played
+        if replay is not None and game.input_handler.done:
+            game_is_on = False
+
+    if record is not None:
+        game.mediator.recorder.close()
+
+    # Save frame timings for later analysis
+    if game.profiler is not None:
+        game.profiler.dump_csv(PROFILER_CSV_PATH)
+
     # Quit and exit
+    game.close()
     pygame.quit()
     sys.exit()
 
+def parse_args(argv: list | None = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Args:
+        argv (list | None): Command line arguments, None reads sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Hotel Piccolo game.")
+    parser.add_argument("--record", metavar="FILE", help="record the input commands to a file")
+    parser.add_argument("--replay", metavar="FILE", help="play a recording instead of keyboard input")
+    parser.add_argument("--headless", action="store_true", help="replay without a window")
+    args = parser.parse_args(argv)
+    if args.record and args.replay:
+        parser.error("--record and --replay cannot be used together")
+    if args.headless and not args.replay:
+        parser.error("--headless requires --replay")
+    return args
+
 # This ensures that the game starts only when the file is ran directly
 if __name__ == "__main__":
-    run_game()
+    run_game(**vars(parse_args()))
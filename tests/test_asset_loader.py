@@ -0,0 +1,135 @@
+"""Unit tests for asset_loader.py"""
+import os
+import pygame
+from game_objects.bag import Bag
+from game_objects.items import Items
+from game_objects.loading_screen import LoadingScreen
+from game_objects.player import Player
+from game_objects.screen import Screen
+from game_objects.trolley import Trolley
+from utils.asset_loader import preload_images, startup_images
+from utils.asset_registry import registry
+from utils.constants import GRAPHICS_PATH, PIXEL_FORMAT_ALPHA, PIXEL_FORMAT_AUTO, PIXEL_FORMAT_OPAQUE
+from utils.helpers import load_image
+from utils.scene_graph import load_scene_graph
+
+
+class TestAssetLoader:
+    """Test preload_images and startup_images"""
+
+    def setup_method(self):
+        # Setup
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        registry.clear()
+
+    def teardown_method(self):
+        registry.clear()
+        pygame.quit()
+
+    def test_preload_stores_converted_images(self, tmp_path):
+        # Setup: create temporary images
+        paths = []
+        for name in ("a.png", "b.png"):
+            path = str(tmp_path / name)
+            pygame.image.save(pygame.Surface((5, 5)), path)
+            paths.append(path)
+        progress = []
+
+        # Action
+        stats = preload_images([(paths[0], PIXEL_FORMAT_ALPHA), (paths[1], PIXEL_FORMAT_OPAQUE),
+                                (paths[0], PIXEL_FORMAT_ALPHA)],
+                               progress=lambda done, total: progress.append((done, total)))
+
+        # Assert: duplicates are decoded once and both formats are stored
+        assert stats["images"] == 2
+        assert stats["decoded"] == 2
+        assert stats["failed"] == 0
+        assert progress == [(1, 2), (2, 2)]
+        assert load_image(paths[0], pixel_format=PIXEL_FORMAT_ALPHA).get_flags() & pygame.SRCALPHA
+        assert not load_image(paths[1], pixel_format=PIXEL_FORMAT_OPAQUE).get_flags() & pygame.SRCALPHA
+        assert registry.misses == 0
+
+    def test_preload_skips_stored_images(self, tmp_path):
+        # Setup
+        path = str(tmp_path / "a.png")
+        pygame.image.save(pygame.Surface((5, 5)), path)
+        load_image(path)
+
+        # Action
+        stats = preload_images([(path, PIXEL_FORMAT_AUTO)])
+
+        # Assert
+        assert stats["images"] == 0
+
+    def test_preload_counts_missing_file(self):
+        # Action
+        stats = preload_images([("non_existent_file.png", PIXEL_FORMAT_ALPHA)])
+
+        # Assert: failed images are left to load_image and its placeholder
+        assert stats["failed"] == 1
+        assert not registry.contains("non_existent_file.png", PIXEL_FORMAT_ALPHA)
+
+    def test_load_image_takes_over_unshared_preloaded_image(self, tmp_path):
+        # Setup
+        path = str(tmp_path / "a.png")
+        pygame.image.save(pygame.Surface((5, 5)), path)
+        preload_images([(path, PIXEL_FORMAT_AUTO)])
+
+        # Action
+        image = load_image(path, shared=False)
+
+        # Assert: the registry does not keep the unshared image
+        assert registry.hits == 1
+        assert not registry.contains(path, PIXEL_FORMAT_AUTO)
+        assert load_image(path) is not image
+
+    def test_startup_images_cover_game_objects(self):
+        # Setup
+        scene_graph = load_scene_graph()
+        stats = preload_images(startup_images(scene_graph))
+        misses = registry.misses
+
+        # Action
+        screen = Screen()
+        for game_object in (Player, Trolley, Bag, Items):
+            game_object(screen, None)
+
+        # Assert: every sprite image was decoded by the preload
+        assert stats["failed"] == 0
+        assert registry.misses == misses
+
+    def test_startup_images_include_start_scene(self):
+        # Setup
+        scene_graph = load_scene_graph()
+        layers = scene_graph.get(scene_graph.start)
+
+        # Action
+        paths = [path for path, _ in startup_images(scene_graph)]
+
+        # Assert
+        assert os.path.join(GRAPHICS_PATH, "hotel", layers.ground) in paths
+        assert os.path.join(GRAPHICS_PATH, "hotel", layers.sky) in paths
+
+
+class TestLoadingScreen:
+    """Test LoadingScreen class"""
+
+    def test_draw_fills_progress_bar(self):
+        pygame.init()
+        try:
+            # Setup
+            loading_screen = LoadingScreen(Screen())
+            surface = loading_screen.screen.screen
+            bar_left = surface.get_width() // 2 - 199
+            bar_y = surface.get_height() // 2
+
+            # Action
+            loading_screen.draw(1, 2)
+
+            # Assert: left half of the bar is filled, right half is not
+            assert surface.get_at((bar_left, bar_y))[:3] == (255, 255, 255)
+            assert surface.get_at((surface.get_width() // 2 + 100, bar_y))[:3] == (0, 0, 0)
+            assert loading_screen.frames == 1
+        finally:
+            pygame.quit()
@@ -0,0 +1,238 @@
+"""Unit tests for asset_pack.py"""
+import os
+import struct
+import pygame
+from unittest.mock import Mock
+import game_objects.audio_manager
+import utils.asset_pack
+import utils.helpers
+import utils.pixel_cache
+from game_objects.audio_manager import AudioManager
+from utils.asset_pack import (ASSET_PACK_MAGIC, AssetPack, asset_name,
+                              build_asset_pack, main)
+from utils.helpers import load_image
+from utils.pixel_cache import PixelCache, build_pixel_cache
+
+
+class TestAssetPack:
+    """Test AssetPack class and the pack build"""
+
+    def make_media(self, tmp_path):
+        # Setup: a media directory with an image, a compressible sound and an incompressible file
+        root = tmp_path / "media"
+        (root / "graphics").mkdir(parents=True)
+        (root / "audio").mkdir()
+        image = pygame.Surface((4, 3))
+        image.fill((10, 20, 30))
+        pygame.image.save(image, str(root / "graphics" / "ground.png"))
+        (root / "audio" / "quiet.wav").write_bytes(bytes(10000))
+        (root / "audio" / "noise.wav").write_bytes(os.urandom(1000))
+        (root / "notes.txt").write_text("not an asset")
+        return str(root), str(tmp_path / "assets.pack")
+
+    def test_asset_name(self, tmp_path):
+        # Assert
+        assert asset_name(os.path.join(str(tmp_path), "audio", "jump.wav"), str(tmp_path)) == "audio/jump.wav"
+        assert asset_name(os.path.join(str(tmp_path), os.pardir, "jump.wav"), str(tmp_path)) is None
+
+    def test_build_packs_assets_only(self, tmp_path):
+        # Setup
+        root, pack_path = self.make_media(tmp_path)
+
+        # Action
+        result = build_asset_pack(pack_path, root)
+
+        # Assert
+        pack = AssetPack(pack_path, root)
+        assert result["assets"] == 3
+        assert result["bytes"] < result["original_bytes"]
+        assert pack.names() == ["audio/noise.wav", "audio/quiet.wav", "graphics/ground.png"]
+        assert not os.path.exists(f"{pack_path}.tmp")
+
+    def test_read_returns_original_bytes(self, tmp_path):
+        # Setup
+        root, pack_path = self.make_media(tmp_path)
+        build_asset_pack(pack_path, root)
+        pack = AssetPack(pack_path, root)
+
+        # Action & Assert: compressed and stored entries read back unchanged
+        for name in pack.names():
+            with open(os.path.join(root, *name.split("/")), "rb") as file:
+                assert bytes(pack.read(name)) == file.read()
+        assert pack.stats()["reads"] == 3
+
+    def test_only_compressible_assets_are_compressed(self, tmp_path):
+        # Setup
+        root, pack_path = self.make_media(tmp_path)
+        build_asset_pack(pack_path, root)
+        pack = AssetPack(pack_path, root)
+
+        # Assert
+        assert pack._open()["audio/quiet.wav"]["compression"] == "zlib"
+        assert pack._open()["audio/noise.wav"]["compression"] == "none"
+
+    def test_open_falls_back_to_loose_file(self, tmp_path):
+        # Setup
+        root, pack_path = self.make_media(tmp_path)
+        pack = AssetPack(pack_path, root)
+        path = os.path.join(root, "graphics", "ground.png")
+
+        # Action & Assert: no pack yet, then the packed data
+        assert pack.open(path) == path
+        build_asset_pack(pack_path, root)
+        pack.close()
+        assert pack.open(path).read()[:8] == b"\x89PNG\r\n\x1a\n"
+
+    def test_read_unknown_asset_raises(self, tmp_path):
+        # Setup
+        root, pack_path = self.make_media(tmp_path)
+        build_asset_pack(pack_path, root)
+
+        # Action & Assert
+        try:
+            AssetPack(pack_path, root).read("graphics/missing.png")
+            assert False, "KeyError expected"
+        except KeyError:
+            pass
+
+    def test_other_version_is_ignored(self, tmp_path):
+        # Setup: overwrite the version in the header
+        root, pack_path = self.make_media(tmp_path)
+        build_asset_pack(pack_path, root)
+        with open(pack_path, "r+b") as file:
+            file.seek(len(ASSET_PACK_MAGIC))
+            file.write(struct.pack("<I", 999))
+
+        # Action & Assert
+        assert len(AssetPack(pack_path, root)) == 0
+
+    def test_verify_reports_changed_removed_and_missing_files(self, tmp_path):
+        # Setup
+        root, pack_path = self.make_media(tmp_path)
+        build_asset_pack(pack_path, root)
+        (tmp_path / "media" / "audio" / "quiet.wav").write_bytes(bytes(20))
+        os.remove(os.path.join(root, "audio", "noise.wav"))
+        (tmp_path / "media" / "audio" / "new.wav").write_bytes(bytes(20))
+
+        # Action
+        problems = AssetPack(pack_path, root).verify()
+
+        # Assert
+        assert problems == ["removed: audio/noise.wav", "changed: audio/quiet.wav", "missing: audio/new.wav"]
+
+    def test_verify_reports_corrupt_entries(self, tmp_path):
+        # Setup: overwrite bytes inside the last entry, the PNG
+        root, pack_path = self.make_media(tmp_path)
+        build_asset_pack(pack_path, root)
+        pack = AssetPack(pack_path, root)
+        entry = pack._open()["graphics/ground.png"]
+        pack.close()
+        with open(pack_path, "r+b") as file:
+            file.seek(-(entry["stored_size"] + (-entry["stored_size"] % 64)) + 20, os.SEEK_END)
+            file.write(b"\x00\x00\x00\x00")
+
+        # Action & Assert
+        assert pack.verify() == ["corrupt: graphics/ground.png"]
+
+    def test_main_builds_lists_and_verifies(self, tmp_path, capsys):
+        # Setup
+        root, pack_path = self.make_media(tmp_path)
+
+        # Action & Assert
+        assert main(["verify", "--pack", pack_path, "--root", root]) == 1
+        assert main(["build", "--pack", pack_path, "--root", root]) == 0
+        assert main(["verify", "--pack", pack_path, "--root", root]) == 0
+        assert main(["list", "--pack", pack_path, "--root", root]) == 0
+        output = capsys.readouterr().out
+        assert "Packed 3 assets" in output
+        assert "graphics/ground.png" in output
+
+    def test_load_image_reads_pack(self, tmp_path, monkeypatch):
+        # Setup: pack the image and remove its loose file
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        root, pack_path = self.make_media(tmp_path)
+        build_asset_pack(pack_path, root)
+        pack = AssetPack(pack_path, root)
+        monkeypatch.setattr(utils.helpers, "asset_pack", pack)
+        path = os.path.join(root, "graphics", "ground.png")
+        os.remove(path)
+
+        # Action
+        image = load_image(path, shared=False)
+
+        # Assert
+        assert image.get_size() == (4, 3)
+        assert pack.reads == 1
+
+    def test_pixel_cache_checks_packed_images_against_pack(self, tmp_path, monkeypatch):
+        # Setup: cache and pack the image, then remove its loose file
+        pygame.init()
+        root, pack_path = self.make_media(tmp_path)
+        graphics = os.path.join(root, "graphics")
+        build_pixel_cache(str(tmp_path / "graphics.cache"), graphics)
+        build_asset_pack(pack_path, root)
+        pack = AssetPack(pack_path, root)
+        monkeypatch.setattr(utils.pixel_cache, "asset_pack", pack)
+        cache = PixelCache(str(tmp_path / "graphics.cache"), graphics)
+        path = os.path.join(graphics, "ground.png")
+        os.remove(path)
+
+        # Action & Assert: the packed image is the source the cache entry is checked against
+        assert cache.load(path) is not None
+        assert cache.stale == 0
+
+        # Action & Assert: an edited loose file is the source again once the pack is opened again
+        pygame.image.save(pygame.Surface((2, 2)), path)
+        pack.close()
+        assert cache.load(path) is None
+        assert cache.stale == 1
+
+    def test_changed_loose_file_is_read_over_stale_entry(self, tmp_path, monkeypatch):
+        # Setup: pack the image, then edit its loose file
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        root, pack_path = self.make_media(tmp_path)
+        build_asset_pack(pack_path, root)
+        pack = AssetPack(pack_path, root)
+        monkeypatch.setattr(utils.helpers, "asset_pack", pack)
+        path = os.path.join(root, "graphics", "ground.png")
+        pygame.image.save(pygame.Surface((2, 2)), path)
+
+        # Action
+        image = load_image(path, shared=False)
+        stat = Mock(side_effect=os.stat)
+        monkeypatch.setattr(utils.asset_pack.os, "stat", stat)
+        names = [pack.name_of(path), pack.name_of(path), pack.name_of(os.path.join(root, "audio", "quiet.wav"))]
+
+        # Assert: loose files are stated once, when the pack is opened
+        assert image.get_size() == (2, 2)
+        assert pack.reads == 0
+        assert pack.stats()["stale"] == 1
+        assert names == [None, None, "audio/quiet.wav"]
+        assert stat.call_count == 0
+
+    def test_audio_manager_reads_pack(self, tmp_path, monkeypatch):
+        # Setup: pack a real sound effect and music file
+        root = tmp_path / "media"
+        (root / "audio").mkdir(parents=True)
+        sounds_path = game_objects.audio_manager.SOUNDS_PATH
+        for name in ("sound_jump.wav", "music_yard.wav"):
+            with open(os.path.join(sounds_path, name), "rb") as file:
+                (root / "audio" / name).write_bytes(file.read())
+        pack_path = str(tmp_path / "assets.pack")
+        build_asset_pack(pack_path, str(root))
+        pack = AssetPack(pack_path, str(root))
+        monkeypatch.setattr(game_objects.audio_manager, "asset_pack", pack)
+        monkeypatch.setattr(game_objects.audio_manager, "SOUNDS_PATH", str(root / "audio"))
+        audio_manager = AudioManager(preload=())
+
+        # Action
+        sound = audio_manager._get_sound("sound_jump.wav")
+        audio_manager.prefetch_music("music_yard.wav")
+        music = audio_manager._music_data["music_yard.wav"].result()
+
+        # Assert
+        assert sound.get_length() > 0
+        assert music == (root / "audio" / "music_yard.wav").read_bytes()
+        assert pack.reads == 2
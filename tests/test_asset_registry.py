@@ -0,0 +1,99 @@
+"""Unit tests for AssetRegistry class"""
+import os
+import pygame
+from utils.asset_registry import AssetRegistry, surface_bytes
+from utils.constants import PIXEL_FORMAT_ALPHA, PIXEL_FORMAT_OPAQUE
+
+
+class TestAssetRegistry:
+    """Test AssetRegistry class"""
+
+    def setup_method(self):
+        # Setup
+        self.registry = AssetRegistry()
+        self.surface = pygame.Surface((10, 20))
+
+    def test_get_counts_misses_and_hits(self):
+        # Action & Assert: miss before put
+        assert self.registry.get("bag.png", PIXEL_FORMAT_ALPHA) is None
+        assert self.registry.misses == 1
+
+        # Action & Assert: hit after put
+        self.registry.put("bag.png", PIXEL_FORMAT_ALPHA, self.surface)
+        assert self.registry.get("bag.png", PIXEL_FORMAT_ALPHA) is self.surface
+        assert self.registry.hits == 1
+
+    def test_key_normalizes_path(self):
+        # Setup
+        self.registry.put(os.path.join("items", "bag.png"), PIXEL_FORMAT_ALPHA, self.surface)
+
+        # Action
+        surface = self.registry.get(os.path.join("items", ".", "bag.png"), PIXEL_FORMAT_ALPHA)
+
+        # Assert
+        assert surface is self.surface
+
+    def test_pixel_format_is_part_of_key(self):
+        # Setup
+        self.registry.put("bag.png", PIXEL_FORMAT_ALPHA, self.surface)
+
+        # Action & Assert
+        assert self.registry.get("bag.png", PIXEL_FORMAT_OPAQUE) is None
+
+    def test_bytes_and_stats(self):
+        # Action: put and replace the same key
+        self.registry.put("bag.png", PIXEL_FORMAT_ALPHA, self.surface)
+        self.registry.put("bag.png", PIXEL_FORMAT_ALPHA, self.surface)
+
+        # Assert
+        assert self.registry.bytes == surface_bytes(self.surface)
+        assert self.registry.stats()["surfaces"] == 1
+
+        # Action & Assert: clear resets everything
+        self.registry.clear()
+        assert self.registry.stats() == {"surfaces": 0, "hits": 0, "misses": 0, "bytes": 0, "masks": 0}
+
+    def test_staged_surface_is_shared_on_first_get(self):
+        # Setup
+        self.registry.stage("bag.png", PIXEL_FORMAT_ALPHA, self.surface)
+
+        # Action
+        surface = self.registry.get("bag.png", PIXEL_FORMAT_ALPHA)
+
+        # Assert: the staged surface is stored and no longer handed over
+        assert surface is self.surface
+        assert self.registry.stats()["surfaces"] == 1
+        assert self.registry.take("bag.png", PIXEL_FORMAT_ALPHA) is None
+
+    def test_take_hands_over_staged_surface_only(self):
+        # Setup
+        shared = pygame.Surface((1, 1))
+        self.registry.put("shared.png", PIXEL_FORMAT_ALPHA, shared)
+        self.registry.stage("bag.png", PIXEL_FORMAT_ALPHA, self.surface)
+
+        # Action
+        surface = self.registry.take("bag.png", PIXEL_FORMAT_ALPHA)
+
+        # Assert: shared surfaces are never handed over
+        assert surface is self.surface
+        assert not self.registry.contains("bag.png", PIXEL_FORMAT_ALPHA)
+        assert self.registry.take("shared.png", PIXEL_FORMAT_ALPHA) is None
+        assert self.registry.contains("shared.png", PIXEL_FORMAT_ALPHA)
+
+    def test_mask_is_built_once_per_surface(self):
+        # Setup: surface with a transparent half
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+        surface.fill((255, 255, 255, 255), pygame.Rect(0, 0, 5, 10))
+
+        # Action
+        mask = self.registry.mask(surface)
+
+        # Assert
+        assert mask.count() == 50
+        assert self.registry.mask(surface) is mask
+        assert self.registry.mask(self.surface) is not mask
+        assert self.registry.stats()["masks"] == 2
+
+    def test_surface_bytes(self):
+        # Assert
+        assert surface_bytes(self.surface) == 10 * 20 * self.surface.get_bytesize()
@@ -10,45 +10,123 @@ class TestAudioManager:
     @patch("game_objects.audio_manager.pygame.mixer.music")
     def test_play_music_loads_and_plays(self, mock_music):
         # Setup
-        audio_manager = AudioManager()
+        mock_music.get_busy.return_value = False
+        audio_manager = AudioManager(fade_ms=100)
         assert audio_manager.currently_playing is None
 
-        # Action
+        # Action: request music and wait for the background read
         audio_manager.play_music("music_yard.wav", loops=2)
+        audio_manager._music_data["music_yard.wav"].result()
+        audio_manager.update()
 
         # Assert
+        mock_music.fadeout.assert_called_once_with(100)
         mock_music.load.assert_called_once()
-        mock_music.play.assert_called_once_with(2)
+        mock_music.play.assert_called_once_with(2, fade_ms=100)
         assert audio_manager.currently_playing is not None
         assert os.path.basename(audio_manager.currently_playing) == "music_yard.wav"
+        assert audio_manager._music_data == {}
 
         # Action: call again with same file
         mock_music.reset_mock()
         audio_manager.play_music("music_yard.wav")
+        audio_manager.update()
 
         # Assert: load and play not called again
         mock_music.load.assert_not_called()
         mock_music.play.assert_not_called()
 
     @patch("game_objects.audio_manager.pygame.mixer.music")
-    def test_stop_music(self, mock_music):
+    def test_play_music_waits_for_fade_out(self, mock_music):
+        # Setup: previous track is still fading out
+        mock_music.get_busy.return_value = True
+        audio_manager = AudioManager()
+        audio_manager.play_music("music_yard.wav")
+        audio_manager._music_data["music_yard.wav"].result()
+
+        # Action
+        audio_manager.update()
+
+        # Assert: new track not started yet
+        mock_music.load.assert_not_called()
+        assert audio_manager.is_changing_music
+
+        # Action: fade out finished
+        mock_music.get_busy.return_value = False
+        audio_manager.update()
+
+        # Assert
+        mock_music.load.assert_called_once()
+        mock_music.play.assert_called_once()
+        assert not audio_manager.is_changing_music
+
+    @patch("game_objects.audio_manager.pygame.mixer.music")
+    def test_prefetch_music_reads_file_once(self, mock_music):
         # Setup
         audio_manager = AudioManager()
+
+        # Action
+        audio_manager.prefetch_music("music_yard.wav")
+        future = audio_manager._music_data["music_yard.wav"]
+        audio_manager.prefetch_music("music_yard.wav")
+
+        # Assert: second prefetch reuses the first read, nothing is played
+        assert audio_manager._music_data["music_yard.wav"] is future
+        assert len(future.result()) > 0
+        mock_music.load.assert_not_called()
+
+    @patch("game_objects.audio_manager.pygame.mixer.music")
+    def test_prefetch_music_keeps_pending_and_next_track(self, mock_music):
+        # Setup: one track waiting for the fade out and one read ahead
+        mock_music.get_busy.return_value = True
+        audio_manager = AudioManager()
+        audio_manager.play_music("music_yard.wav")
+        audio_manager.prefetch_music("music_hall.wav")
+
+        # Action
+        audio_manager.prefetch_music("music_office.wav")
+
+        # Assert: the earlier read ahead is dropped, the pending track is kept
+        assert set(audio_manager._music_data) == {"music_yard.wav", "music_office.wav"}
+
+    @patch("game_objects.audio_manager.pygame.mixer.music")
+    def test_play_music_missing_file(self, mock_music):
+        # Setup: keep the music busy until the read has failed
+        mock_music.get_busy.return_value = True
+        audio_manager = AudioManager()
+        audio_manager.play_music("missing.wav")
+        audio_manager._music_data["missing.wav"].exception()
+
+        # Action
+        mock_music.get_busy.return_value = False
+        audio_manager.update()
+
+        # Assert: nothing played and the read can be retried
+        mock_music.load.assert_not_called()
+        assert audio_manager.currently_playing is None
+        assert "missing.wav" not in audio_manager._music_data
+
+    @patch("game_objects.audio_manager.pygame.mixer.music")
+    def test_stop_music(self, mock_music):
+        # Setup
+        audio_manager = AudioManager(fade_ms=100)
         audio_manager.currently_playing = "somefile.wav"
 
         # Action
         audio_manager.stop_music()
 
         # Assert
-        mock_music.stop.assert_called_once()
+        mock_music.fadeout.assert_called_once_with(100)
         assert audio_manager.currently_playing is None
 
+    @patch("game_objects.audio_manager.pygame.mixer.Channel")
     @patch("game_objects.audio_manager.pygame.mixer.Sound")
-    def test_play_sound_plays_with_volume(self, mock_sound_class):
+    def test_play_sound_plays_with_volume(self, mock_sound_class, mock_channel_class):
         # Setup
         mock_sound = MagicMock()
         mock_sound_class.return_value = mock_sound
-        audio_manager = AudioManager(sound_volume=0.5)
+        mock_channel_class.return_value.get_busy.return_value = False
+        audio_manager = AudioManager(sound_volume=0.5, preload=())
 
         # Action
         audio_manager.play_sound("click.wav")
@@ -56,4 +134,68 @@ class TestAudioManager:
         # Assert
         mock_sound_class.assert_called_once()
         mock_sound.set_volume.assert_called_once_with(0.5)
-        mock_sound.play.assert_called_once()
+        mock_channel_class.return_value.play.assert_called_once_with(mock_sound)
+
+    @patch("game_objects.audio_manager.pygame.mixer.Channel")
+    @patch("game_objects.audio_manager.pygame.mixer.Sound")
+    def test_play_sound_uses_preloaded_cache(self, mock_sound_class, mock_channel_class):
+        # Setup
+        mock_channel_class.return_value.get_busy.return_value = False
+        audio_manager = AudioManager(preload=("jump.wav",))
+
+        # Action
+        audio_manager.play_sound("jump.wav")
+        audio_manager.play_sound("jump.wav")
+
+        # Assert: decoded once at startup, then served from cache
+        mock_sound_class.assert_called_once()
+        assert audio_manager.stats() == {"loads": 1, "hits": 2, "dropped": 0, "steals": 0}
+
+    @patch("game_objects.audio_manager.pygame.mixer.Sound")
+    def test_sound_cache_is_bounded(self, mock_sound_class):
+        # Setup
+        audio_manager = AudioManager(cache_size=1, preload=())
+
+        # Action: second sound evicts first one
+        audio_manager._get_sound("a.wav")
+        audio_manager._get_sound("b.wav")
+        audio_manager._get_sound("a.wav")
+
+        # Assert
+        assert audio_manager.loads == 3
+        assert audio_manager.hits == 0
+
+    @patch("game_objects.audio_manager.pygame.mixer.Channel")
+    @patch("game_objects.audio_manager.pygame.mixer.Sound")
+    def test_busy_channels_steal_by_priority(self, mock_sound_class, mock_channel_class):
+        # Setup: two busy channels
+        channels = [MagicMock(), MagicMock()]
+        for channel in channels:
+            channel.get_busy.return_value = True
+        mock_channel_class.side_effect = channels
+        audio_manager = AudioManager(num_channels=2, preload=())
+        audio_manager._channel_priority = [2, 1]
+        audio_manager._channel_order = [1, 2]
+
+        # Action: lower priority than everything playing is dropped
+        audio_manager.play_sound("a.wav", priority=0)
+
+        # Assert
+        assert audio_manager.dropped == 1
+        channels[0].play.assert_not_called()
+        channels[1].play.assert_not_called()
+
+        # Action: higher priority steals the lowest priority channel
+        audio_manager.play_sound("a.wav", priority=2)
+
+        # Assert
+        assert audio_manager.steals == 1
+        channels[1].play.assert_called_once()
+        assert audio_manager._channel_priority == [2, 2]
+
+        # Action: equal priority steals the oldest channel
+        audio_manager.play_sound("a.wav", priority=2)
+
+        # Assert
+        assert audio_manager.steals == 2
+        channels[0].play.assert_called_once()
@@ -1,7 +1,15 @@
 """Unit tests for Background class"""
+import os
+import pygame
 from unittest.mock import Mock, patch
 from game_objects.background import Background
-from utils.constants import (GROUND_X, GROUND_Y, ENTRANCE, SKY_X, SKY_Y, YARD)
+from utils.constants import (DISPLAY_SIZE, ENTRANCE, RECEPTION, RIGHT, YARD)
+from utils.scene_graph import Scene, SceneGraph
+
+
+def fake_surface(*args, **kwargs):
+    """Return a small real surface in place of a loaded image."""
+    return pygame.Surface((10, 10))
 
 
 @patch("game_objects.background.load_image")
@@ -15,68 +23,155 @@ class TestBackground:
 
         self.screen.screen = self.mock_screen
 
-    def test_background_initialization(self, _):
+    def test_background_initialization(self, mock_load):
         """
         Test that Background initializes correctly with mocked load_image.
 
         Args:
-            _: @patch gives mock as parameter for test-function (not used here)
+            mock_load: patched load_image mock
         """
+        mock_load.side_effect = fake_surface
         background = Background(self.screen)
 
         # Assert: attributes should be set correctly
         assert background.screen == self.screen
-        assert background.ground_surf is not None
-        assert background.sky_surf is not None
+        assert background.scene == ENTRANCE
+        assert background.scene_surf.get_size() == DISPLAY_SIZE
 
-    def test_background_draw(self, _):
+    def test_background_draw(self, mock_load):
         """
-        Test that draw() calls blit for ground and sky surfaces.
+        Test that draw() blits the composited scene surface once.
 
         Args:
-            _: @patch gives mock as parameter for test-function (not used here)
+            mock_load: patched load_image mock
         """
+        mock_load.side_effect = fake_surface
         background = Background(self.screen)
 
         # Action
         background.draw()
 
-        # Assert: blit called twice (ground + sky)
-        assert self.mock_screen.blit.call_count == 2
+        # Assert: single blit of the composited surface
+        self.mock_screen.blit.assert_called_once_with(background.scene_surf, (0, 0))
+
+    def test_background_restore(self, mock_load):
+        """
+        Test that restore() blits only the given area of the composited scene surface.
+
+        Args:
+            mock_load: patched load_image mock
+        """
+        mock_load.side_effect = fake_surface
+        background = Background(self.screen)
+        rect = pygame.Rect(100, 300, 20, 40)
 
-        # Assert: blit called with correct coordinates
-        self.mock_screen.blit.assert_any_call(background.ground_surf, (GROUND_X, GROUND_Y))
-        self.mock_screen.blit.assert_any_call(background.sky_surf, (SKY_X, SKY_Y))
+        # Action
+        background.restore(rect)
+
+        # Assert
+        self.mock_screen.blit.assert_called_once_with(background.scene_surf, rect, rect)
+
+    def test_scene_surf_is_cached(self, mock_load):
+        """
+        Test that each scene is composited only once and cache size is reported.
+
+        Args:
+            mock_load: patched load_image mock
+        """
+        mock_load.side_effect = fake_surface
+        background = Background(self.screen)
+        entrance_surf = background.scene_surf
+        single_size = background.cache_size_bytes()
+
+        # Action: go to yard and back
+        background.change_background(YARD)
+        yard_surf = background.scene_surf
+        background.change_background(ENTRANCE)
+
+        # Assert: cached surface reused and cache holds two scenes
+        assert background.scene_surf is entrance_surf
+        assert yard_surf is not entrance_surf
+        assert single_size > 0
+        assert background.cache_size_bytes() == 2 * single_size
 
     def test_change_background(self, mock_load):
         """
-        Test that change_background correctly swaps ground and sky surfaces.
+        Test that change_background loads scene images lazily and swaps the scene surface.
 
         Args:
             mock_load: patched load_image mock
         """
-        # Setup: simple mock objects for surfaces
-        outdoor_ground = object()
-        entrance_sky = object()
-        indoor_ground = object()
-        reception_sky = object()
-        yard_sky = object()
-        mock_load.side_effect = [
-            outdoor_ground,
-            entrance_sky,
-            indoor_ground,
-            reception_sky,
-            yard_sky,
-        ]
+        mock_load.side_effect = fake_surface
+        background = Background(self.screen)
+
+        # Assert: only the entrance ground and sky were loaded at startup
+        assert mock_load.call_count == 2
 
+        # Action & assert: change to YARD scene loads its images
+        background.change_background(YARD)
+        assert background.scene == YARD
+        assert mock_load.call_count == 4
+
+        # Action & assert: change back to ENTRANCE scene uses the cache
+        background.change_background(ENTRANCE)
+        assert background.scene == ENTRANCE
+        assert mock_load.call_count == 4
+
+    def test_change_background_unknown_scene_is_ignored(self, mock_load):
+        """
+        Test that change_background keeps the current scene for unknown scene names.
+
+        Args:
+            mock_load: patched load_image mock
+        """
+        mock_load.side_effect = fake_surface
         background = Background(self.screen)
 
-        # Action & assert: change to YARD scene
+        # Action
+        background.change_background("unknown")
+
+        # Assert
+        assert background.scene == ENTRANCE
+
+    def test_scene_cache_evicts_least_recently_used(self, mock_load):
+        """
+        Test that the scene cache stays within its byte budget.
+
+        Args:
+            mock_load: patched load_image mock
+        """
+        mock_load.side_effect = fake_surface
+        scene_size = DISPLAY_SIZE[0] * DISPLAY_SIZE[1] * pygame.Surface(DISPLAY_SIZE).get_bytesize()
+        background = Background(self.screen, cache_budget=2 * scene_size)
+
+        # Action: visit three scenes with room for two
         background.change_background(YARD)
-        assert background.ground_surf == outdoor_ground
-        assert background.sky_surf == yard_sky
+        background.change_background(RECEPTION)
 
-        # Action & assert: change back to ENTRANCE scene
+        # Assert: entrance was evicted and is loaded again on return
+        assert background.cache_size_bytes() == 2 * scene_size
+        loads = mock_load.call_count
         background.change_background(ENTRANCE)
-        assert background.ground_surf == outdoor_ground
-        assert background.sky_surf == entrance_sky
+        assert mock_load.call_count == loads + 2
+
+    def test_scene_images_come_from_scene_graph(self, mock_load):
+        """
+        Test that scene images are resolved from the scene graph.
+
+        Args:
+            mock_load: patched load_image mock
+        """
+        mock_load.side_effect = fake_surface
+        graph = SceneGraph({
+            "corridor": Scene("corridor", "carpet.png", "corridor.png", None, {RIGHT: "sauna"}),
+            "sauna": Scene("sauna", "tiles.png", "sauna.png", None, {}),
+        }, "corridor")
+
+        # Action
+        background = Background(self.screen, graph)
+        background.change_background("sauna")
+
+        # Assert
+        assert background.scene == "sauna"
+        loaded = [call.args[0].split(os.sep)[-1] for call in mock_load.call_args_list]
+        assert loaded == ["carpet.png", "corridor.png", "tiles.png", "sauna.png"]
@@ -0,0 +1,187 @@
+"""Unit tests for benchmark.py"""
+import json
+import pygame
+import pytest
+from unittest.mock import Mock
+import benchmark
+from benchmark import (ScriptedInputHandler, compare_to_baseline, in_scene,
+                       percentile, run_benchmark)
+from utils.commands import Command
+from utils.constants import ENTRANCE, YARD
+
+
+class TestScriptedInputHandler:
+    """Test ScriptedInputHandler class"""
+
+    def setup_method(self):
+        # Setup
+        self.game = Mock()
+        self.game.mediator.current_scene = ENTRANCE
+
+    def test_frame_count_step(self):
+        # Setup
+        script = ScriptedInputHandler(self.game, [((Command.MOVE_RIGHT,), 2)])
+
+        # Action
+        script.process_input()
+        script.process_input()
+
+        # Assert
+        assert self.game.mediator.queue_command.call_count == 2
+        self.game.mediator.queue_command.assert_called_with(Command.MOVE_RIGHT)
+        assert script.done
+
+    def test_condition_step_and_stop_moving(self):
+        # Setup
+        script = ScriptedInputHandler(self.game, [((), in_scene(YARD))])
+
+        # Action: condition not met yet
+        script.process_input()
+
+        # Assert
+        self.game.mediator.queue_command.assert_called_once_with(Command.STOP_MOVING)
+        assert not script.done
+
+        # Action: condition met
+        self.game.mediator.current_scene = YARD
+        script.process_input()
+
+        # Assert
+        assert script.done
+
+    def test_step_commands_from_function(self):
+        # Setup
+        script = ScriptedInputHandler(self.game, [(lambda game: (Command.MOVE_LEFT,), 1)])
+
+        # Action
+        script.process_input()
+
+        # Assert
+        self.game.mediator.queue_command.assert_called_once_with(Command.MOVE_LEFT)
+
+    def test_stuck_step_raises(self, monkeypatch):
+        # Setup
+        monkeypatch.setattr(benchmark, "MAX_STEP_FRAMES", 3)
+        script = ScriptedInputHandler(self.game, [((), in_scene(YARD))])
+
+        # Action & Assert
+        script.process_input()
+        script.process_input()
+        with pytest.raises(RuntimeError):
+            script.process_input()
+
+
+class TestBenchmark:
+    """Test benchmark runs and reports"""
+
+    def test_percentile(self):
+        # Assert
+        assert percentile([1, 2, 3, 4, 5], 0.5) == 3
+        assert percentile([1, 2, 3, 4, 5], 1.0) == 5
+
+    @pytest.mark.parametrize("scenario", ["tour", "trolley"])
+    def test_run_benchmark_reports_results(self, scenario, monkeypatch):
+        # Setup: record on every step whether the trolley is taken
+        taken = []
+        original = benchmark.create_game
+
+        def create_recording_game(**kwargs):
+            game = original(**kwargs)
+            step = game.step
+
+            def record(commands=None):
+                dispatched = step(commands)
+                taken.append(game.trolley.taken)
+                return dispatched
+            game.step = record
+            return game
+        monkeypatch.setattr(benchmark, "create_game", create_recording_game)
+
+        # Action: the default warmup lets the trolley roll to the other side of the player
+        result = run_benchmark(scenario)
+
+        # Assert
+        assert any(taken)
+        assert result["scenario"] == scenario
+        assert result["frames"] > 0
+        assert result["fps"] > 0
+        assert set(result["frame_ms"]) == {"p50", "p95", "p99", "max"}
+        assert result["frame_ms"]["p50"] <= result["frame_ms"]["max"]
+        assert result["time_to_first_frame_ms"] > 0
+        assert result["preload"]["failed"] == 0
+
+    def test_paced_run_waits_between_frames(self, monkeypatch):
+        # Setup: a high framerate keeps the paced run short
+        monkeypatch.setattr(benchmark, "FRAMERATE", 1000)
+        ticks = []
+        clock = pygame.time.Clock
+
+        class RecordingClock:
+            def __init__(self):
+                self.clock = clock()
+
+            def tick(self, framerate):
+                ticks.append(framerate)
+                return self.clock.tick(framerate)
+        monkeypatch.setattr(benchmark.pygame.time, "Clock", RecordingClock)
+
+        # Action
+        result = run_benchmark("idle", warmup=0, paced=True)
+
+        # Assert: one pacing tick per measured frame
+        assert result["paced"]
+        assert ticks.count(1000) == result["frames"]
+
+    def test_tour_visits_every_scene(self, monkeypatch):
+        # Setup: record every scene change and the scenes entered pushing the trolley
+        visited = set()
+        pushed = set()
+        original = benchmark.create_game
+
+        def create_recording_game(**kwargs):
+            game = original(**kwargs)
+            change_background = game.background.change_background
+
+            def record(scene):
+                visited.add(scene)
+                if game.trolley.taken:
+                    pushed.add(scene)
+                change_background(scene)
+            game.background.change_background = record
+            return game
+        monkeypatch.setattr(benchmark, "create_game", create_recording_game)
+
+        # Action
+        run_benchmark("tour")
+
+        # Assert: all eight scenes are entered, each pushing the trolley
+        assert len(visited) == 8
+        assert pushed == visited
+
+    def test_compare_to_baseline(self):
+        # Setup
+        result = {"fps": 90.0, "frame_ms": {"p50": 11.0}}
+        baseline = {"fps": 100.0, "frame_ms": {"p50": 10.0}}
+
+        # Action
+        comparison = compare_to_baseline(result, baseline)
+
+        # Assert
+        assert round(comparison["fps"], 6) == -0.1
+        assert round(comparison["frame_ms_p50"], 6) == 0.1
+
+    def test_main_writes_json_and_fails_on_regression(self, tmp_path, monkeypatch, capsys):
+        # Setup: fake run and a faster baseline
+        monkeypatch.setattr(benchmark, "run_benchmark", lambda *args: {"fps": 50.0, "frame_ms": {"p50": 20.0}})
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"fps": 100.0, "frame_ms": {"p50": 10.0}}))
+        output = tmp_path / "result.json"
+
+        # Action
+        exit_code = benchmark.main(["--output", str(output), "--baseline", str(baseline),
+                                    "--max-regression", "0.1"])
+
+        # Assert
+        assert exit_code == 1
+        assert json.loads(output.read_text())["baseline"]["fps"] == -0.5
+        assert "fps" in capsys.readouterr().out
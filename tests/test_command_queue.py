@@ -0,0 +1,73 @@
+"""Unit tests for CommandQueue class"""
+from control.command_queue import CommandQueue
+from utils.commands import Command
+
+
+class TestCommandQueue:
+    """Test CommandQueue class"""
+
+    def setup_method(self):
+        # Setup
+        self.queue = CommandQueue()
+
+    def test_drain_keeps_push_order_and_empties_queue(self):
+        # Setup
+        self.queue.push(Command.MOVE_LEFT)
+        self.queue.push(Command.JUMP)
+        self.queue.push(Command.TAKE_TROLLEY)
+
+        # Action
+        commands = self.queue.drain()
+
+        # Assert
+        assert commands == [Command.MOVE_LEFT, Command.JUMP, Command.TAKE_TROLLEY]
+        assert self.queue.depth == 0
+        assert self.queue.drain() == []
+
+    def test_duplicates_are_merged(self):
+        # Setup
+        self.queue.push(Command.JUMP)
+        self.queue.push(Command.MOVE_RIGHT)
+        self.queue.push(Command.JUMP)
+        self.queue.push(Command.MOVE_RIGHT)
+
+        # Action & Assert
+        assert self.queue.drain() == [Command.JUMP, Command.MOVE_RIGHT]
+        assert self.queue.coalesced == 2
+
+    def test_stop_moving_cancelled_by_movement(self):
+        # Setup
+        self.queue.push(Command.STOP_MOVING)
+        self.queue.push(Command.MOVE_LEFT)
+
+        # Action & Assert
+        assert self.queue.drain() == [Command.MOVE_LEFT]
+
+        # Setup & Action & Assert: stop without movement is kept
+        self.queue.push(Command.STOP_MOVING)
+        assert self.queue.drain() == [Command.STOP_MOVING]
+
+    def test_last_movement_wins(self):
+        # Setup
+        self.queue.push(Command.MOVE_LEFT)
+        self.queue.push(Command.JUMP)
+        self.queue.push(Command.MOVE_RIGHT)
+
+        # Action & Assert
+        assert self.queue.drain() == [Command.JUMP, Command.MOVE_RIGHT]
+
+    def test_counters(self):
+        # Setup
+        for command in (Command.JUMP, Command.JUMP, Command.MOVE_LEFT):
+            self.queue.push(command)
+        assert self.queue.depth == 3
+        assert len(self.queue) == 3
+        self.queue.drain()
+        self.queue.push(Command.JUMP)
+
+        # Assert
+        assert self.queue.pushed == 4
+        assert self.queue.coalesced == 1
+        assert self.queue.drained == 2
+        assert self.queue.max_depth == 3
+        assert self.queue.depth == 1
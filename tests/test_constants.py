@@ -1,14 +1,34 @@
 """Unit tests for constants.py"""
 from utils.commands import Command
-from utils.constants import (BAG_X, CAPTION, CENTER,
+from utils.constants import (FONT_PATH, PROFILER_CSV_PATH, PROFILER_ENABLED,
+                             PROFILER_FONT_SIZE, PROFILER_FRAMES,
+                             PROFILER_OVERLAY_INTERVAL)
+from utils.constants import DOWN, LEFT, RIGHT, SCENES_PATH, UP
+from utils.constants import EVENT_DRIVEN_INPUT, INPUT_LATENCY_SAMPLES
+from utils.constants import FIXED_TIMESTEP, MAX_STEPS_PER_FRAME, SIMULATION_RATE
+from utils.constants import IDLE_WAIT_MS
+from utils.constants import DOOR_LEFT, DOOR_RIGHT, TROLLEY_FRICTION, TROLLEY_MIN_SPEED
+from utils.constants import ENTITY_CAPACITY, ITEM_SPRITES
+from utils.constants import INTERACTION_REACH, SPATIAL_CELL_SIZE
+from utils.constants import ASSET_LOADER_WORKERS, PRELOAD_ASSETS
+from utils.constants import (ASSET_PACK_ALIGNMENT, ASSET_PACK_EXTENSIONS, ASSET_PACK_MIN_SAVING,
+                             ASSET_PACK_PATH, MEDIA_PATH)
+from utils.constants import PIXEL_CACHE_ALIGNMENT, PIXEL_CACHE_LAYOUT, PIXEL_CACHE_PATH
+from utils.constants import LOADING_BAR_COLOR, LOADING_BAR_SIZE, LOADING_FONT_SIZE
+from utils.constants import (BAG_X, CAPTION, CENTER, DIRTY_RECT_RENDERING,
                              DEFAULT_FONT_SIZE, DEFAULT_SURFACE_COLOR,
                              DEFAULT_SURFACE_SIZE, DEFAULT_TEXT_SURFACE_SIZE,
                              EDGE_MARGIN, ENTRANCE, DISPLAY_SIZE, FIVE,
                              FRAMERATE, GRAPHICS_PATH, GRAVITY, GROUND_LEVEL,
                              GROUND_X, GROUND_Y, JUMP_HEIGHT, JUMP_CEILING_Y,
-                             MUSIC_YARD, PLAYER_X, PUSH_SPEED, RECEPTION,
-                             RUN_ANIM_SPEED, SCREEN_HEIGHT, SCREEN_LEFT,
-                             SCREEN_WIDTH, SOUND_JUMP, SOUNDS_PATH,
+                             MUSIC_FADE_MS, MUSIC_YARD,
+                             PIXEL_FORMAT_ALPHA, PIXEL_FORMAT_AUTO, PIXEL_FORMAT_COLORKEY,
+                             PIXEL_FORMAT_COLORKEYS, PIXEL_FORMAT_OPAQUE, PIXEL_FORMAT_RLE_MIN_TRANSPARENT,
+                             PLAYER_RUN_IMAGES, PLAYER_X, PREFETCH_MARGIN,
+                             PRELOADED_SOUNDS, PUSH_SPEED, RECEPTION,
+                             RUN_ANIM_SPEED, SCENE_CACHE_BUDGET, SCREEN_HEIGHT,
+                             SCREEN_LEFT, SCREEN_WIDTH, SOUND_CACHE_SIZE,
+                             SOUND_CHANNELS, SOUND_JUMP, SOUNDS_PATH,
                              SOUND_VOLUME, SKY_X, SKY_Y, TEN, TROLLEY_X, WHITE,
                              YARD, ZERO)
 import os
@@ -39,8 +59,24 @@ class TestConstants:
         assert GROUND_Y == 320
         assert SKY_X == 0
         assert SKY_Y == -110
+        assert SCENE_CACHE_BUDGET == 8 * 1024 * 1024
+
+    def test_asset_pack_constants(self):
+        assert MEDIA_PATH == os.path.dirname(GRAPHICS_PATH)
+        assert ASSET_PACK_ALIGNMENT == 64
+        assert ASSET_PACK_EXTENSIONS == (".png", ".wav", ".ogg")
+        assert ASSET_PACK_MIN_SAVING == 0.1
+        assert ASSET_PACK_PATH == os.path.join(MEDIA_PATH, "assets.pack")
 
     def test_configuration_constants(self):
+        assert ASSET_LOADER_WORKERS == 4
+        assert DIRTY_RECT_RENDERING is False
+        assert EVENT_DRIVEN_INPUT is True
+        assert FIXED_TIMESTEP is True
+        assert IDLE_WAIT_MS == 1000
+        assert INPUT_LATENCY_SAMPLES == 600
+        assert PRELOAD_ASSETS is True
+        assert PROFILER_ENABLED is False
         assert RUN_ANIM_SPEED == 10
         assert SOUND_VOLUME == 0.3
         assert WHITE == (255, 255, 255)
@@ -51,6 +87,29 @@ class TestConstants:
         assert DEFAULT_SURFACE_SIZE == (100, 100)
         assert DEFAULT_TEXT_SURFACE_SIZE == (10, 10)
 
+    def test_pixel_format_constants(self):
+        assert PIXEL_FORMAT_ALPHA == "alpha"
+        assert PIXEL_FORMAT_AUTO == "auto"
+        assert PIXEL_FORMAT_COLORKEY == "colorkey"
+        assert PIXEL_FORMAT_COLORKEYS[0] == (255, 0, 255)
+        assert PIXEL_FORMAT_OPAQUE == "opaque"
+        assert PIXEL_FORMAT_RLE_MIN_TRANSPARENT == 0.5
+        assert PIXEL_CACHE_ALIGNMENT == 64
+        assert PIXEL_CACHE_LAYOUT == "BGRA"
+        assert PIXEL_CACHE_PATH.endswith(os.path.join("media", "graphics.cache"))
+
+    def test_loading_screen_constants(self):
+        assert LOADING_BAR_COLOR == (255, 255, 255)
+        assert LOADING_BAR_SIZE == (400, 16)
+        assert LOADING_FONT_SIZE == 48
+
+    def test_profiler_constants(self):
+        assert FONT_PATH == os.path.join(GRAPHICS_PATH, "font", "Pixeltype.ttf")
+        assert PROFILER_CSV_PATH == "frame_profile.csv"
+        assert PROFILER_FONT_SIZE == 24
+        assert PROFILER_FRAMES == 600
+        assert PROFILER_OVERLAY_INTERVAL == 30
+
     def test_display_constants(self):
         assert SCREEN_HEIGHT == 400
         assert SCREEN_WIDTH == 800
@@ -58,11 +117,17 @@ class TestConstants:
         assert DISPLAY_SIZE == (800, 400)
         assert EDGE_MARGIN == 10
         assert FRAMERATE == 60
+        assert MAX_STEPS_PER_FRAME == 5
+        assert SIMULATION_RATE == FRAMERATE
         assert SCREEN_LEFT == 0
 
     def test_sound_constants(self):
+        assert MUSIC_FADE_MS == 500
         assert MUSIC_YARD == "music_yard.wav"
         assert SOUND_JUMP == "sound_jump.wav"
+        assert SOUND_CACHE_SIZE == 16
+        assert SOUND_CHANNELS == 8
+        assert PRELOADED_SOUNDS == (SOUND_JUMP,)
         assert SOUNDS_PATH == os.path.join(
                     os.path.dirname(
                         os.path.dirname(
@@ -76,6 +141,11 @@ class TestConstants:
         assert ENTRANCE == "entrance"
         assert RECEPTION == "reception"
         assert YARD == "yard"
+        assert (DOWN, LEFT, RIGHT, UP) == ("down", "left", "right", "up")
+        assert (DOOR_LEFT, DOOR_RIGHT) == (230, 460)
+        assert PREFETCH_MARGIN == 100
+        assert SCENES_PATH == os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "media", "scenes.json")
 
     def test_player_constants(self):
         assert CENTER == 400
@@ -83,10 +153,19 @@ class TestConstants:
         assert JUMP_HEIGHT == -10
         assert JUMP_CEILING_Y == 200
         assert PLAYER_X == 100
+        assert PLAYER_RUN_IMAGES == 2
 
     def test_trolley_constants(self):
         assert TROLLEY_X == 50
         assert PUSH_SPEED == 5
+        assert TROLLEY_FRICTION == 0.97
+        assert TROLLEY_MIN_SPEED == 0.5
 
     def test_bag_constants(self):
         assert BAG_X == 700
+
+    def test_item_constants(self):
+        assert ENTITY_CAPACITY == 1024
+        assert ITEM_SPRITES == ("bag", "bill", "carkeys", "coin", "pillow", "trash1", "trash2")
+        assert INTERACTION_REACH == 10
+        assert SPATIAL_CELL_SIZE == 64
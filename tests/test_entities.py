@@ -0,0 +1,114 @@
+"""Unit tests for EntityStore class"""
+import numpy as np
+import pytest
+from core.entities import EntityStore
+from utils.constants import EDGE_MARGIN, GROUND_LEVEL, SCREEN_WIDTH
+
+
+class TestEntityStore:
+    """Test EntityStore class"""
+
+    def setup_method(self):
+        # Setup
+        self.store = EntityStore(capacity=2)
+
+    def test_add_and_filter_by_scene(self):
+        # Action
+        first = self.store.add(100, 300, (20, 20), scene=1, sprite=3)
+        second = self.store.add(200, 300, (20, 20), scene=2, sprite=0)
+        third = self.store.add(300, 300, (20, 20), scene=1, sprite=5)
+
+        # Assert: arrays grew past the initial capacity
+        assert self.store.count == 3
+        assert self.store.capacity == 4
+        assert self.store.in_scene(1).tolist() == [first, third]
+        assert self.store.in_scene(2).tolist() == [second]
+        assert self.store.in_scene(7).tolist() == []
+        assert self.store.sprite[third] == 5
+
+    def test_remove_reuses_id(self):
+        # Setup
+        first = self.store.add(100, 300, (20, 20), scene=1, sprite=0)
+        self.store.add(200, 300, (20, 20), scene=1, sprite=0)
+
+        # Action
+        self.store.remove(first)
+
+        # Assert
+        assert self.store.count == 1
+        assert first not in self.store.in_scene(1)
+        assert self.store.add(50, 300, (20, 20), scene=2, sprite=0) == first
+        with pytest.raises(KeyError):
+            self.store.remove(99)
+
+    def test_update_rolls_slows_and_stops(self):
+        # Setup
+        moving = self.store.add(100, GROUND_LEVEL - 20, (20, 20), scene=0, sprite=0, velocity=(5.0, 0.0))
+        resting = self.store.add(300, GROUND_LEVEL - 20, (20, 20), scene=0, sprite=0)
+
+        # Action
+        self.store.update()
+
+        # Assert
+        assert self.store.x[moving] == 105
+        assert self.store.velocity_x[moving] == pytest.approx(5 * 0.97)
+        assert self.store.x[resting] == 300
+        assert not self.store.is_static()
+
+        # Action: roll until stopped
+        for _ in range(100):
+            self.store.save_positions()
+            self.store.update()
+
+        # Assert
+        self.store.save_positions()
+        assert self.store.velocity_x[moving] == 0
+        assert self.store.is_static()
+
+    def test_update_keeps_entities_on_screen(self):
+        # Setup
+        left = self.store.add(EDGE_MARGIN + 2, 100, (20, 20), scene=0, sprite=0, velocity=(-5.0, 0.0))
+        right = self.store.add(SCREEN_WIDTH - 40, 100, (20, 20), scene=0, sprite=0, velocity=(30.0, 0.0))
+        falling = self.store.add(300, GROUND_LEVEL - 22, (20, 20), scene=0, sprite=0, velocity=(0.0, 9.0))
+
+        # Action
+        self.store.update()
+
+        # Assert
+        assert self.store.x[left] == EDGE_MARGIN
+        assert self.store.x[right] == SCREEN_WIDTH - EDGE_MARGIN - 20
+        assert self.store.y[falling] == GROUND_LEVEL - 20
+
+    def test_arrays_are_contiguous(self):
+        # Action
+        for index in range(100):
+            self.store.add(index, 0, (10, 10), scene=index % 8, sprite=index % 7)
+
+        # Assert
+        assert self.store.x.flags["C_CONTIGUOUS"]
+        assert self.store.x.dtype == np.float32
+        assert len(self.store.in_scene(3)) == 13
+
+    def test_move_and_update_one_scene(self):
+        # Setup: a rolling entity in two scenes
+        here = self.store.add(100, 300, (20, 20), scene=1, sprite=0, velocity=(5.0, 0.0))
+        there = self.store.add(100, 300, (20, 20), scene=2, sprite=0, velocity=(5.0, 0.0))
+
+        # Action
+        self.store.update(scene=1)
+
+        # Assert: only the given scene moved
+        assert self.store.x[here] == 105
+        assert self.store.x[there] == 100
+        assert not self.store.is_static(scene=1)
+        self.store.save_positions(scene=1)
+
+        # Action: move the rolling entity away
+        self.store.move(here, 2)
+
+        # Assert
+        assert self.store.in_scene(1).tolist() == []
+        assert self.store.in_scene(2).tolist() == [here, there]
+        assert self.store.is_static(scene=1)
+        with pytest.raises(KeyError):
+            self.store.move(99, 1)
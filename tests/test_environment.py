@@ -0,0 +1,110 @@
+"""Unit tests for the headless environment API"""
+import numpy as np
+import pytest
+from unittest.mock import patch
+from control.environment import OBSERVATION_FIELDS, PiccoloEnv, VectorEnv
+from utils.commands import Command
+from utils.constants import JUMP_CEILING_Y, YARD
+
+
+class TestPiccoloEnv:
+    """Test PiccoloEnv class"""
+
+    def setup_method(self):
+        # Setup
+        self.env = PiccoloEnv()
+        self.x = OBSERVATION_FIELDS.index("player_x")
+        self.y = OBSERVATION_FIELDS.index("player_y")
+        self.scene = OBSERVATION_FIELDS.index("scene")
+
+    def teardown_method(self):
+        self.env.close()
+
+    def test_reset_and_step_return_observations(self):
+        # Action
+        start = self.env.reset()
+        moved = self.env.step([Command.MOVE_RIGHT], repeat=10)
+
+        # Assert
+        assert start.shape == (len(OBSERVATION_FIELDS),)
+        assert start.dtype == np.float32
+        assert moved[self.x] == start[self.x] + 50
+        assert self.env.steps == 10
+
+    def test_reset_starts_a_new_episode(self):
+        # Setup
+        start = self.env.reset()
+        self.env.step([Command.MOVE_LEFT], repeat=5)
+
+        # Action & Assert
+        assert np.array_equal(self.env.reset(), start)
+        assert self.env.steps == 0
+
+    def test_reset_closes_the_previous_game(self):
+        # Setup
+        self.env.reset()
+        previous = self.env.game
+
+        # Action
+        self.env.reset()
+
+        # Assert: the previous episode's prefetch thread is stopped
+        with pytest.raises(RuntimeError):
+            previous.mediator.prefetcher._loader.submit(print)
+
+    def test_player_parameters_change_jump(self):
+        # Setup: jump with the default ceiling and a lower one
+        def highest_point(params):
+            self.env.reset(params)
+            self.env.step([Command.JUMP])
+            return min(self.env.step(repeat=1)[self.y] for _ in range(30))
+
+        # Action & Assert
+        assert highest_point(None) == JUMP_CEILING_Y
+        assert highest_point({"jump_ceiling_y": 220}) == 220
+
+    def test_render_draws_only_current_scene_objects(self):
+        # Setup: rendering environment, player walked out of the trolley's scene
+        self.env.close()
+        self.env = PiccoloEnv(render=True)
+        self.env.reset()
+        self.env.step([Command.MOVE_LEFT], repeat=30)
+        game = self.env.game
+        assert game.mediator.current_scene == YARD
+
+        # Action
+        with (patch.object(game.trolley, "draw") as trolley_draw,
+              patch.object(game.bag, "draw") as bag_draw,
+              patch.object(game.items, "draw") as items_draw):
+            self.env.step()
+
+        # Assert
+        trolley_draw.assert_not_called()
+        bag_draw.assert_not_called()
+        items_draw.assert_called_once()
+
+    def test_unknown_player_parameter_raises(self):
+        # Action & Assert
+        with pytest.raises(ValueError):
+            self.env.reset({"speed": 10})
+
+
+class TestVectorEnv:
+    """Test VectorEnv class"""
+
+    def test_environments_run_independently(self):
+        x = OBSERVATION_FIELDS.index("player_x")
+
+        with VectorEnv(2) as envs:
+            # Action
+            start = envs.reset()
+            moved = envs.step([[Command.MOVE_RIGHT], [Command.MOVE_LEFT]], repeat=4)
+
+            # Assert
+            assert start.shape == (2, len(OBSERVATION_FIELDS))
+            assert moved[0, x] == start[0, x] + 20
+            assert moved[1, x] == start[1, x] - 20
+
+            # Action & Assert: one entry per environment is required
+            with pytest.raises(ValueError):
+                envs.step([[Command.JUMP]])
@@ -19,6 +19,7 @@ class TestGame:
         self.input_handler = Mock()
 
         self.mediator.running = True
+        self.mediator.is_static.return_value = False
         self.screen.framerate = 60
 
         self.game = Game(
@@ -38,11 +39,182 @@ class TestGame:
 
         # Assert
         self.input_handler.process_input.assert_called_once()
+        self.mediator.dispatch_commands.assert_called_once()
         self.background.draw.assert_called_once()
         self.player.draw.assert_called_once()
         self.trolley.draw.assert_called_once()
         self.player.update.assert_called_once_with(self.mediator.running)
         self.trolley.update.assert_called_once_with(self.mediator.move_trolley())
         self.mediator.handle_edge_transition.assert_called_once()
+        self.mediator.update_audio.assert_called_once()
         mock_update.assert_called_once()
+        self.input_handler.frame_presented.assert_called_once()
         self.screen.clock.tick.assert_called_once_with(self.screen.framerate)
+
+    def test_run_with_renderer_draws_and_presents_dirty_rects(self):
+        # Setup
+        renderer = Mock()
+        self.game.renderer = renderer
+
+        # Action
+        with patch('pygame.display.update') as mock_update:
+            self.game.run()
+
+        # Assert: renderer replaces full redraw and full display update
+        renderer.draw.assert_called_once()
+        renderer.present.assert_called_once()
+        self.background.draw.assert_not_called()
+        self.player.draw.assert_not_called()
+        mock_update.assert_not_called()
+
+    def test_run_with_profiler_marks_every_phase(self):
+        # Setup
+        profiler = Mock()
+        self.game.profiler = profiler
+
+        # Action
+        with patch('pygame.display.update'):
+            self.game.run()
+
+        # Assert
+        profiler.start_frame.assert_called_once()
+        assert profiler.mark.call_count == 12
+        profiler.draw.assert_called_once_with(self.screen.screen)
+
+    def test_run_with_profiler_and_renderer_updates_overlay(self):
+        # Setup
+        profiler = Mock()
+        renderer = Mock()
+        self.game.profiler = profiler
+        self.game.renderer = renderer
+
+        # Action
+        self.game.run()
+
+        # Assert
+        assert profiler.mark.call_count == 12
+        renderer.add_dirty.assert_called_once_with(profiler.draw.return_value)
+
+    def test_run_with_timestep_runs_due_steps_and_interpolates(self):
+        # Setup: timestep says two steps are due, a quarter into the next one
+        timestep = Mock()
+        timestep.advance.return_value = 2
+        timestep.alpha = 0.25
+        self.game.timestep = timestep
+
+        # Action
+        with patch('pygame.display.update'):
+            self.game.run()
+
+        # Assert: queue drained on the first step and repeated on the second
+        assert self.mediator.dispatch_commands.call_count == 2
+        first, second = self.mediator.dispatch_commands.call_args_list
+        assert first.args == (None,)
+        assert second.args == (self.mediator.dispatch_commands.return_value,)
+        assert self.player.update.call_count == 2
+        assert self.mediator.handle_edge_transition.call_count == 2
+        self.player.draw.assert_called_once_with(0.25)
+        self.trolley.draw.assert_called_once_with(0.25)
+
+    def test_run_with_timestep_and_no_due_step_only_renders(self):
+        # Setup
+        timestep = Mock()
+        timestep.advance.return_value = 0
+        timestep.alpha = 0.5
+        profiler = Mock()
+        self.game.timestep = timestep
+        self.game.profiler = profiler
+
+        # Action
+        with patch('pygame.display.update'):
+            self.game.run()
+
+        # Assert: no step, commands stay queued, every phase still marked
+        self.mediator.dispatch_commands.assert_not_called()
+        self.player.update.assert_not_called()
+        self.player.draw.assert_called_once_with(0.5)
+        assert profiler.mark.call_count == 12
+
+    def test_step_snaps_positions_on_scene_change(self):
+        # Setup: edge transition changes the scene
+        def change_scene():
+            self.mediator.current_scene = "yard"
+        self.mediator.handle_edge_transition.side_effect = change_scene
+
+        # Action
+        self.game.step()
+
+        # Assert: positions saved before the step and again after the scene change
+        assert self.player.save_position.call_count == 2
+        assert self.trolley.save_position.call_count == 2
+
+    def test_static_world_skips_rendering_from_second_frame(self):
+        # Setup
+        self.mediator.is_static.return_value = True
+
+        # Action & Assert: first static frame is still drawn
+        with patch('pygame.display.update') as mock_update:
+            self.game.run()
+            assert self.game.idle is True
+            assert mock_update.call_count == 1
+
+            # Action & Assert: further static frames are not
+            self.game.run()
+            assert mock_update.call_count == 1
+            assert self.player.draw.call_count == 1
+            assert self.game.idle_frames == 1
+
+            # Action & Assert: world moves again
+            self.mediator.is_static.return_value = False
+            self.game.run()
+            assert mock_update.call_count == 2
+            assert self.game.idle is False
+
+    def test_waking_from_idle_resets_timestep(self):
+        # Setup
+        timestep = Mock()
+        timestep.advance.return_value = 1
+        timestep.alpha = 0.0
+        self.game.timestep = timestep
+        self.game.idle = True
+
+        # Action
+        with patch('pygame.display.update'):
+            self.game.run()
+
+        # Assert
+        timestep.reset.assert_called_once()
+
+    def test_items_are_stepped_drawn_and_keep_world_awake(self):
+        # Setup
+        items = Mock()
+        items.is_static.return_value = False
+        self.game.items = items
+        self.mediator.is_static.return_value = True
+
+        # Action
+        with patch('pygame.display.update'):
+            self.game.run()
+            self.game.run()
+
+        # Assert: moving items keep rendering although the mediator is static
+        assert items.save_position.call_count == 2
+        assert items.update.call_count == 2
+        assert items.draw.call_count == 2
+        assert self.game.idle is False
+
+    def test_objects_outside_current_scene_are_not_updated_or_drawn(self):
+        # Setup: trolley and bag are in another scene
+        self.mediator.in_current_scene.side_effect = lambda entity: entity is self.player
+
+        # Action
+        with patch('pygame.display.update'):
+            self.game.run()
+
+        # Assert
+        self.player.update.assert_called_once()
+        self.player.draw.assert_called_once()
+        self.trolley.update.assert_not_called()
+        self.trolley.draw.assert_not_called()
+        self.bag.update.assert_not_called()
+        self.bag.draw.assert_not_called()
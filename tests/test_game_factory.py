@@ -1,13 +1,16 @@
 """Unit tests for Game factory creation"""
 from unittest.mock import patch, MagicMock, ANY
 from game_objects.background import Background
+from game_objects.items import Items
 from game_objects.player import Player
 from game_objects.screen import Screen
 from game_objects.trolley import Trolley
 from control.game import Game
 from control.game_factory import create_game
+from control.timestep import FixedTimestep
 from control.input_handler import InputHandler
 from control.mediator import Mediator
+from utils.constants import EVENT_DRIVEN_INPUT
 
 
 class TestGameFactory:
@@ -40,6 +43,13 @@ class TestGameFactory:
         assert hasattr(game, "mediator")
         assert hasattr(game, "input_handler")
 
+    def test_create_game_without_fixed_timestep(self):
+        # Action
+        game = create_game(fixed_timestep=False)
+
+        # Assert
+        assert game.timestep is None
+
     def test_create_game_component_types(self):
         # Action
         game = create_game()
@@ -50,8 +60,11 @@ class TestGameFactory:
         assert isinstance(game.player, Player)
         assert isinstance(game.trolley, Trolley)
         assert isinstance(game.mediator, Mediator)
+        assert isinstance(game.timestep, FixedTimestep)
+        assert isinstance(game.items, Items)
         assert isinstance(game.input_handler, InputHandler)
 
+    @patch("control.game_factory.load_scene_graph")
     @patch("control.game_factory.InputHandler")
     @patch("control.game_factory.Mediator")
     @patch("control.game_factory.Player")
@@ -67,7 +80,8 @@ class TestGameFactory:
         mock_trolley,
         mock_player,
         mock_mediator,
-        mock_input
+        mock_input,
+        mock_load_scene_graph
     ):
         # Setup: patch returns
         mock_screen.return_value = self.screen_instance
@@ -83,12 +97,14 @@ class TestGameFactory:
         self.trolley_instance.mediator = None
 
         # Action
-        game = create_game()
+        game = create_game(preload=False)
 
         # Assert: constructor calls
         mock_screen.assert_called_once()
         mock_audio_manager.assert_called_once()
-        mock_background.assert_called_once_with(self.screen_instance)
+        mock_load_scene_graph.assert_called_once()
+        scene_graph = mock_load_scene_graph.return_value
+        mock_background.assert_called_once_with(self.screen_instance, scene_graph)
         mock_player.assert_called_once_with(self.screen_instance, mediator=None)
         mock_trolley.assert_called_once_with(self.screen_instance, mediator=None)
         mock_mediator.assert_called_once_with(
@@ -96,9 +112,10 @@ class TestGameFactory:
             self.player_instance,
             self.trolley_instance,
             ANY,
-            self.audio_manager_instance
+            self.audio_manager_instance,
+            scene_graph
         )
-        mock_input.assert_called_once_with(self.mediator_instance)
+        mock_input.assert_called_once_with(self.mediator_instance, event_driven=EVENT_DRIVEN_INPUT)
 
         # Assert: returned game has correct mocked components
         assert game.screen == self.screen_instance
@@ -111,3 +128,4 @@ class TestGameFactory:
         # Assert: player and trolley mediator are correctly linked
         assert self.player_instance.mediator == self.mediator_instance
         assert self.trolley_instance.mediator == self.mediator_instance
+        assert game.items.mediator == self.mediator_instance
@@ -1,6 +1,9 @@
 """Unit tests for helpers.py"""
 import pygame
-from utils.helpers import load_image
+from types import SimpleNamespace
+from utils.asset_registry import registry
+from utils.constants import PIXEL_FORMAT_OPAQUE
+from utils.helpers import interpolate_position, load_image, sprites_collide
 
 
 class TestHelpers:
@@ -24,6 +27,30 @@ class TestHelpers:
         finally:
             pygame.quit()
 
+    def test_load_image_shared_surfaces(self, tmp_path):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        try:
+            # Setup: create temporary image
+            image_path = tmp_path / "test_img.png"
+            pygame.image.save(pygame.Surface((5, 5)), str(image_path))
+            misses = registry.misses
+
+            # Action
+            first = load_image(str(image_path))
+            second = load_image(str(image_path))
+            opaque = load_image(str(image_path), pixel_format=PIXEL_FORMAT_OPAQUE)
+            private = load_image(str(image_path), shared=False)
+
+            # Assert: same path and format decode once, other formats and unshared loads do not share
+            assert first is second
+            assert opaque is not first
+            assert private is not first
+            assert registry.misses == misses + 2
+        finally:
+            registry.clear()
+            pygame.quit()
+
     def test_load_image_not_found(self):
         pygame.init()
         try:
@@ -61,3 +88,24 @@ class TestHelpers:
             assert pixel_array.min() != pixel_array.max()
         finally:
             pygame.quit()
+
+    def test_interpolate_position(self):
+        # Setup
+        rect = pygame.Rect(20, 40, 10, 10)
+
+        # Action & Assert
+        assert interpolate_position(rect, (10, 40), 0.5) == (15, 40)
+        assert interpolate_position(rect, (10, 40), 1.0) is rect
+        assert interpolate_position(rect, (20, 40), 0.5) is rect
+
+    def test_sprites_collide_broad_and_narrow_phase(self):
+        # Setup: ring sprite whose centre is transparent
+        ring = pygame.Surface((20, 20), pygame.SRCALPHA)
+        pygame.draw.rect(ring, (255, 255, 255, 255), ring.get_rect(), 2)
+        dot = pygame.Surface((4, 4))
+        a = SimpleNamespace(rect=pygame.Rect(0, 0, 20, 20), image=ring)
+
+        # Action & Assert: apart, inside the transparent centre and on the ring
+        assert not sprites_collide(a, SimpleNamespace(rect=pygame.Rect(30, 0, 4, 4), image=dot))
+        assert not sprites_collide(a, SimpleNamespace(rect=pygame.Rect(8, 8, 4, 4), image=dot))
+        assert sprites_collide(a, SimpleNamespace(rect=pygame.Rect(0, 8, 4, 4), image=dot))
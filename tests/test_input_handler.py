@@ -1,6 +1,7 @@
 """Unit tests for InputHandler class"""
 import pygame
-from unittest.mock import Mock, patch
+from time import perf_counter_ns
+from unittest.mock import Mock, call, patch
 from control.input_handler import InputHandler
 from utils.commands import Command
 
@@ -23,7 +24,7 @@ class TestInputHandler:
             self.input_handler.process_input()
 
             # Assert
-            self.mediator.handle_command.assert_called_once_with(Command.MOVE_LEFT)
+            self.mediator.queue_command.assert_called_once_with(Command.MOVE_LEFT)
 
     def test_right_key_triggers_right_command(self):
         # Setup
@@ -34,7 +35,7 @@ class TestInputHandler:
             self.input_handler.process_input()
 
             # Assert
-            self.mediator.handle_command.assert_called_once_with(Command.MOVE_RIGHT)
+            self.mediator.queue_command.assert_called_once_with(Command.MOVE_RIGHT)
 
     def test_up_key_triggers_enter_door_command(self):
         # Setup
@@ -45,7 +46,7 @@ class TestInputHandler:
             self.input_handler.process_input()
 
             # Assert
-            self.mediator.handle_command.assert_called_once_with(Command.ENTER_DOOR)
+            self.mediator.queue_command.assert_called_once_with(Command.ENTER_DOOR)
 
     def test_down_key_triggers_exit_door_command(self):
         # Setup
@@ -56,7 +57,7 @@ class TestInputHandler:
             self.input_handler.process_input()
 
             # Assert
-            self.mediator.handle_command.assert_called_once_with(Command.EXIT_DOOR)
+            self.mediator.queue_command.assert_called_once_with(Command.EXIT_DOOR)
 
     def test_space_key_triggers_jump_command(self):
         # Setup
@@ -67,7 +68,7 @@ class TestInputHandler:
             self.input_handler.process_input()
 
             # Assert
-            self.mediator.handle_command.assert_called_once_with(Command.JUMP)
+            self.mediator.queue_command.assert_called_once_with(Command.JUMP)
 
     def test_return_key_triggers_take_trolley_command(self):
         # Setup
@@ -78,7 +79,7 @@ class TestInputHandler:
             self.input_handler.process_input()
 
             # Assert
-            self.mediator.handle_command.assert_called_once_with(Command.TAKE_TROLLEY)
+            self.mediator.queue_command.assert_called_once_with(Command.TAKE_TROLLEY)
 
     def test_rshift_key_triggers_release_trolley_command(self):
         # Setup
@@ -89,7 +90,7 @@ class TestInputHandler:
             self.input_handler.process_input()
 
             # Assert
-            self.mediator.handle_command.assert_called_once_with(Command.RELEASE_TROLLEY)
+            self.mediator.queue_command.assert_called_once_with(Command.RELEASE_TROLLEY)
 
     def test_no_keys_triggers_no_command(self):
         # Setup
@@ -100,4 +101,101 @@ class TestInputHandler:
             self.input_handler.process_input()
 
             # Assert
-            self.mediator.handle_command.assert_not_called()
+            self.mediator.queue_command.assert_not_called()
+
+
+class TestEventDrivenInputHandler:
+    """Test InputHandler class in event-driven mode"""
+
+    def setup_method(self):
+        # Setup
+        self.mediator = Mock()
+
+        self.input_handler = InputHandler(self.mediator, event_driven=True)
+
+    def key_event(self, event_type, key):
+        return pygame.event.Event(event_type, key=key)
+
+    def test_held_keys_follow_keydown_and_keyup(self):
+        # Action: press right and space
+        self.input_handler.handle_event(self.key_event(pygame.KEYDOWN, pygame.K_RIGHT))
+        self.input_handler.handle_event(self.key_event(pygame.KEYDOWN, pygame.K_SPACE))
+        with patch('pygame.key.get_pressed') as mock_keys:
+            self.input_handler.process_input()
+
+        # Assert: commands from held keys, keyboard state not polled
+        mock_keys.assert_not_called()
+        assert self.mediator.queue_command.call_args_list == [call(Command.MOVE_RIGHT), call(Command.JUMP)]
+        self.mediator.reset_mock()
+
+        # Action: held keys repeat until released
+        self.input_handler.handle_event(self.key_event(pygame.KEYUP, pygame.K_SPACE))
+        self.input_handler.process_input()
+
+        # Assert
+        self.mediator.queue_command.assert_called_once_with(Command.MOVE_RIGHT)
+        self.mediator.reset_mock()
+
+        # Action: release the last key
+        self.input_handler.handle_event(self.key_event(pygame.KEYUP, pygame.K_RIGHT))
+        self.input_handler.process_input()
+
+        # Assert
+        self.mediator.queue_command.assert_called_once_with(Command.STOP_MOVING)
+
+    def test_movement_priority_matches_polling(self):
+        # Setup: left and up held together
+        self.input_handler.handle_event(self.key_event(pygame.KEYDOWN, pygame.K_UP))
+        self.input_handler.handle_event(self.key_event(pygame.KEYDOWN, pygame.K_LEFT))
+
+        # Action
+        self.input_handler.process_input()
+
+        # Assert: only left is sent
+        self.mediator.queue_command.assert_called_once_with(Command.MOVE_LEFT)
+
+    def test_focus_lost_releases_held_keys(self):
+        # Setup
+        self.input_handler.handle_event(self.key_event(pygame.KEYDOWN, pygame.K_LEFT))
+
+        # Action
+        self.input_handler.handle_event(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+        self.input_handler.process_input()
+
+        # Assert
+        assert not self.input_handler.held_keys
+        self.mediator.queue_command.assert_called_once_with(Command.STOP_MOVING)
+
+    def test_rebinding_keys(self):
+        # Setup: jump with W instead of space
+        self.input_handler.bind(pygame.K_w, Command.JUMP)
+        self.input_handler.unbind(pygame.K_SPACE)
+
+        # Action
+        self.input_handler.handle_event(self.key_event(pygame.KEYDOWN, pygame.K_SPACE))
+        self.input_handler.handle_event(self.key_event(pygame.KEYDOWN, pygame.K_w))
+        self.input_handler.process_input()
+
+        # Assert
+        self.mediator.queue_command.assert_called_once_with(Command.JUMP)
+
+    def test_latency_measured_from_every_event_of_frame(self):
+        # Setup: two events in one frame, the first one 5 ms old
+        now = perf_counter_ns()
+        self.input_handler.handle_event(self.key_event(pygame.KEYDOWN, pygame.K_RIGHT), timestamp_ns=now - 5_000_000)
+        self.input_handler.handle_event(self.key_event(pygame.KEYDOWN, pygame.K_SPACE), timestamp_ns=now)
+
+        # Action
+        self.input_handler.process_input()
+        self.input_handler.frame_presented()
+
+        # Assert: one sample per event, each from its own timestamp
+        stats = self.input_handler.latency_stats()
+        assert stats["samples"] == 2
+        assert stats["max_ms"] >= 5
+        assert stats["max_ms"] - min(self.input_handler.latencies) / 1_000_000 >= 5
+
+        # Action & Assert: frames without input events add no samples
+        self.input_handler.process_input()
+        self.input_handler.frame_presented()
+        assert self.input_handler.latency_stats()["samples"] == 2
@@ -0,0 +1,72 @@
+"""Unit tests for Items class"""
+import pygame
+from unittest.mock import Mock, patch
+from game_objects.items import ItemHandle, Items
+from utils.constants import ENTRANCE, GROUND_LEVEL, ITEM_SPRITES, YARD
+from utils.scene_graph import load_scene_graph
+
+
+class TestItems:
+    """Test Items class"""
+
+    def setup_method(self):
+        # Setup: item images are 10x20 surfaces
+        self.screen = Mock()
+        self.screen.screen = pygame.Surface((800, 400))
+        self.mediator = Mock()
+        self.mediator.scene_graph = load_scene_graph()
+        self.mediator.current_scene = ENTRANCE
+        with patch("game_objects.items.load_image", return_value=pygame.Surface((10, 20))):
+            self.items = Items(self.screen, self.mediator)
+
+    def test_one_image_per_sprite(self):
+        # Assert
+        assert len(self.items.images) == len(ITEM_SPRITES)
+
+    def test_add_places_item_on_ground(self):
+        # Action
+        entity = self.items.add("coin", YARD, 100)
+
+        # Assert
+        store = self.items.store
+        assert store.x[entity] == 95
+        assert store.y[entity] == GROUND_LEVEL - 20
+        assert store.sprite[entity] == ITEM_SPRITES.index("coin")
+        assert store.scene[entity] == self.mediator.scene_graph.scene_id(YARD)
+        self.mediator.spatial_hash.update.assert_called_once_with(
+            ItemHandle(self.items, entity), YARD, (95, GROUND_LEVEL - 20, 10, 20))
+
+    def test_prefetch_builds_scene_index(self):
+        # Setup
+        entity = self.items.add("coin", YARD, 100)
+
+        # Action
+        self.items.prefetch(YARD)
+
+        # Assert: the scene's entity array is built before the scene is shown
+        scene_id = self.mediator.scene_graph.scene_id(YARD)
+        assert self.items.store._scene_arrays[scene_id].tolist() == [entity]
+
+    def test_draw_only_current_scene(self):
+        # Setup
+        self.items.add("coin", ENTRANCE, 100)
+        self.items.add("bag", ENTRANCE, 300)
+        self.items.add("bill", YARD, 500)
+
+        # Action
+        rects = self.items.draw()
+
+        # Assert
+        assert rects == [pygame.Rect(95, GROUND_LEVEL - 20, 10, 20), pygame.Rect(295, GROUND_LEVEL - 20, 10, 20)]
+
+    def test_draw_interpolates_and_returns_none_when_empty(self):
+        # Setup
+        self.items.add("coin", ENTRANCE, 100, velocity=(10.0, 0.0))
+        self.items.save_position()
+        self.items.update()
+
+        # Action & Assert
+        assert self.items.draw(0.5)[0].x == 100
+        assert not self.items.is_static()
+        self.mediator.current_scene = YARD
+        assert self.items.draw() is None
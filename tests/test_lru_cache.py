@@ -0,0 +1,84 @@
+"""Unit tests for LRUCache class"""
+from utils.lru_cache import LRUCache
+
+
+class TestLRUCache:
+    """Test LRUCache class"""
+
+    def test_get_returns_stored_value(self):
+        # Setup
+        cache = LRUCache(2)
+
+        # Action
+        cache.put("a", 1)
+
+        # Assert
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_least_recently_used_is_evicted(self):
+        # Setup
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        # Action: use a, then add c
+        cache.get("a")
+        cache.put("c", 3)
+
+        # Assert: b was evicted
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_size_of_budget(self):
+        # Setup: values sized by their length
+        cache = LRUCache(10, size_of=len)
+
+        # Action
+        cache.put("a", "x" * 6)
+        cache.put("b", "x" * 6)
+
+        # Assert
+        assert "a" not in cache
+        assert cache.size == 6
+
+    def test_value_over_budget_is_not_stored(self):
+        # Setup
+        cache = LRUCache(5, size_of=len)
+
+        # Action
+        cache.put("a", "x" * 6)
+
+        # Assert
+        assert "a" not in cache
+        assert cache.size == 0
+
+    def test_put_replaces_existing_value(self):
+        # Setup
+        cache = LRUCache(10, size_of=len)
+        cache.put("a", "xx")
+
+        # Action
+        cache.put("a", "xxx")
+
+        # Assert
+        assert cache.get("a") == "xxx"
+        assert cache.size == 3
+
+    def test_pop_and_clear(self):
+        # Setup
+        cache = LRUCache(10, size_of=len)
+        cache.put("a", "xx")
+        cache.put("b", "xxx")
+
+        # Action & Assert
+        assert cache.pop("a") == "xx"
+        assert cache.pop("a") is None
+        assert cache.size == 3
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size == 0
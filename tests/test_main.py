@@ -1,7 +1,11 @@
 """Unit tests for main.py"""
 import pygame
+import pytest
 import main
 from unittest.mock import patch, MagicMock
+from control.replay import CommandRecorder
+from utils.commands import Command
+from utils.constants import IDLE_WAIT_MS
 
 
 class TestMain:
@@ -18,6 +22,7 @@ class TestMain:
     def test_main_creates_game_and_runs_loop_once(self):
         # Setup
         fake_game = MagicMock()
+        fake_game.idle = False
         fake_game.run = MagicMock()
 
         # Prepare a QUIT event to exit the loop immediately
@@ -37,3 +42,100 @@ class TestMain:
             fake_game.run.assert_called_once()
             mock_quit.assert_called_once()
             mock_exit.assert_called_once()
+
+    def test_replay_runs_until_recording_ends(self, tmp_path):
+        # Setup: recording of three frames
+        path = tmp_path / "session.rec"
+        recorder = CommandRecorder(str(path), framerate=60)
+        for _ in range(3):
+            recorder.record(Command.MOVE_RIGHT)
+            recorder.end_frame()
+        recorder.close()
+
+        fake_game = MagicMock()
+        fake_game.idle = False
+        fake_game.run.side_effect = lambda: fake_game.input_handler.process_input()
+
+        with (patch.object(self.main, "create_game", return_value=fake_game),
+             patch("pygame.event.get", return_value=[]),
+             patch("pygame.quit"),
+             patch("sys.exit")):
+
+            # Action
+            self.main.run_game(replay=str(path), headless=True)
+
+        # Assert: one game loop frame and simulation step per recorded frame, unthrottled
+        assert fake_game.run.call_count == 3
+        assert fake_game.timestep is None
+        assert fake_game.screen.framerate == 0
+        assert fake_game.mediator.queue_command.call_count == 3
+
+    def test_record_writes_recording(self, tmp_path):
+        # Setup
+        path = tmp_path / "session.rec"
+        fake_game = MagicMock()
+        fake_game.idle = False
+        fake_game.screen.framerate = 60
+        quit_event = pygame.event.Event(pygame.QUIT)
+
+        with (patch.object(self.main, "create_game", return_value=fake_game),
+             patch("pygame.event.get", return_value=[quit_event]),
+             patch("pygame.quit"),
+             patch("sys.exit")):
+
+            # Action
+            self.main.run_game(record=str(path))
+
+        # Assert: recorder attached and file closed with a header
+        assert isinstance(fake_game.mediator.recorder, CommandRecorder)
+        assert path.stat().st_size > 0
+
+    def test_parse_args(self):
+        # Action & Assert
+        args = self.main.parse_args(["--replay", "session.rec", "--headless"])
+        assert args.replay == "session.rec"
+        assert args.headless is True
+        assert args.record is None
+
+        # Action & Assert: invalid combinations
+        with pytest.raises(SystemExit):
+            self.main.parse_args(["--record", "a.rec", "--replay", "b.rec"])
+        with pytest.raises(SystemExit):
+            self.main.parse_args(["--headless"])
+
+    def test_keyboard_events_forwarded_to_input_handler(self):
+        # Setup
+        fake_game = MagicMock()
+        fake_game.idle = False
+        key_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)
+        quit_event = pygame.event.Event(pygame.QUIT)
+
+        with (patch.object(self.main, "create_game", return_value=fake_game),
+             patch("pygame.event.get", return_value=[key_event, quit_event]),
+             patch("pygame.quit"),
+             patch("sys.exit")):
+
+            # Action
+            self.main.run_game()
+
+        # Assert
+        fake_game.input_handler.handle_event.assert_called_once_with(key_event)
+
+    def test_idle_game_blocks_on_events(self):
+        # Setup: static world, QUIT arrives while waiting
+        fake_game = MagicMock()
+        fake_game.idle = True
+        quit_event = pygame.event.Event(pygame.QUIT)
+
+        with (patch.object(self.main, "create_game", return_value=fake_game),
+             patch("pygame.event.wait", return_value=quit_event) as mock_wait,
+             patch("pygame.event.get", return_value=[]),
+             patch("pygame.quit"),
+             patch("sys.exit")):
+
+            # Action
+            self.main.run_game()
+
+        # Assert
+        mock_wait.assert_called_once_with(IDLE_WAIT_MS)
+        fake_game.run.assert_called_once()
@@ -0,0 +1,74 @@
+"""Unit tests for mapped_file.py"""
+import os
+from utils.mapped_file import (MAPPED_FILE_HEADER, MappedFile, command_parser, relative_name,
+                               source_files, write_mapped_file)
+
+MAGIC = b"TESTFILE"
+
+
+class TestMappedFile:
+    """Test the indexed memory-mapped file helpers"""
+
+    def test_relative_name(self, tmp_path):
+        # Action & Assert
+        assert relative_name(os.path.join(str(tmp_path), "items", "bag.png"), str(tmp_path)) == "items/bag.png"
+        assert relative_name(os.path.join(str(tmp_path), os.pardir, "bag.png"), str(tmp_path)) is None
+
+    def test_source_files_filters_extensions_in_stable_order(self, tmp_path):
+        # Setup
+        (tmp_path / "items").mkdir()
+        for name in ("b.PNG", "a.png", "items/c.png", "notes.txt"):
+            (tmp_path / name).write_bytes(b"")
+
+        # Action
+        names = [relative_name(path, str(tmp_path)) for path in source_files(str(tmp_path), (".png",))]
+
+        # Assert
+        assert names == ["a.png", "b.PNG", "items/c.png"]
+
+    def test_write_and_read_aligned_entries(self, tmp_path):
+        # Setup
+        path = str(tmp_path / "test.bin")
+
+        # Action
+        size = write_mapped_file(path, MAGIC, 3, [("a", {"kind": "x"}, b"abc"), ("b", {}, b"defg")], 64)
+        mapped = MappedFile(path, MAGIC, 3, "test file")
+        index = mapped._open()
+
+        # Assert
+        assert size == os.path.getsize(path)
+        assert index == {"a": {"kind": "x", "offset": 0}, "b": {"offset": 64}}
+        assert bytes(mapped._data[64:68]) == b"defg"
+        assert (os.path.getsize(path) - len(mapped._data)) % 64 == 0
+        assert not os.path.exists(f"{path}.tmp")
+
+    def test_other_version_and_missing_file_are_empty(self, tmp_path):
+        # Setup
+        path = str(tmp_path / "test.bin")
+        write_mapped_file(path, MAGIC, 1, [("a", {}, b"abc")], 64)
+
+        # Action & Assert
+        assert MappedFile(path, MAGIC, 2, "test file")._open() == {}
+        assert MappedFile(str(tmp_path / "missing.bin"), MAGIC, 1, "test file")._open() == {}
+        assert MAPPED_FILE_HEADER.size == 16
+
+    def test_close_maps_the_file_again(self, tmp_path):
+        # Setup
+        path = str(tmp_path / "test.bin")
+        write_mapped_file(path, MAGIC, 1, [("a", {}, b"abc")], 64)
+        mapped = MappedFile(path, MAGIC, 1, "test file")
+        mapped._open()
+        write_mapped_file(path, MAGIC, 1, [("b", {}, b"abc")], 64)
+
+        # Action
+        mapped.close()
+
+        # Assert
+        assert list(mapped._open()) == ["b"]
+
+    def test_command_parser(self):
+        # Action
+        args = command_parser("Test.", ("build",), "--cache", "default.cache", "root").parse_args(["build"])
+
+        # Assert
+        assert (args.command, args.cache, args.root) == ("build", "default.cache", "root")
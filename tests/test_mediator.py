@@ -1,9 +1,14 @@
 """Unit tests for Mediator class"""
+import pygame
 from unittest.mock import Mock, MagicMock
 from control.mediator import Mediator
+from game_objects.items import ItemHandle
 from utils.commands import Command
-from utils.constants import (EDGE_MARGIN, ENTRANCE, FIVE, MUSIC_YARD,
-                             SCREEN_WIDTH, SOUND_JUMP, YARD)
+from utils.constants import (BALLROOM, DOWN, EDGE_MARGIN, ELEVATOR, ENTRANCE,
+                             FIVE, GARAGE, LEFT, LUGGAGE, MUSIC_YARD,
+                             PREFETCH_MARGIN, RECEPTION, RIGHT, SCREEN_WIDTH, SOFAS,
+                             SOUND_JUMP, UP, YARD)
+from utils.scene_graph import Scene, SceneGraph
 
 
 class TestMediator:
@@ -17,12 +22,16 @@ class TestMediator:
         self.mock_player.move_left = MagicMock()
         self.mock_player.move_right = MagicMock()
         self.mock_player.rect = Mock()
+        self.mock_player.image = pygame.Surface((31, 84))
 
         self.mock_trolley = Mock()
         self.mock_trolley.taken = False
+        self.mock_trolley.rect = pygame.Rect(500, 260, 40, 64)
+        self.mock_trolley.image = pygame.Surface((40, 64))
         
         self.mock_bag = Mock()
         self.mock_bag.taken = False
+        self.mock_bag.rect = pygame.Rect(58, 290, 40, 34)
 
         self.mock_background = MagicMock()
         self.mock_background.change_background = MagicMock()
@@ -119,52 +128,82 @@ class TestMediator:
         self.mock_background.change_background.assert_not_called()
         self.mock_audio_manager.play_music.assert_not_called()
 
-    def test_change_to_entrance_direct(self):
+    def test_change_scene_to_entrance_direct(self):
         # Setup
         self.mediator.current_scene = YARD
 
         # Action
-        self.mediator.change_to_entrance()
+        self.mediator.change_scene(ENTRANCE)
 
         # Assert
         assert self.mediator.current_scene == ENTRANCE
         self.mock_background.change_background.assert_called_once_with(ENTRANCE)
         self.mock_audio_manager.stop_music.assert_called_once()
 
-    def test_change_to_entrance_no_change_if_already_in_scene(self):
+    def test_change_scene_no_change_if_already_in_scene(self):
         # Setup
         self.mediator.current_scene = ENTRANCE
 
         # Action
-        self.mediator.change_to_entrance()
+        self.mediator.change_scene(ENTRANCE)
 
         # Assert
         self.mock_background.change_background.assert_not_called()
         self.mock_audio_manager.stop_music.assert_not_called()
 
-    def test_change_to_yard_direct(self):
+    def test_change_scene_to_yard_plays_music(self):
         # Setup
         self.mediator.current_scene = ENTRANCE
 
         # Action
-        self.mediator.change_to_yard()
+        self.mediator.change_scene(YARD)
 
         # Assert
         assert self.mediator.current_scene == YARD
         self.mock_background.change_background.assert_called_once_with(YARD)
         self.mock_audio_manager.play_music.assert_called_once_with(MUSIC_YARD)
 
-    def test_change_to_yard_no_change_if_already_in_scene(self):
+    def test_change_scene_unknown_scene_does_nothing(self):
         # Setup
         self.mediator.current_scene = YARD
 
         # Action
-        self.mediator.change_to_yard()
+        self.mediator.change_scene("sauna")
 
         # Assert
+        assert self.mediator.current_scene == YARD
         self.mock_background.change_background.assert_not_called()
         self.mock_audio_manager.play_music.assert_not_called()
 
+    def test_transitions_follow_custom_scene_graph(self):
+        # Setup: graph with a corridor right of the entrance and a bar behind its door
+        graph = SceneGraph({
+            ENTRANCE: Scene(ENTRANCE, "ground.png", "entrance.png", None, {RIGHT: "corridor", UP: "bar"}),
+            "corridor": Scene("corridor", "ground.png", "corridor.png", "music_corridor.wav", {LEFT: ENTRANCE}),
+            "bar": Scene("bar", "ground.png", "bar.png", None, {DOWN: ENTRANCE}),
+        }, ENTRANCE)
+        mediator = Mediator(self.mock_background, self.mock_player, self.mock_trolley,
+                            self.mock_bag, self.mock_audio_manager, graph)
+        self.mock_player.rect.left = SCREEN_WIDTH - EDGE_MARGIN + 1
+        self.mock_player.rect.right = SCREEN_WIDTH
+
+        # Action & Assert: exit right into the corridor and its music
+        mediator.handle_edge_transition()
+        assert mediator.current_scene == "corridor"
+        self.mock_audio_manager.play_music.assert_called_once_with("music_corridor.wav")
+
+        # Action & Assert: corridor has no exit on the right
+        mediator.handle_edge_transition()
+        assert mediator.current_scene == "corridor"
+
+        # Action & Assert: back to the entrance and through its door
+        mediator.change_scene(ENTRANCE)
+        self.mock_player.rect.left = 300
+        mediator.enter_door()
+        assert mediator.current_scene == "bar"
+        mediator.exit_door()
+        assert mediator.current_scene == ENTRANCE
+
     def test_handle_command_unknown_command_sets_running_false(self):
         # Action
         self.mediator.handle_command(None)
@@ -250,11 +289,172 @@ class TestMediator:
         assert self.mediator.current_scene == YARD
         assert self.mock_player.rect.right == SCREEN_WIDTH - EDGE_MARGIN - FIVE
 
+    def test_neighbour_scene(self):
+        # Setup: (scene, spawn_on_left) -> expected neighbour
+        expected = {
+            (BALLROOM, True): GARAGE,
+            (BALLROOM, False): None,
+            (ELEVATOR, False): RECEPTION,
+            (ELEVATOR, True): None,
+            (ENTRANCE, True): YARD,
+            (ENTRANCE, False): YARD,
+            (GARAGE, False): BALLROOM,
+            (GARAGE, True): LUGGAGE,
+            (LUGGAGE, False): GARAGE,
+            (LUGGAGE, True): SOFAS,
+            (RECEPTION, False): SOFAS,
+            (RECEPTION, True): ELEVATOR,
+            (SOFAS, False): LUGGAGE,
+            (SOFAS, True): RECEPTION,
+            (YARD, True): ENTRANCE,
+            (YARD, False): ENTRANCE,
+        }
+
+        for (scene, spawn_on_left), neighbour in expected.items():
+            # Action
+            self.mediator.current_scene = scene
+
+            # Assert
+            assert self.mediator._neighbour_scene(spawn_on_left=spawn_on_left) == neighbour
+
+    def test_handle_edge_transition_prefetches_neighbour_music(self):
+        # Setup: player near right edge of entrance facing it, next to yard
+        self.mock_player.rect.left = SCREEN_WIDTH - EDGE_MARGIN - PREFETCH_MARGIN - 50
+        self.mock_player.rect.right = SCREEN_WIDTH - EDGE_MARGIN - PREFETCH_MARGIN
+        self.mock_player.is_left = False
+        self.mediator.current_scene = ENTRANCE
+
+        # Action
+        self.mediator.handle_edge_transition()
+
+        # Assert: music read ahead, scene not changed yet
+        self.mock_audio_manager.prefetch_music.assert_called_once_with(MUSIC_YARD)
+        assert self.mediator.current_scene == ENTRANCE
+
+    def test_handle_edge_transition_no_prefetch_facing_away(self):
+        # Setup: player near right edge of entrance but walking away from it
+        self.mock_player.rect.left = SCREEN_WIDTH - EDGE_MARGIN - PREFETCH_MARGIN - 50
+        self.mock_player.rect.right = SCREEN_WIDTH - EDGE_MARGIN - PREFETCH_MARGIN
+        self.mock_player.is_left = True
+        self.mediator.current_scene = ENTRANCE
+
+        # Action
+        self.mediator.handle_edge_transition()
+
+        # Assert
+        self.mock_audio_manager.prefetch_music.assert_not_called()
+
+    def test_change_scene_counts_prefetch(self):
+        # Setup: yard is prefetched and its background is ready
+        self.mock_player.is_left = False
+        self.mediator.prefetcher.prefetch(YARD)
+        self.mediator.prefetcher._warmed[YARD] = 5_000_000
+
+        # Action
+        self.mediator.change_scene(YARD)
+
+        # Assert
+        assert self.mediator.prefetcher.stats()["hits"] == 1
+        assert self.mediator.prefetcher.stats()["avoided_stall_ms"] == 5.0
+
+    def test_handle_edge_transition_no_prefetch_in_middle(self):
+        # Setup
+        self.mock_player.rect.left = 300
+        self.mock_player.rect.right = 350
+        self.mediator.current_scene = ENTRANCE
+
+        # Action
+        self.mediator.handle_edge_transition()
+
+        # Assert
+        self.mock_audio_manager.prefetch_music.assert_not_called()
+
+    def test_dispatch_commands_handles_coalesced_queue(self):
+        # Setup: two producers push the same movement in one frame
+        self.mediator.queue_command(Command.MOVE_RIGHT)
+        self.mediator.queue_command(Command.STOP_MOVING)
+        self.mediator.queue_command(Command.MOVE_RIGHT)
+        self.mediator.queue_command(Command.JUMP)
+
+        # Action
+        self.mediator.dispatch_commands()
+
+        # Assert: movement handled once, stop cancelled
+        self.mock_player.move_right.assert_called_once()
+        self.mock_player.jump.assert_called_once()
+        stats = self.mediator.command_stats()
+        assert stats["depth"] == 0
+        assert stats["max_depth"] == 4
+        assert stats["pushed"] == 4
+        assert stats["coalesced"] == 2
+        assert stats["dispatched"] == 2
+        assert stats["dispatch_ms"] >= stats["last_dispatch_ms"] >= 0
+
+    def test_dispatch_commands_repeats_given_commands_and_records_them(self):
+        # Setup
+        recorder = Mock()
+        self.mediator.recorder = recorder
+        self.mediator.queue_command(Command.MOVE_LEFT)
+
+        # Action: first step drains the queue, second step repeats it
+        commands = self.mediator.dispatch_commands()
+        self.mediator.dispatch_commands(commands)
+
+        # Assert
+        assert commands == [Command.MOVE_LEFT]
+        assert self.mock_player.move_left.call_count == 2
+        assert recorder.record.call_count == 2
+        assert recorder.end_frame.call_count == 2
+
+    def test_dispatch_commands_empty_queue_keeps_running_state(self):
+        # Setup
+        self.mediator.running = True
+
+        # Action
+        self.mediator.dispatch_commands()
+
+        # Assert
+        assert self.mediator.running is True
+
+    def test_is_static(self):
+        # Setup: player and trolley standing still, nothing queued
+        self.mediator.running = False
+        self.mock_player.is_jumping = False
+        self.mock_player.previous_pos = self.mock_player.rect.topleft
+        self.mock_trolley.speed = 0
+        self.mock_trolley.previous_pos = self.mock_trolley.rect.topleft
+        self.mock_audio_manager.is_changing_music = False
+
+        # Assert
+        assert self.mediator.is_static() is True
+
+        # Action & Assert: rolling trolley
+        self.mock_trolley.speed = 2
+        assert self.mediator.is_static() is False
+        self.mock_trolley.speed = 0
+
+        # Action & Assert: queued command
+        self.mediator.queue_command(Command.JUMP)
+        assert self.mediator.is_static() is False
+        self.mediator.command_queue.drain()
+
+        # Action & Assert: music about to start
+        self.mock_audio_manager.is_changing_music = True
+        assert self.mediator.is_static() is False
+
+    def test_update_audio(self):
+        # Action
+        self.mediator.update_audio()
+
+        # Assert
+        self.mock_audio_manager.update.assert_called_once()
+
     def test_take_trolley_wrong_scene_does_not_take(self):
         # Setup
         self.mock_trolley.scene_name = ENTRANCE
         self.mediator.current_scene = YARD
-        self.mock_player.rect.colliderect.return_value = True
+        self.mock_player.rect = pygame.Rect(100, 240, 31, 84)
+        self.mock_trolley.rect = pygame.Rect(120, 260, 40, 64)
 
         # Action
         self.mediator.take_trolley()
@@ -263,23 +463,28 @@ class TestMediator:
         assert self.mock_trolley.taken is False
 
     def test_take_trolley_correct_scene_takes_it(self):
-        # Setup
+        # Setup: player overlaps the trolley
         self.mock_trolley.scene_name = ENTRANCE
         self.mediator.current_scene = ENTRANCE
-        self.mock_player.rect.colliderect.return_value = True
+        self.mock_player.rect = pygame.Rect(100, 240, 31, 84)
+        self.mock_trolley.rect = pygame.Rect(120, 260, 40, 64)
+        self.mediator.track(self.mock_trolley)
         self.mock_trolley.taken = False
+        self.mock_trolley.speed = 3
 
         # Action
         self.mediator.take_trolley()
 
-        # Assert
+        # Assert: a trolley taken while rolling stops rolling
         assert self.mock_trolley.taken is True
+        assert self.mock_trolley.speed == 0
 
     def test_take_trolley_already_taken_does_nothing(self):
         # Setup
         self.mock_trolley.scene_name = ENTRANCE
         self.mediator.current_scene = ENTRANCE
-        self.mock_player.rect.colliderect.return_value = True
+        self.mock_player.rect = pygame.Rect(100, 240, 31, 84)
+        self.mock_trolley.rect = pygame.Rect(120, 260, 40, 64)
         self.mock_trolley.taken = True
 
         # Action
@@ -336,8 +541,110 @@ class TestMediator:
         assert self.mediator.current_scene == YARD
 
         # Player tries to take trolley in right place of wrong scene
-        self.mock_player.rect.colliderect.return_value = True
+        self.mock_player.rect = pygame.Rect(100, 240, 31, 84)
+        self.mock_trolley.rect = pygame.Rect(120, 260, 40, 64)
         self.mediator.take_trolley()
 
         # Assert trolley NOT taken
         assert self.mock_trolley.taken is False
+
+    def test_scene_index_follows_pickup_drop_and_transition(self):
+        # Setup: trolley and bag start in the entrance, player overlaps the trolley
+        self.mock_trolley.scene_name = ENTRANCE
+        self.mock_bag.scene_name = ENTRANCE
+        self.mock_player.rect = pygame.Rect(100, 240, 31, 84)
+        self.mock_trolley.rect = pygame.Rect(120, 260, 40, 64)
+        mediator = Mediator(self.mock_background, self.mock_player, self.mock_trolley,
+                            self.mock_bag, self.mock_audio_manager)
+
+        # Assert: player is carried everywhere, items are in their scene
+        assert mediator.in_current_scene(self.mock_player)
+        assert mediator.in_current_scene(self.mock_trolley)
+        mediator.change_scene(YARD)
+        assert mediator.in_current_scene(self.mock_player)
+        assert not mediator.in_current_scene(self.mock_trolley)
+        assert not mediator.in_current_scene(self.mock_bag)
+
+        # Action: take the trolley in the entrance and carry it to the yard
+        mediator.change_scene(ENTRANCE)
+        mediator.take_trolley()
+        mediator.change_scene(YARD)
+
+        # Assert
+        assert mediator.in_current_scene(self.mock_trolley)
+        assert self.mock_trolley.scene_name == YARD
+
+        # Action: drop the trolley in the yard and go back
+        mediator.release_trolley()
+        mediator.change_scene(ENTRANCE)
+
+        # Assert
+        assert not mediator.in_current_scene(self.mock_trolley)
+        assert mediator.in_current_scene(self.mock_bag)
+        assert mediator.scene_index.scene_of(self.mock_trolley) == YARD
+
+    def test_take_trolley_uses_spatial_hash(self):
+        # Setup: trolley is far from player
+        self.mock_trolley.scene_name = ENTRANCE
+        self.mock_player.rect = pygame.Rect(100, 240, 31, 84)
+        self.mock_trolley.rect = pygame.Rect(500, 260, 40, 64)
+        self.mediator.track(self.mock_trolley)
+
+        # Action & Assert: not taken while far
+        self.mediator.take_trolley()
+        assert self.mock_trolley.taken is False
+
+        # Action & Assert: trolley rolled next to player
+        self.mock_trolley.rect.x = 110
+        self.mediator.track(self.mock_trolley)
+        self.mediator.take_trolley()
+        assert self.mock_trolley.taken is True
+        assert self.mediator.spatial_hash.stats()["queries"] == 2
+
+    def test_nearest_interactable(self):
+        # Setup: both are within reach, trolley is nearer
+        self.mock_trolley.scene_name = ENTRANCE
+        self.mock_bag.scene_name = ENTRANCE
+        self.mock_player.rect = pygame.Rect(100, 240, 31, 84)
+        self.mock_trolley.rect = pygame.Rect(136, 260, 40, 64)
+        self.mock_bag.rect = pygame.Rect(58, 290, 40, 34)
+        self.mediator.track(self.mock_trolley)
+        self.mediator.track(self.mock_bag)
+
+        # Action & Assert
+        assert self.mediator.nearest_interactable(reach=10) is self.mock_trolley
+        assert self.mediator.nearest_interactable(reach=0) is None
+        self.mediator.current_scene = YARD
+        assert self.mediator.nearest_interactable(reach=10) is None
+
+    def test_nearest_interactable_returns_item_handle(self):
+        # Setup: the first item of a store, entity id 0, next to the player
+        self.mock_player.rect = pygame.Rect(100, 240, 31, 84)
+        handle = ItemHandle(Mock(), 0)
+        self.mediator.spatial_hash.update(handle, ENTRANCE, (135, 304, 10, 20))
+
+        # Action
+        nearest = self.mediator.nearest_interactable(reach=10)
+
+        # Assert: items are told apart from game objects, even entity id 0
+        assert isinstance(nearest, ItemHandle)
+        assert nearest.entity == 0
+
+    def test_take_trolley_ignores_transparent_padding(self):
+        # Setup: rects overlap only where the trolley image is transparent
+        self.mock_trolley.scene_name = ENTRANCE
+        self.mock_player.rect = pygame.Rect(100, 240, 31, 84)
+        self.mock_trolley.rect = pygame.Rect(120, 260, 40, 64)
+        self.mock_trolley.image = pygame.Surface((40, 64), pygame.SRCALPHA)
+        self.mock_trolley.image.fill((255, 255, 255, 255), pygame.Rect(20, 0, 20, 64))
+        self.mediator.track(self.mock_trolley)
+
+        # Action & Assert: not taken through the padding
+        self.mediator.take_trolley()
+        assert self.mock_trolley.taken is False
+
+        # Action & Assert: taken when the opaque pixels touch
+        self.mock_trolley.rect.x = 105
+        self.mediator.track(self.mock_trolley)
+        self.mediator.take_trolley()
+        assert self.mock_trolley.taken is True
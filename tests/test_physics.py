@@ -0,0 +1,128 @@
+"""Unit tests for the pure game rules"""
+import numpy as np
+import pygame
+from core.physics import (approaching_side, at_front_door, door_spawn_left,
+                          exit_side, fall, overlaps, pixels_overlap,
+                          release_speed, roll, run_animation, spawn_left,
+                          trolley_anchor, walk)
+from utils.constants import (CENTER, EDGE_MARGIN, FIVE, GROUND_LEVEL, LEFT,
+                             PREFETCH_MARGIN, PUSH_SPEED, RIGHT,
+                             RUN_ANIM_SPEED, SCREEN_WIDTH, TROLLEY_X)
+
+
+class TestPhysics:
+    """Test core.physics functions"""
+
+    def test_walk(self):
+        # Action & Assert
+        assert walk(100, is_left=True) == 100 - FIVE
+        assert walk(100, is_left=False) == 100 + FIVE
+
+    def test_fall_standing_player_stays_on_ground(self):
+        # Action
+        y, velocity_y, is_jumping = fall(GROUND_LEVEL - 84, 84, 0, False, 1, 200)
+
+        # Assert
+        assert (y, velocity_y, is_jumping) == (GROUND_LEVEL - 84, 0, False)
+
+    def test_fall_jump_rises_stops_at_ceiling_and_lands(self):
+        # Setup
+        y, velocity_y, is_jumping = GROUND_LEVEL - 84, -10, True
+        heights = []
+
+        # Action
+        while is_jumping:
+            y, velocity_y, is_jumping = fall(y, 84, velocity_y, is_jumping, 1, 200)
+            heights.append(y)
+
+        # Assert
+        assert heights[0] == GROUND_LEVEL - 84 - 9
+        assert min(heights) == 200
+        assert heights[-1] == GROUND_LEVEL - 84
+        assert velocity_y == 0
+
+    def test_roll_slows_down_and_stops(self):
+        # Setup
+        x, speed = 300, 5.0
+
+        # Action
+        for _ in range(100):
+            x, speed = roll(x, speed, taken=False)
+
+        # Assert
+        assert x > 300
+        assert speed == 0
+
+    def test_roll_taken_trolley_does_not_roll(self):
+        # Action & Assert
+        assert roll(300, 5.0, taken=True) == (300, 5.0)
+
+    def test_roll_clamps_to_screen_edges(self):
+        # Action & Assert
+        assert roll(0, 0, taken=False)[0] == EDGE_MARGIN
+        assert roll(0, 0, taken=True)[0] == EDGE_MARGIN
+        assert roll(SCREEN_WIDTH, 0, taken=False)[0] == SCREEN_WIDTH - EDGE_MARGIN * FIVE
+        assert roll(SCREEN_WIDTH, 0, taken=True)[0] == SCREEN_WIDTH
+
+    def test_trolley_anchor_and_release_speed(self):
+        # Action & Assert
+        assert trolley_anchor(100, GROUND_LEVEL) == (100 + TROLLEY_X, GROUND_LEVEL)
+        assert release_speed(is_left=True) == -PUSH_SPEED
+        assert release_speed(is_left=False) == PUSH_SPEED
+
+    def test_exit_and_approaching_side(self):
+        # Setup
+        far = EDGE_MARGIN + PREFETCH_MARGIN + 1
+
+        # Action & Assert
+        assert exit_side(EDGE_MARGIN, 100) == LEFT
+        assert exit_side(500, SCREEN_WIDTH - EDGE_MARGIN) == RIGHT
+        assert exit_side(400, 431) is None
+        assert approaching_side(far - 1, 200) == LEFT
+        assert approaching_side(500, SCREEN_WIDTH - far + 1) == RIGHT
+        assert approaching_side(far, SCREEN_WIDTH - far) is None
+
+    def test_spawn_left_mirrors_exit_side(self):
+        # Action & Assert
+        assert spawn_left(LEFT, 31) + 31 == SCREEN_WIDTH - EDGE_MARGIN - FIVE
+        assert spawn_left(RIGHT, 31) == EDGE_MARGIN + FIVE
+
+    def test_front_door(self):
+        # Action & Assert
+        assert at_front_door(230) and at_front_door(460)
+        assert not at_front_door(229) and not at_front_door(461)
+        assert door_spawn_left() == CENTER
+
+    def test_overlaps_matches_colliderect(self):
+        # Setup
+        base = (100, 100, 50, 50)
+        others = [(149, 149, 10, 10), (150, 100, 10, 10), (60, 60, 40, 40),
+                  (90, 90, 100, 100), (120, 120, 0, 10), (0, 0, 10, 10)]
+
+        # Action & Assert
+        for other in others:
+            assert overlaps(base, other) == pygame.Rect(base).colliderect(pygame.Rect(other))
+
+    def test_run_animation_cycles_images(self):
+        # Setup
+        frame = 0
+        images = []
+
+        # Action
+        for _ in range(2 * RUN_ANIM_SPEED):
+            frame, image = run_animation(frame, True, 2)
+            images.append(image)
+
+        # Assert: the first image is shown one step less on the first cycle, like Player
+        assert images == [0] * (RUN_ANIM_SPEED - 1) + [1] * RUN_ANIM_SPEED + [0]
+        assert run_animation(frame, False, 2) == (frame, None)
+
+    def test_pixels_overlap_compares_footprints(self):
+        # Setup: an L of opaque pixels whose bounding box covers the empty corner
+        corner = np.array([[True, False], [True, True]])
+
+        # Action & Assert
+        assert pixels_overlap((0, 0, 2, 2), corner, (1, 1, 1, 1), None)
+        assert not pixels_overlap((0, 0, 2, 2), corner, (1, 0, 1, 1), None)
+        assert pixels_overlap((0, 0, 2, 2), None, (1, 0, 1, 1), None)
+        assert not pixels_overlap((0, 0, 2, 2), corner, (2, 0, 1, 1), None)
@@ -0,0 +1,147 @@
+"""Unit tests for pixel_cache.py"""
+import os
+import struct
+import pygame
+import utils.helpers
+from utils.constants import PIXEL_CACHE_ALIGNMENT
+from utils.helpers import load_image
+from utils.mapped_file import MAPPED_FILE_HEADER
+from utils.pixel_cache import PIXEL_CACHE_MAGIC, PixelCache, build_pixel_cache, main
+
+
+class TestPixelCache:
+    """Test PixelCache class and the cache build"""
+
+    def setup_method(self):
+        # Setup
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def make_images(self, tmp_path):
+        # Setup: one opaque and one translucent image in a graphics directory
+        root = tmp_path / "graphics"
+        (root / "items").mkdir(parents=True)
+        opaque = pygame.Surface((3, 2))
+        opaque.fill((10, 20, 30))
+        translucent = pygame.Surface((5, 4), pygame.SRCALPHA)
+        translucent.fill((200, 100, 50, 128))
+        pygame.image.save(opaque, str(root / "ground.png"))
+        pygame.image.save(translucent, str(root / "items" / "bag.png"))
+        return str(root), str(tmp_path / "graphics.cache")
+
+    def test_build_aligns_pixel_data(self, tmp_path):
+        # Setup
+        root, cache_path = self.make_images(tmp_path)
+
+        # Action
+        result = build_pixel_cache(cache_path, root)
+
+        # Assert
+        with open(cache_path, "rb") as file:
+            magic, _, index_size = MAPPED_FILE_HEADER.unpack(file.read(MAPPED_FILE_HEADER.size))
+        assert result["images"] == 2
+        assert magic == PIXEL_CACHE_MAGIC
+        assert (MAPPED_FILE_HEADER.size + index_size) % PIXEL_CACHE_ALIGNMENT == 0
+        assert not os.path.exists(f"{cache_path}.tmp")
+
+    def test_load_builds_surface_from_cached_pixels(self, tmp_path):
+        # Setup
+        root, cache_path = self.make_images(tmp_path)
+        build_pixel_cache(cache_path, root)
+        cache = PixelCache(cache_path, root)
+
+        # Action
+        ground = cache.load(os.path.join(root, "ground.png"))
+        bag = cache.load(os.path.join(root, "items", "bag.png"))
+
+        # Assert: pixels match the decoded PNGs
+        assert ground.get_size() == (3, 2)
+        assert ground.get_at((0, 0)) == (10, 20, 30, 255)
+        assert bag.convert_alpha().get_at((4, 3)) == (200, 100, 50, 128)
+        assert cache.stats() == {"images": 2, "hits": 2, "misses": 0, "stale": 0}
+
+    def test_load_misses_uncached_images(self, tmp_path):
+        # Setup
+        root, cache_path = self.make_images(tmp_path)
+        cache = PixelCache(cache_path, root)
+
+        # Action & Assert: no cache file and images outside the graphics directory are misses
+        assert cache.load(os.path.join(root, "ground.png")) is None
+        assert cache.load(str(tmp_path / "other.png")) is None
+        assert cache.misses == 2
+
+    def test_changed_source_is_stale(self, tmp_path):
+        # Setup
+        root, cache_path = self.make_images(tmp_path)
+        build_pixel_cache(cache_path, root)
+        cache = PixelCache(cache_path, root)
+        path = os.path.join(root, "ground.png")
+        changed = pygame.Surface((3, 2))
+        changed.fill((255, 255, 255))
+        pygame.image.save(changed, path)
+
+        # Action
+        image = cache.load(path)
+
+        # Assert
+        assert image is None
+        assert cache.stale == 1
+        assert cache.verify() == ["ground.png"]
+
+    def test_touched_source_with_same_content_is_fresh(self, tmp_path):
+        # Setup
+        root, cache_path = self.make_images(tmp_path)
+        build_pixel_cache(cache_path, root)
+        cache = PixelCache(cache_path, root)
+        path = os.path.join(root, "ground.png")
+        os.utime(path, ns=(0, 0))
+
+        # Action & Assert
+        assert cache.load(path) is not None
+        assert cache.stale == 0
+
+    def test_other_version_is_ignored(self, tmp_path):
+        # Setup: overwrite the version in the header
+        root, cache_path = self.make_images(tmp_path)
+        build_pixel_cache(cache_path, root)
+        with open(cache_path, "r+b") as file:
+            file.seek(len(PIXEL_CACHE_MAGIC))
+            file.write(struct.pack("<I", 999))
+        cache = PixelCache(cache_path, root)
+
+        # Action & Assert
+        assert cache.load(os.path.join(root, "ground.png")) is None
+        assert cache.stats()["images"] == 0
+
+    def test_verify_lists_uncached_images(self, tmp_path):
+        # Setup
+        root, cache_path = self.make_images(tmp_path)
+        build_pixel_cache(cache_path, root)
+        pygame.image.save(pygame.Surface((1, 1)), os.path.join(root, "new.png"))
+
+        # Action & Assert
+        assert PixelCache(cache_path, root).verify() == ["new.png"]
+
+    def test_main_builds_and_verifies(self, tmp_path, capsys):
+        # Setup
+        root, cache_path = self.make_images(tmp_path)
+
+        # Action & Assert
+        assert main(["verify", "--cache", cache_path, "--root", root]) == 1
+        assert main(["build", "--cache", cache_path, "--root", root]) == 0
+        assert main(["verify", "--cache", cache_path, "--root", root]) == 0
+        assert "Cached 2 images" in capsys.readouterr().out
+
+    def test_load_image_reads_pixel_cache(self, tmp_path, monkeypatch):
+        # Setup
+        root, cache_path = self.make_images(tmp_path)
+        build_pixel_cache(cache_path, root)
+        cache = PixelCache(cache_path, root)
+        monkeypatch.setattr(utils.helpers, "pixel_cache", cache)
+
+        # Action
+        image = load_image(os.path.join(root, "ground.png"), shared=False)
+
+        # Assert
+        assert cache.hits == 1
+        assert image.get_at((1, 1)) == (10, 20, 30, 255)
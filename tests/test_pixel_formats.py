@@ -0,0 +1,145 @@
+"""Unit tests for pixel_formats.py"""
+import pygame
+from utils.constants import (PIXEL_FORMAT_ALPHA, PIXEL_FORMAT_AUTO, PIXEL_FORMAT_COLORKEY,
+                             PIXEL_FORMAT_COLORKEYS, PIXEL_FORMAT_OPAQUE)
+from utils.helpers import load_image
+from utils.pixel_formats import (analyze_assets, analyze_image, convert_image, estimated_saving,
+                                 main, optimize_image)
+
+
+class TestPixelFormats:
+    """Test the pixel format analysis and conversion"""
+
+    def setup_method(self):
+        # Setup
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def make_sprite(self, alpha: int, width: int = 4) -> pygame.Surface:
+        # Setup: left column opaque red, the rest transparent or translucent
+        sprite = pygame.Surface((width, 2), pygame.SRCALPHA)
+        sprite.fill((0, 0, 255, alpha))
+        sprite.fill((255, 0, 0, 255), pygame.Rect(0, 0, 1, 2))
+        return sprite
+
+    def test_opaque_image(self):
+        # Setup
+        ground = pygame.Surface((4, 2), pygame.SRCALPHA)
+        ground.fill((10, 20, 30, 255))
+
+        # Action
+        analysis = analyze_image(ground)
+
+        # Assert
+        assert analysis["format"] == PIXEL_FORMAT_OPAQUE
+        assert not analysis["rle"]
+        assert not convert_image(ground, PIXEL_FORMAT_AUTO).get_flags() & pygame.SRCALPHA
+
+    def test_image_without_alpha_is_opaque_without_scanning(self):
+        # Action & Assert
+        assert analyze_image(pygame.Surface((4, 2)))["format"] == PIXEL_FORMAT_OPAQUE
+
+    def test_binary_alpha_image_gets_rle_colorkey(self):
+        # Setup
+        sprite = self.make_sprite(0)
+
+        # Action
+        analysis = analyze_image(sprite)
+        keyed = optimize_image(sprite, analysis)
+
+        # Assert: transparent pixels show the key, which blits skip
+        assert analysis["format"] == PIXEL_FORMAT_COLORKEY
+        assert analysis["transparent"] == 0.75
+        assert keyed.get_colorkey()[:3] == PIXEL_FORMAT_COLORKEYS[0]
+        assert keyed.get_flags() & pygame.RLEACCELOK
+        target = pygame.Surface((4, 2))
+        target.fill((0, 255, 0))
+        target.blit(keyed, (0, 0))
+        assert target.get_at((0, 0))[:3] == (255, 0, 0)
+        assert target.get_at((3, 1))[:3] == (0, 255, 0)
+
+    def test_colorkey_skips_colors_of_opaque_pixels(self):
+        # Setup: the first key color is drawn in the sprite
+        sprite = self.make_sprite(0)
+        sprite.fill((*PIXEL_FORMAT_COLORKEYS[0], 255), pygame.Rect(0, 0, 1, 1))
+
+        # Action
+        analysis = analyze_image(sprite)
+
+        # Assert
+        assert analysis["colorkey"] == PIXEL_FORMAT_COLORKEYS[1]
+
+    def test_translucent_image_keeps_alpha(self):
+        # Setup: one translucent and one transparent column
+        sprite = self.make_sprite(0)
+        sprite.fill((0, 0, 255, 128), pygame.Rect(1, 0, 1, 2))
+
+        # Action
+        analysis = analyze_image(sprite)
+        converted = optimize_image(sprite, analysis)
+
+        # Assert: half of the pixels are transparent, enough to RLE encode
+        assert analysis["format"] == PIXEL_FORMAT_ALPHA
+        assert analysis["translucent"] == 0.25
+        assert analysis["rle"]
+        assert converted.get_flags() & pygame.SRCALPHA
+        assert converted.get_flags() & pygame.RLEACCELOK
+
+    def test_dense_translucent_image_is_not_rle_encoded(self):
+        # Action
+        analysis = analyze_image(self.make_sprite(128))
+
+        # Assert
+        assert analysis["format"] == PIXEL_FORMAT_ALPHA
+        assert not analysis["rle"]
+
+    def test_explicit_formats(self):
+        # Setup
+        ground = pygame.Surface((4, 2))
+
+        # Action & Assert
+        assert convert_image(ground, PIXEL_FORMAT_ALPHA).get_flags() & pygame.SRCALPHA
+        assert not convert_image(self.make_sprite(0), PIXEL_FORMAT_OPAQUE).get_flags() & pygame.SRCALPHA
+
+    def test_estimated_saving(self):
+        # Action & Assert: copying opaque pixels saves most, blending every pixel nothing
+        assert estimated_saving(analyze_image(pygame.Surface((4, 2)))) == 0.8
+        assert estimated_saving(analyze_image(self.make_sprite(128))) == 0.0
+        assert estimated_saving(analyze_image(self.make_sprite(0))) > 0.8
+
+    def test_load_image_picks_format(self, tmp_path):
+        # Setup
+        path = str(tmp_path / "ground.png")
+        pygame.image.save(pygame.Surface((4, 2)), path)
+
+        # Action
+        image = load_image(path, shared=False)
+
+        # Assert
+        assert not image.get_flags() & pygame.SRCALPHA
+
+    def test_analyze_assets_reports_savings(self, tmp_path):
+        # Setup
+        (tmp_path / "items").mkdir()
+        pygame.image.save(pygame.Surface((4, 2)), str(tmp_path / "ground.png"))
+        pygame.image.save(self.make_sprite(0), str(tmp_path / "items" / "bag.png"))
+
+        # Action
+        report = analyze_assets(str(tmp_path), rounds=1)
+
+        # Assert
+        assert [entry["name"] for entry in report] == ["ground.png", "items/bag.png"]
+        assert [entry["format"] for entry in report] == [PIXEL_FORMAT_OPAQUE, PIXEL_FORMAT_COLORKEY]
+        assert all(entry["alpha_us"] > 0 and entry["optimized_us"] > 0 for entry in report)
+
+    def test_main_prints_report(self, tmp_path, capsys):
+        # Setup
+        pygame.image.save(pygame.Surface((4, 2)), str(tmp_path / "ground.png"))
+
+        # Action
+        assert main(["--root", str(tmp_path), "--rounds", "1"]) == 0
+
+        # Assert
+        output = capsys.readouterr().out
+        assert "ground.png" in output
+        assert "saved" in output
@@ -143,3 +143,18 @@ class TestPlayer:
             self.player.image,
             self.player.rect
         )
+
+    def test_player_draw_interpolates_between_steps(self):
+        # Setup: player moved 10 pixels right during the latest step
+        self.player.save_position()
+        start_x = self.player.rect.x
+        self.player.rect.x += 10
+
+        # Action
+        self.player.draw(0.5)
+
+        # Assert: drawn halfway
+        self.screen.screen.blit.assert_called_once_with(
+            self.player.image,
+            (start_x + 5, self.player.rect.y)
+        )
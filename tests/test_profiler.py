@@ -0,0 +1,96 @@
+"""Unit tests for FrameProfiler class"""
+import csv
+import pygame
+from unittest.mock import patch
+from control.profiler import FrameProfiler, PHASES
+
+
+class TestFrameProfiler:
+    """Test FrameProfiler class"""
+
+    def setup_method(self):
+        # Setup
+        self.profiler = FrameProfiler(phases=("input", "draw"), capacity=4)
+
+    def record_frame(self, input_ns, draw_ns):
+        """Record one frame with given phase durations."""
+        with patch("control.profiler.perf_counter_ns", side_effect=[0, input_ns, input_ns + draw_ns]):
+            self.profiler.start_frame()
+            self.profiler.mark()
+            self.profiler.mark()
+
+    def test_default_phases_match_game_loop(self):
+        # Assert: input, three updates, edge transition, four draws, audio, display update, clock tick
+        assert len(PHASES) == 12
+        assert FrameProfiler().capacity > 0
+
+    def test_repeated_phase_adds_up(self):
+        # Setup: input marked twice in one frame, 1 ms and 2 ms
+        with patch("control.profiler.perf_counter_ns", side_effect=[0, 1_000_000, 3_000_000, 4_000_000]):
+            self.profiler.start_frame()
+            self.profiler.mark()
+            self.profiler.repeat("input")
+            self.profiler.mark()
+            self.profiler.mark()
+
+        # Assert
+        assert self.profiler.frames == 1
+        assert self.profiler.percentiles("input")[0] == 3.0
+        assert self.profiler.percentiles("draw")[0] == 1.0
+
+    def test_no_frames_gives_zero_percentiles(self):
+        # Assert
+        assert self.profiler.percentiles("input") == (0.0, 0.0, 0.0)
+
+    def test_percentiles(self):
+        # Action: durations of 1, 2, 3 and 4 ms
+        for ms in (1, 2, 3, 4):
+            self.record_frame(ms * 1_000_000, 1_000_000)
+
+        # Assert
+        p50, p95, p99 = self.profiler.percentiles("input")
+        assert p50 in (2.0, 3.0)
+        assert p95 == 4.0
+        assert p99 == 4.0
+        assert self.profiler.percentiles("draw") == (1.0, 1.0, 1.0)
+
+    def test_ring_buffer_keeps_latest_frames(self):
+        # Action: six frames into a buffer of four
+        for ms in (9, 9, 1, 1, 1, 1):
+            self.record_frame(ms * 1_000_000, 0)
+
+        # Assert: oldest frames are overwritten
+        assert self.profiler.frames == 4
+        assert self.profiler.percentiles("input") == (1.0, 1.0, 1.0)
+
+    def test_dump_csv(self, tmp_path):
+        # Setup
+        for ms in (1, 2, 3, 4, 5):
+            self.record_frame(ms, 10)
+        path = tmp_path / "profile.csv"
+
+        # Action
+        self.profiler.dump_csv(str(path))
+
+        # Assert: header and latest four frames, oldest first
+        with open(path, newline="") as file:
+            rows = list(csv.reader(file))
+        assert rows[0] == ["frame", "input ns", "draw ns"]
+        assert [row[1] for row in rows[1:]] == ["2", "3", "4", "5"]
+
+    def test_draw_overlay(self):
+        pygame.init()
+        try:
+            # Setup
+            self.record_frame(1_000_000, 2_000_000)
+            surface = pygame.Surface((800, 400))
+
+            # Action
+            rect = self.profiler.draw(surface)
+
+            # Assert: one line per phase plus header drawn in the top left corner
+            assert len(self.profiler._overlay) == 3
+            assert rect.topleft == (0, 0)
+            assert rect.width > 0 and rect.height > 0
+        finally:
+            pygame.quit()
@@ -0,0 +1,131 @@
+"""Unit tests for DirtyRectRenderer class"""
+import pygame
+from unittest.mock import Mock, patch
+from game_objects.renderer import DirtyRectRenderer
+from utils.constants import ENTRANCE, YARD
+
+
+class TestDirtyRectRenderer:
+    """Test DirtyRectRenderer class"""
+
+    def setup_method(self):
+        # Setup: sprites that report where they were drawn
+        self.background = Mock()
+        self.mediator = Mock()
+        self.mediator.current_scene = ENTRANCE
+        self.player = Mock()
+        self.player.draw.return_value = pygame.Rect(100, 100, 20, 40)
+        self.trolley = Mock()
+        self.trolley.draw.return_value = None
+
+        self.renderer = DirtyRectRenderer(
+            self.background,
+            (self.player, self.trolley),
+            self.mediator
+        )
+
+    def test_first_frame_draws_full_background(self):
+        # Action
+        self.renderer.draw()
+        with patch("pygame.display.update") as mock_update:
+            self.renderer.present()
+
+        # Assert: full redraw and full display update
+        self.background.draw.assert_called_once()
+        self.background.restore.assert_not_called()
+        mock_update.assert_called_once_with()
+
+    def test_next_frame_restores_only_old_rects(self):
+        # Setup: first frame
+        self.renderer.draw()
+
+        # Action: player moves five pixels
+        self.player.draw.return_value = pygame.Rect(105, 100, 20, 40)
+        self.renderer.draw()
+        with patch("pygame.display.update") as mock_update:
+            self.renderer.present()
+
+        # Assert: background drawn only once, old rect restored, old and new rects updated
+        self.background.draw.assert_called_once()
+        self.background.restore.assert_called_once_with(pygame.Rect(100, 100, 20, 40))
+        mock_update.assert_called_once_with([
+            pygame.Rect(100, 100, 20, 40),
+            pygame.Rect(105, 100, 20, 40)
+        ])
+
+    def test_scene_change_forces_full_redraw(self):
+        # Setup: first frame
+        self.renderer.draw()
+
+        # Action: scene changes
+        self.mediator.current_scene = YARD
+        self.renderer.draw()
+
+        # Assert
+        assert self.background.draw.call_count == 2
+        self.background.restore.assert_not_called()
+
+    def test_invalidate_forces_full_redraw(self):
+        # Setup: first frame
+        self.renderer.draw()
+
+        # Action
+        self.renderer.invalidate()
+        self.renderer.draw()
+
+        # Assert
+        assert self.background.draw.call_count == 2
+
+    def test_add_dirty_extends_partial_update(self):
+        # Setup: two frames so the second one is a partial update
+        self.renderer.draw()
+        self.renderer.draw()
+        extra = pygame.Rect(0, 0, 50, 50)
+
+        # Action
+        self.renderer.add_dirty(extra)
+        with patch("pygame.display.update") as mock_update:
+            self.renderer.present()
+
+        # Assert
+        assert extra in mock_update.call_args.args[0]
+
+    def test_add_dirty_area_is_restored_next_frame(self):
+        # Setup: overlay drawn over the first frame
+        self.renderer.draw()
+        overlay = pygame.Rect(0, 0, 120, 60)
+        self.renderer.add_dirty(overlay)
+
+        # Action: a narrower overlay is drawn on the next frame
+        self.renderer.draw()
+        self.renderer.add_dirty(pygame.Rect(0, 0, 80, 60))
+        with patch("pygame.display.update") as mock_update:
+            self.renderer.present()
+
+        # Assert: the wider overlay area is restored and updated
+        self.background.restore.assert_any_call(overlay)
+        assert overlay in mock_update.call_args.args[0]
+
+    def test_sprite_returning_many_rects(self):
+        # Setup: items sprite draws several rects at once
+        items = Mock()
+        items.draw.return_value = [pygame.Rect(10, 10, 5, 5), pygame.Rect(30, 10, 5, 5)]
+        renderer = DirtyRectRenderer(self.background, (self.player, items), self.mediator)
+        renderer.draw()
+
+        # Action
+        renderer.draw()
+
+        # Assert: every rect of the previous frame is restored
+        assert self.background.restore.call_count == 3
+
+    def test_sprites_outside_current_scene_are_not_drawn(self):
+        # Setup: trolley is in another scene
+        self.mediator.in_current_scene.side_effect = lambda sprite: sprite is self.player
+
+        # Action
+        self.renderer.draw()
+
+        # Assert
+        self.player.draw.assert_called_once()
+        self.trolley.draw.assert_not_called()
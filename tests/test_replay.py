@@ -0,0 +1,88 @@
+"""Unit tests for command recording and replay"""
+import pygame
+import pytest
+from unittest.mock import Mock
+from control.game_factory import create_game
+from control.replay import (CommandRecorder, HEADER, ReplayInputHandler,
+                            load_recording)
+from utils.commands import Command
+
+
+class TestCommandRecorder:
+    """Test CommandRecorder class and load_recording function"""
+
+    def test_recording_round_trip(self, tmp_path):
+        # Setup
+        path = tmp_path / "session.rec"
+        recorder = CommandRecorder(str(path), framerate=60)
+
+        # Action: three frames, the middle one empty
+        recorder.record(Command.MOVE_RIGHT)
+        recorder.record(Command.JUMP)
+        recorder.end_frame()
+        recorder.end_frame()
+        recorder.record(Command.STOP_MOVING)
+        recorder.end_frame()
+        recorder.close()
+
+        # Assert
+        framerate, frames = load_recording(str(path))
+        assert framerate == 60
+        assert frames == [(Command.MOVE_RIGHT, Command.JUMP), (), (Command.STOP_MOVING,)]
+        assert recorder.frames == 3
+
+        # Assert: one byte per frame plus one per command
+        assert path.stat().st_size == HEADER.size + 3 + 3
+
+    def test_load_recording_rejects_other_files(self, tmp_path):
+        # Setup
+        path = tmp_path / "not_a_recording.rec"
+        path.write_bytes(b"hello world")
+
+        # Action & Assert
+        with pytest.raises(ValueError):
+            load_recording(str(path))
+
+
+class TestReplayInputHandler:
+    """Test ReplayInputHandler class"""
+
+    def test_replays_one_frame_per_call(self):
+        # Setup
+        mediator = Mock()
+        replay = ReplayInputHandler(mediator, [(Command.MOVE_LEFT,), (Command.JUMP, Command.TAKE_TROLLEY)])
+
+        # Action & Assert: first frame
+        replay.process_input()
+        mediator.queue_command.assert_called_once_with(Command.MOVE_LEFT)
+        assert not replay.done
+
+        # Action & Assert: second frame ends the replay
+        replay.process_input()
+        assert mediator.queue_command.call_count == 3
+        assert replay.done
+
+        # Action & Assert: nothing is sent after the end
+        replay.process_input()
+        assert mediator.queue_command.call_count == 3
+
+    def test_replay_is_deterministic(self):
+        # Setup: walk right, jump and walk through the yard
+        frames = [(Command.MOVE_RIGHT,)] * 150 + [(Command.JUMP,)] + [(Command.MOVE_RIGHT,)] * 100
+
+        def play():
+            pygame.init()
+            try:
+                game = create_game()
+                game.screen.framerate = 0
+                game.timestep = None
+                game.input_handler = ReplayInputHandler(game.mediator, frames)
+                while not game.input_handler.done:
+                    pygame.event.pump()
+                    game.run()
+                return game.mediator.current_scene, tuple(game.player.rect), tuple(game.trolley.rect)
+            finally:
+                pygame.quit()
+
+        # Action & Assert: two replays end in the same state
+        assert play() == play()
@@ -0,0 +1,94 @@
+"""Unit tests for scene graph"""
+import json
+import os
+import pytest
+from utils.constants import (BALLROOM, DOWN, ELEVATOR, ENTRANCE, GARAGE,
+                             GRAPHICS_PATH, LEFT, LUGGAGE, MUSIC_YARD,
+                             RECEPTION, RIGHT, SOFAS, SOUNDS_PATH, UP, YARD)
+from utils.scene_graph import Scene, SceneGraph, load_scene_graph
+
+
+class TestSceneGraph:
+    """Test SceneGraph class and load_scene_graph function"""
+
+    def test_default_scene_graph(self):
+        # Action
+        graph = load_scene_graph()
+
+        # Assert: the hotel map
+        assert graph.start == ENTRANCE
+        assert len(graph) == 8
+        expected = {
+            (BALLROOM, RIGHT): GARAGE,
+            (BALLROOM, LEFT): None,
+            (ELEVATOR, LEFT): RECEPTION,
+            (ELEVATOR, RIGHT): None,
+            (ENTRANCE, LEFT): YARD,
+            (ENTRANCE, RIGHT): YARD,
+            (ENTRANCE, UP): RECEPTION,
+            (GARAGE, LEFT): BALLROOM,
+            (GARAGE, RIGHT): LUGGAGE,
+            (LUGGAGE, LEFT): GARAGE,
+            (LUGGAGE, RIGHT): SOFAS,
+            (RECEPTION, LEFT): SOFAS,
+            (RECEPTION, RIGHT): ELEVATOR,
+            (RECEPTION, DOWN): ENTRANCE,
+            (RECEPTION, UP): None,
+            (SOFAS, LEFT): LUGGAGE,
+            (SOFAS, RIGHT): RECEPTION,
+            (YARD, LEFT): ENTRANCE,
+            (YARD, RIGHT): ENTRANCE,
+        }
+        for (scene, side), neighbour in expected.items():
+            assert graph.neighbour(scene, side) == neighbour
+
+        # Assert: only the yard has music
+        assert graph.music(YARD) == MUSIC_YARD
+        assert graph.music(ENTRANCE) is None
+        assert graph.music(None) is None
+
+    def test_scene_ids_follow_name_order(self):
+        # Setup
+        graph = load_scene_graph()
+
+        # Assert
+        assert [graph.scene_id(name) for name in sorted(graph.scenes)] == list(range(len(graph)))
+        assert graph.scene_id("sauna") == -1
+
+    def test_default_scene_graph_files_exist(self):
+        # Setup
+        graph = load_scene_graph()
+
+        # Assert
+        for scene in graph.scenes.values():
+            assert os.path.exists(os.path.join(GRAPHICS_PATH, "hotel", scene.ground))
+            assert os.path.exists(os.path.join(GRAPHICS_PATH, "hotel", scene.sky))
+            if scene.music is not None:
+                assert os.path.exists(os.path.join(SOUNDS_PATH, scene.music))
+
+    def test_unknown_exit_target_raises(self):
+        # Setup
+        scenes = {"corridor": Scene("corridor", "a.png", "b.png", None, {LEFT: "sauna"})}
+
+        # Action & Assert
+        with pytest.raises(ValueError):
+            SceneGraph(scenes, "corridor")
+
+    def test_unknown_start_or_side_raises(self):
+        # Setup
+        scenes = {"corridor": Scene("corridor", "a.png", "b.png", None, {"diagonal": "corridor"})}
+
+        # Action & Assert
+        with pytest.raises(ValueError):
+            SceneGraph(scenes, "corridor")
+        with pytest.raises(ValueError):
+            SceneGraph({}, "corridor")
+
+    def test_load_invalid_file_raises(self, tmp_path):
+        # Setup: scene without a sky image
+        path = tmp_path / "scenes.json"
+        path.write_text(json.dumps({"start": "bar", "scenes": {"bar": {"ground": "a.png"}}}))
+
+        # Action & Assert
+        with pytest.raises(ValueError):
+            load_scene_graph(str(path))
@@ -0,0 +1,50 @@
+"""Unit tests for SceneIndex class"""
+from core.scene_index import SceneIndex
+from utils.constants import ENTRANCE, RECEPTION, YARD
+
+
+class TestSceneIndex:
+    """Test SceneIndex class"""
+
+    def setup_method(self):
+        # Setup
+        self.index = SceneIndex()
+        self.player = object()
+        self.trolley = object()
+        self.bag = object()
+        self.index.carry(self.player)
+        self.index.place(self.trolley, ENTRANCE)
+        self.index.place(self.bag, YARD)
+
+    def test_members_are_placed_then_carried(self):
+        # Action & Assert
+        assert self.index.members(ENTRANCE) == [self.trolley, self.player]
+        assert self.index.members(YARD) == [self.bag, self.player]
+        assert self.index.members(RECEPTION) == [self.player]
+
+    def test_contains(self):
+        # Action & Assert
+        assert self.index.contains(self.player, RECEPTION)
+        assert self.index.contains(self.trolley, ENTRANCE)
+        assert not self.index.contains(self.trolley, YARD)
+        assert not self.index.contains(object(), ENTRANCE)
+
+    def test_place_moves_between_scenes(self):
+        # Action
+        self.index.place(self.trolley, YARD)
+
+        # Assert
+        assert self.index.members(ENTRANCE) == [self.player]
+        assert self.index.members(YARD) == [self.bag, self.trolley, self.player]
+        assert self.index.scene_of(self.trolley) == YARD
+
+    def test_carry_and_remove(self):
+        # Action
+        self.index.carry(self.trolley)
+        self.index.remove(self.bag)
+
+        # Assert
+        assert self.index.scene_of(self.trolley) is None
+        assert self.index.members(YARD) == [self.player, self.trolley]
+        assert not self.index.contains(self.bag, YARD)
+        self.index.remove(self.bag)
@@ -0,0 +1,145 @@
+"""Unit tests for ScenePrefetcher class"""
+import pygame
+import pytest
+from unittest.mock import Mock
+from control.scene_prefetcher import ScenePrefetcher
+from game_objects.background import Background
+from utils.asset_registry import registry
+from utils.constants import (DOOR_LEFT, EDGE_MARGIN, ENTRANCE, MUSIC_YARD,
+                             PREFETCH_MARGIN, RECEPTION, SCREEN_WIDTH, YARD)
+from utils.scene_graph import load_scene_graph
+
+# Player bounds near the screen edges, within the prefetch margin
+NEAR_LEFT = (EDGE_MARGIN + PREFETCH_MARGIN - 10, EDGE_MARGIN + PREFETCH_MARGIN + 21)
+NEAR_RIGHT = (SCREEN_WIDTH - EDGE_MARGIN - PREFETCH_MARGIN - 21, SCREEN_WIDTH - EDGE_MARGIN - PREFETCH_MARGIN + 10)
+
+
+class TestScenePrefetcher:
+    """Test ScenePrefetcher class"""
+
+    def setup_method(self):
+        # Setup: real background over the real scene graph, mocked audio and items
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.scene_graph = load_scene_graph()
+        self.screen = Mock()
+        self.background = Background(self.screen, self.scene_graph)
+        self.audio_manager = Mock()
+        self.items = Mock()
+        self.prefetcher = ScenePrefetcher(self.background, self.audio_manager, self.scene_graph, self.items)
+
+    def teardown_method(self):
+        self.prefetcher.close()
+        registry.clear()
+
+    def finish(self):
+        # Wait for the prefetch thread and composite on this thread
+        for decoding in self.prefetcher._pending.values():
+            for _, future in decoding:
+                future.result()
+        self.prefetcher._finish()
+
+    def test_predict_faced_edge(self):
+        # Assert: entrance has the yard on its right
+        assert self.prefetcher.predict(ENTRANCE, *NEAR_RIGHT, is_left=False) == YARD
+        assert self.prefetcher.predict(ENTRANCE, *NEAR_RIGHT, is_left=True) is None
+        assert self.prefetcher.predict(ENTRANCE, 500, 531, is_left=False) is None
+
+    def test_predict_front_door(self):
+        # Assert: the scene behind the entrance door
+        assert self.prefetcher.predict(ENTRANCE, DOOR_LEFT, DOOR_LEFT + 31, is_left=False) == RECEPTION
+
+    def test_update_warms_background_music_and_items(self):
+        # Action
+        self.prefetcher.update(ENTRANCE, *NEAR_RIGHT, is_left=False)
+        self.finish()
+
+        # Assert
+        assert self.background.is_cached(YARD)
+        assert self.background.scene == ENTRANCE
+        self.audio_manager.prefetch_music.assert_called_once_with(MUSIC_YARD)
+        self.items.prefetch.assert_called_once_with(YARD)
+        assert self.prefetcher.requests == 1
+
+    def test_update_prefetches_once_until_scene_change(self):
+        # Action
+        for _ in range(3):
+            self.prefetcher.update(ENTRANCE, *NEAR_RIGHT, is_left=False)
+        self.finish()
+
+        # Assert
+        assert self.prefetcher.requests == 1
+        self.items.prefetch.assert_called_once_with(YARD)
+
+    def test_enter_counts_hit_and_avoided_stall(self):
+        # Setup
+        self.prefetcher.update(ENTRANCE, *NEAR_RIGHT, is_left=False)
+        self.finish()
+
+        # Action
+        self.prefetcher.enter(YARD)
+        self.background.change_background(YARD)
+
+        # Assert: the background did not load the scene images again
+        stats = self.prefetcher.stats()
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 1.0
+        assert stats["avoided_stall_ms"] > 0
+
+    def test_enter_waits_for_late_prefetch(self):
+        # Setup: decoding not finished on the display thread
+        self.prefetcher.update(ENTRANCE, *NEAR_RIGHT, is_left=False)
+
+        # Action
+        self.prefetcher.enter(YARD)
+
+        # Assert
+        assert self.background.is_cached(YARD)
+        assert self.prefetcher.stats()["late"] == 1
+
+    def test_enter_counts_miss(self):
+        # Action: reception was never prefetched
+        self.prefetcher.enter(RECEPTION)
+
+        # Assert
+        assert self.prefetcher.stats() == {"requests": 0, "hits": 0, "late": 0, "misses": 1,
+                                           "hit_rate": 0.0, "avoided_stall_ms": 0.0}
+
+    def test_enter_ignores_cached_scene(self):
+        # Action: the start scene is cached since the background was built
+        self.prefetcher.enter(ENTRANCE)
+
+        # Assert
+        assert self.prefetcher.stats()["misses"] == 0
+
+    def test_cached_background_is_not_decoded_again(self):
+        # Setup
+        self.background.prefetch(YARD)
+
+        # Action
+        self.prefetcher.update(ENTRANCE, *NEAR_RIGHT, is_left=False)
+
+        # Assert: music is still read ahead
+        assert not self.prefetcher._pending
+        self.audio_manager.prefetch_music.assert_called_once_with(MUSIC_YARD)
+
+    def test_update_near_left_edge(self):
+        # Action: yard has the entrance on both sides
+        self.prefetcher.update(YARD, *NEAR_LEFT, is_left=True)
+        self.finish()
+
+        # Assert: the entrance is cached already, nothing is decoded
+        assert self.prefetcher.requests == 1
+        self.items.prefetch.assert_called_once_with(ENTRANCE)
+
+    def test_close_cancels_prefetches_and_stops_the_thread(self):
+        # Setup
+        self.prefetcher.update(ENTRANCE, *NEAR_RIGHT, is_left=False)
+
+        # Action
+        self.prefetcher.close()
+
+        # Assert
+        assert not self.prefetcher._pending
+        with pytest.raises(RuntimeError):
+            self.prefetcher._loader.submit(print)
@@ -0,0 +1,83 @@
+"""Unit tests for SpatialHash class"""
+from core.spatial_hash import SpatialHash
+from utils.constants import ENTRANCE, YARD
+
+
+class TestSpatialHash:
+    """Test SpatialHash class"""
+
+    def setup_method(self):
+        # Setup
+        self.grid = SpatialHash(cell_size=64)
+
+    def test_query_finds_overlapping_objects_in_scene(self):
+        # Setup
+        self.grid.update("trolley", ENTRANCE, (100, 100, 40, 60))
+        self.grid.update("bag", ENTRANCE, (600, 100, 40, 40))
+        self.grid.update("coin", YARD, (100, 100, 10, 10))
+
+        # Action & Assert
+        assert self.grid.query(ENTRANCE, (120, 120, 10, 10)) == ["trolley"]
+        assert self.grid.query(ENTRANCE, (300, 100, 10, 10)) == []
+        assert self.grid.query(YARD, (95, 95, 10, 10)) == ["coin"]
+        assert len(self.grid) == 3
+
+    def test_object_spanning_cells_is_reported_once(self):
+        # Setup: trolley covers four cells
+        self.grid.update("trolley", ENTRANCE, (50, 50, 40, 40))
+
+        # Action
+        found = self.grid.query(ENTRANCE, (0, 0, 200, 200))
+
+        # Assert
+        assert found == ["trolley"]
+        assert self.grid.stats()["candidates"] == 1
+
+    def test_update_rebuckets_only_when_cells_change(self):
+        # Setup
+        self.grid.update("trolley", ENTRANCE, (10, 10, 20, 20))
+
+        # Action: move within the cell, then to another cell and scene
+        self.grid.update("trolley", ENTRANCE, (20, 10, 20, 20))
+        assert self.grid.stats()["rebuckets"] == 0
+        self.grid.update("trolley", YARD, (300, 10, 20, 20))
+
+        # Assert
+        assert self.grid.stats()["rebuckets"] == 1
+        assert self.grid.query(ENTRANCE, (0, 0, 64, 64)) == []
+        assert self.grid.query(YARD, (300, 10, 5, 5)) == ["trolley"]
+
+    def test_nearest_within_reach(self):
+        # Setup
+        self.grid.update("far", ENTRANCE, (160, 100, 20, 20))
+        self.grid.update("near", ENTRANCE, (125, 100, 20, 20))
+
+        # Action & Assert
+        assert self.grid.nearest(ENTRANCE, (100, 100, 20, 20), reach=10) == "near"
+        assert self.grid.nearest(ENTRANCE, (100, 100, 20, 20), reach=50) == "near"
+        assert self.grid.nearest(ENTRANCE, (100, 100, 20, 20), reach=0) is None
+
+    def test_query_visits_only_nearby_cells(self):
+        # Setup: a thousand objects across the scene
+        for index in range(1000):
+            self.grid.update(index, ENTRANCE, ((index * 37) % 780, (index * 53) % 380, 20, 20))
+
+        # Action
+        self.grid.nearest(ENTRANCE, (400, 200, 31, 84), reach=10)
+
+        # Assert: a handful of cells and far fewer candidates than objects
+        stats = self.grid.stats()
+        assert stats["cells_visited"] <= 6
+        assert stats["candidates"] < 100
+
+    def test_remove(self):
+        # Setup
+        self.grid.update("bag", ENTRANCE, (10, 10, 20, 20))
+
+        # Action
+        self.grid.remove("bag")
+        self.grid.remove("bag")
+
+        # Assert
+        assert "bag" not in self.grid
+        assert self.grid.query(ENTRANCE, (0, 0, 64, 64)) == []
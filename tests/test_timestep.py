@@ -0,0 +1,66 @@
+"""Unit tests for FixedTimestep class"""
+from control.timestep import FixedTimestep
+
+
+class FakeClock:
+    """Clock returning a settable time in seconds."""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+class TestFixedTimestep:
+    """Test FixedTimestep class"""
+
+    def setup_method(self):
+        # Setup: 10 steps per second, at most 3 per frame
+        self.clock = FakeClock()
+        self.timestep = FixedTimestep(step_rate=10, max_steps=3, clock=self.clock)
+
+    def test_first_frame_runs_one_step(self):
+        # Action & Assert
+        assert self.timestep.advance() == 1
+        assert self.timestep.alpha == 0.0
+
+    def test_steps_follow_elapsed_time_not_frames(self):
+        # Setup
+        self.timestep.advance()
+
+        # Action & Assert: fast frames run no step until a step is due
+        self.clock.time = 0.05
+        assert self.timestep.advance() == 0
+        assert abs(self.timestep.alpha - 0.5) < 1e-9
+        self.clock.time = 0.1
+        assert self.timestep.advance() == 1
+
+        # Action & Assert: slow frame catches up with several steps
+        self.clock.time = 0.35
+        assert self.timestep.advance() == 2
+        assert abs(self.timestep.alpha - 0.5) < 1e-9
+
+    def test_frame_skip_drops_steps_over_limit(self):
+        # Setup
+        self.timestep.advance()
+
+        # Action: one second stall is ten steps
+        self.clock.time = 1.0
+        steps = self.timestep.advance()
+
+        # Assert: only three run, the rest is dropped
+        assert steps == 3
+        assert self.timestep.stats() == {"frames": 2, "steps": 4, "dropped_steps": 7}
+
+    def test_reset_forgets_elapsed_time(self):
+        # Setup: long pause after the first frame
+        self.timestep.advance()
+        self.clock.time = 60.0
+
+        # Action
+        self.timestep.reset()
+
+        # Assert
+        assert self.timestep.advance() == 1
+        assert self.timestep.dropped_steps == 0
@@ -86,13 +86,3 @@ class TestTrolley:
             self.trolley.image,
             self.trolley.rect
         )
-
-    def test_trolley_draw_not_in_scene(self):
-        # Action
-        self.trolley.taken = False
-        self.trolley.scene_name = "other_scene"
-
-        self.trolley.draw()
-
-        # Assert: blit not called because scene does not match and not taken
-        self.screen.screen.blit.assert_not_called()
@@ -0,0 +1,175 @@
+"""Unit tests for the pygame-free world"""
+import random
+import pygame
+import pytest
+from benchmark import SCENARIOS, ScriptedInputHandler
+from control.game_factory import create_game
+from core.world import World
+from utils.commands import Command
+from utils.constants import (CENTER, ENTRANCE, GROUND_LEVEL, JUMP_CEILING_Y,
+                             PUSH_SPEED, RECEPTION, YARD)
+
+PLAYER_SIZE = (31, 84)
+TROLLEY_SIZE = (40, 60)
+
+
+class TestWorld:
+    """Test World class"""
+
+    def setup_method(self):
+        # Setup
+        self.world = World(PLAYER_SIZE, TROLLEY_SIZE)
+
+    def test_initial_state(self):
+        # Assert
+        assert self.world.current_scene == ENTRANCE
+        assert self.world.player_y + PLAYER_SIZE[1] == GROUND_LEVEL
+        assert self.world.trolley_scene == ENTRANCE
+        assert not self.world.trolley_taken
+
+    def test_move_sets_running_and_facing(self):
+        # Setup
+        x = self.world.player_x
+
+        # Action
+        self.world.step([Command.MOVE_LEFT])
+
+        # Assert
+        assert self.world.player_x == x - 5
+        assert self.world.is_left
+        assert self.world.running
+
+        # Action
+        self.world.step([Command.STOP_MOVING])
+
+        # Assert
+        assert not self.world.running
+
+    def test_jump_reaches_ceiling_and_lands(self):
+        # Action
+        self.world.step([Command.JUMP])
+        heights = [self.world.player_y]
+        for _ in range(40):
+            self.world.step()
+            heights.append(self.world.player_y)
+
+        # Assert
+        assert min(heights) == JUMP_CEILING_Y
+        assert not self.world.is_jumping
+
+    def test_walking_off_the_left_edge_enters_the_yard(self):
+        # Action
+        for _ in range(30):
+            self.world.step([Command.MOVE_LEFT])
+
+        # Assert
+        assert self.world.current_scene == YARD
+        assert self.world.trolley_scene == ENTRANCE
+
+    def test_take_push_and_release_trolley(self):
+        # Setup: wait for trolley to stop and walk to it
+        for _ in range(200):
+            self.world.step()
+        while self.world.player_x < self.world.trolley_x:
+            self.world.step([Command.MOVE_RIGHT])
+
+        # Action
+        self.world.step([Command.TAKE_TROLLEY])
+        assert self.world.trolley_speed == 0
+        self.world.step([Command.MOVE_RIGHT])
+        self.world.step([Command.RELEASE_TROLLEY])
+
+        # Assert
+        assert not self.world.trolley_taken
+        assert self.world.trolley_speed == pytest.approx(PUSH_SPEED * 0.97)
+
+    def test_enter_door(self):
+        # Setup
+        self.world.player_x = 300
+
+        # Action
+        self.world.step([Command.ENTER_DOOR])
+
+        # Assert
+        assert self.world.current_scene == RECEPTION
+        assert self.world.player_x == CENTER
+
+    def test_take_trolley_compares_opaque_pixels_like_mediator(self):
+        # Setup: rects that overlap where neither sprite has opaque pixels
+        pygame.init()
+        try:
+            game = create_game()
+            game.player.rect.topleft = (72, 240)
+            game.trolley.rect.topleft = (23, 287)
+            game.trolley.speed = 0
+            world = World.from_game(game)
+
+            # Action
+            world.handle_command(Command.TAKE_TROLLEY)
+            game.mediator.handle_command(Command.TAKE_TROLLEY)
+
+            # Assert
+            assert game.player.rect.colliderect(game.trolley.rect)
+            assert not world.trolley_taken
+            assert world.trolley_taken == game.trolley.taken
+        finally:
+            pygame.quit()
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_world_matches_game_on_random_commands(self, seed):
+        # Setup: random commands, each held for a random number of steps like a player holds keys
+        rng = random.Random(seed)
+        pool = [Command.MOVE_LEFT, Command.MOVE_RIGHT, Command.JUMP, Command.TAKE_TROLLEY,
+                Command.RELEASE_TROLLEY, Command.ENTER_DOOR, Command.EXIT_DOOR, Command.STOP_MOVING,
+                Command.CHANGE_TO_GARAGE, Command.CHANGE_TO_ENTRANCE]
+        pygame.init()
+        try:
+            game = create_game()
+            game.timestep = None
+            world = World.from_game(game)
+
+            # Action & Assert
+            for _ in range(100):
+                commands = rng.sample(pool, rng.randint(1, 2))
+                for _ in range(rng.randint(1, 30)):
+                    for command in commands:
+                        game.mediator.queue_command(command)
+                    world.step(game.step())
+                    assert (world.player_x, world.player_y) == game.player.rect.topleft
+                    assert world.velocity_y == game.player.velocity_y
+                    assert world.running_frame == game.player.running_frame
+                    assert (world.trolley_x, world.trolley_y) == game.trolley.rect.topleft
+                    assert world.trolley_speed == game.trolley.speed
+                    assert world.trolley_taken == game.trolley.taken
+                    assert world.trolley_scene == game.trolley.scene_name
+                    assert world.current_scene == game.mediator.current_scene
+        finally:
+            pygame.quit()
+
+    def test_world_matches_game(self):
+        # Setup: play the tour scenario in the real game and the world side by side
+        pygame.init()
+        try:
+            game = create_game()
+            game.timestep = None
+            world = World.from_game(game)
+            script = ScriptedInputHandler(game, SCENARIOS["tour"])
+            game.input_handler = script
+            taken_steps = 0
+
+            # Action & Assert
+            while not script.done:
+                script.process_input()
+                world.step(game.step())
+                assert (world.player_x, world.player_y) == game.player.rect.topleft
+                assert (world.trolley_x, world.trolley_y) == game.trolley.rect.topleft
+                assert world.trolley_speed == game.trolley.speed
+                assert world.trolley_taken == game.trolley.taken
+                assert world.trolley_scene == game.trolley.scene_name
+                assert world.current_scene == game.mediator.current_scene
+                assert world.running_frame == game.player.running_frame
+                taken_steps += world.trolley_taken
+            assert world.steps > 1000
+            assert taken_steps > 1000
+        finally:
+            pygame.quit()
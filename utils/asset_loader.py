@@ -0,0 +1,133 @@
+"""
+Decoding images off the display thread, before the first frame and ahead of scene changes.
+"""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import perf_counter_ns
+import pygame
+from utils.asset_pack import asset_pack
+from utils.asset_registry import registry
+from utils.pixel_cache import pixel_cache
+from utils.pixel_formats import convert_image
+from utils.constants import ASSET_LOADER_WORKERS, GRAPHICS_PATH, ITEM_SPRITES, PIXEL_FORMAT_AUTO
+from utils.scene_graph import SceneGraph
+
+# Sprite images loaded by Player, Trolley, Bag and Items
+SPRITE_IMAGES = (
+    *(os.path.join(GRAPHICS_PATH, "player", f"piccolo_{name}.png")
+      for name in ("left_stand", "left_run1", "left_run2", "stand", "run1", "run2")),
+    os.path.join(GRAPHICS_PATH, "items", "trolley.png"),
+    *(os.path.join(GRAPHICS_PATH, "items", f"{sprite}.png") for sprite in ITEM_SPRITES),
+)
+
+
+def startup_images(scene_graph: SceneGraph) -> list:
+    """
+    Return the images the game loads before its first frame.
+
+    Args:
+        scene_graph (SceneGraph): Scene graph whose start scene is shown first.
+
+    Returns:
+        list: (path, pixel format) pairs of the sprites and the start scene's ground and sky.
+    """
+    return [(path, PIXEL_FORMAT_AUTO) for path in (*SPRITE_IMAGES, *scene_images(scene_graph, scene_graph.start))]
+
+
+def scene_images(scene_graph: SceneGraph, scene: str) -> tuple[str, str]:
+    """
+    Return the image files of a scene.
+
+    Args:
+        scene_graph (SceneGraph): Scene graph the scene is in.
+        scene (str): Scene name.
+
+    Returns:
+        tuple[str, str]: File paths of the scene's ground and sky images.
+    """
+    layers = scene_graph.get(scene)
+    return (os.path.join(GRAPHICS_PATH, "hotel", layers.ground),
+            os.path.join(GRAPHICS_PATH, "hotel", layers.sky))
+
+
+def decode_image(path: str) -> pygame.Surface:
+    """
+    Read an image from the pixel cache or decode it from the asset pack or its file, safe on worker threads.
+
+    Args:
+        path (str): File path to the image file.
+
+    Returns:
+        pygame.Surface: Decoded surface, not converted to the display pixel format yet.
+    """
+    image = pixel_cache.load(path)
+    if image is not None:
+        return image
+    # pygame releases the GIL while SDL_image decodes the file
+    return pygame.image.load(asset_pack.open(path), os.path.basename(path))
+
+
+def stage_image(path: str, pixel_format: str, image: pygame.Surface) -> None:
+    """
+    Convert a decoded image to the display pixel format and keep it in the registry until loaded.
+
+    Must run on the display thread.
+
+    Args:
+        path (str): File path to the image file.
+        pixel_format (str): PIXEL_FORMAT_AUTO picks the cheapest format to blit,
+            PIXEL_FORMAT_ALPHA keeps per-pixel alpha, PIXEL_FORMAT_OPAQUE drops it.
+        image (pygame.Surface): Surface returned by decode_image.
+
+    Raises:
+        pygame.error: If the display is not initialized.
+    """
+    registry.stage(path, pixel_format, convert_image(image, pixel_format))
+
+
+def preload_images(images, progress=None, workers: int = ASSET_LOADER_WORKERS) -> dict:
+    """
+    Decode images in a thread pool and keep them in the asset registry until loaded.
+
+    Decoding runs on worker threads, converting to the display pixel format
+    and staging in the registry run on the calling (display) thread as the
+    decoded images arrive. load_image then finds every image in the registry,
+    shared or not, and images that failed here are loaded again, with their
+    placeholder, by load_image.
+
+    Args:
+        images: (path, pixel format) pairs, duplicates and stored images are decoded once.
+        progress: Optional callable taking (done, total), called after every image.
+        workers (int): Maximum number of decoding threads.
+
+    Returns:
+        dict: Number of images to decode, decoded and failed images and the total time in milliseconds.
+    """
+    start = perf_counter_ns()
+    # Images stored by an earlier preload or load_image are not decoded again
+    images = [image for image in dict.fromkeys(images) if not registry.contains(*image)]
+    total = len(images)
+    decoded = 0
+    failed = 0
+
+    if images:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, total))) as pool:
+            futures = {pool.submit(decode_image, path): (path, pixel_format) for path, pixel_format in images}
+            for done, future in enumerate(as_completed(futures), 1):
+                path, pixel_format = futures[future]
+                try:
+                    stage_image(path, pixel_format, future.result())
+                    decoded += 1
+                except (pygame.error, FileNotFoundError) as e:
+                    logging.error(f"Error preloading image from '{path}': {e}")
+                    failed += 1
+                if progress is not None:
+                    progress(done, total)
+
+    return {
+        "images": total,
+        "decoded": decoded,
+        "failed": failed,
+        "ms": (perf_counter_ns() - start) / 1_000_000,
+    }
@@ -0,0 +1,325 @@
+"""
+Single-file asset pack read by logical name.
+
+The pack holds every image and sound below the media directory in one
+memory-mapped file, so assets are read without opening loose files. Each loose file
+is stated once, when the pack is opened, to find entries changed since packing.
+
+File layout:
+    - Header: magic bytes, format version and index length (MAPPED_FILE_HEADER)
+    - Index: JSON object mapping logical names, paths relative to the media directory
+      with forward slashes (e.g. "graphics/items/bag.png"), to the entry's offset,
+      stored and original size, compression, and the content hash, size and
+      modification time of the original file
+    - Entry data, each starting at an ASSET_PACK_ALIGNMENT boundary
+
+Files that compress well (e.g. WAV) are stored zlib compressed, already compressed
+files (e.g. PNG) are stored as they are. A loose file whose size or modification time
+changed since it was packed is read instead of its stale entry until the pack is built again.
+
+Build and check the pack with:
+    python -m utils.asset_pack build
+    python -m utils.asset_pack verify
+"""
+import hashlib
+import io
+import logging
+import os
+import sys
+import zlib
+from utils.constants import (ASSET_PACK_ALIGNMENT, ASSET_PACK_EXTENSIONS, ASSET_PACK_MIN_SAVING,
+                             ASSET_PACK_PATH, MEDIA_PATH)
+from utils.mapped_file import (MappedFile, command_parser, content_hash, relative_name,
+                               source_files, write_mapped_file)
+
+ASSET_PACK_MAGIC = b"PICCPACK"
+ASSET_PACK_VERSION = 2
+
+
+def asset_name(path: str, root: str = MEDIA_PATH) -> str | None:
+    """
+    Return the logical name of an asset file.
+
+    Args:
+        path (str): File path to the asset.
+        root (str): Media directory the logical names are relative to.
+
+    Returns:
+        str | None: Path relative to the media directory with forward slashes,
+        None if the file is outside the media directory.
+    """
+    return relative_name(path, root)
+
+
+def build_asset_pack(pack_path: str = ASSET_PACK_PATH, root: str = MEDIA_PATH) -> dict:
+    """
+    Write every asset below the media directory into the pack file.
+
+    Args:
+        pack_path (str): File path of the pack.
+        root (str): Media directory with the assets.
+
+    Returns:
+        dict: Number of packed assets, their original size and the pack file size in bytes.
+    """
+    entries = []
+    original_bytes = 0
+    for path in source_files(root, ASSET_PACK_EXTENSIONS):
+        stat = os.stat(path)
+        with open(path, "rb") as file:
+            data = file.read()
+        original_bytes += len(data)
+
+        # Keep compressed data only when it saves enough to be worth inflating on load
+        compression = "none"
+        compressed = zlib.compress(data, 9)
+        if len(compressed) <= len(data) * (1 - ASSET_PACK_MIN_SAVING):
+            compression = "zlib"
+            stored = compressed
+        else:
+            stored = data
+
+        entries.append((asset_name(path, root), {
+            "stored_size": len(stored),
+            "size": len(data),
+            "compression": compression,
+            "hash": hashlib.sha256(data).hexdigest(),
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+        }, stored))
+
+    size = write_mapped_file(pack_path, ASSET_PACK_MAGIC, ASSET_PACK_VERSION, entries, ASSET_PACK_ALIGNMENT)
+    return {"assets": len(entries), "original_bytes": original_bytes, "bytes": size}
+
+
+class AssetPack(MappedFile):
+    """
+    Reads assets by logical name from the memory-mapped pack file.
+
+    Responsibilities:
+        - Map the pack file on first use, callers read the loose files
+          while there is no pack of the current format version
+        - Return an asset's bytes, inflating compressed entries
+        - Leave assets whose loose file changed since packing to the loose file
+        - Verify the packed data and compare it with the loose files
+        - Count reads, the bytes read and stale entries
+
+    Args:
+        pack_path (str): File path of the pack.
+        root (str): Media directory the logical names are relative to.
+
+    Attributes:
+        path (str): File path of the pack.
+        root (str): Media directory the logical names are relative to.
+        reads (int): Number of assets read from the pack.
+        bytes_read (int): Original size of the assets read from the pack.
+        stale (int): Number of packed assets whose loose file changed since packing.
+        _stale_names (set): Logical names of the stale entries, found when the pack is opened.
+    """
+
+    def __init__(self, pack_path: str = ASSET_PACK_PATH, root: str = MEDIA_PATH):
+        super().__init__(pack_path, ASSET_PACK_MAGIC, ASSET_PACK_VERSION, "asset pack")
+        self.root = root
+        self.reads = 0
+        self.bytes_read = 0
+        self.stale = 0
+        self._stale_names = set()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._open()
+
+    def __len__(self) -> int:
+        return len(self._open())
+
+    def names(self) -> list:
+        """
+        Return the logical names of the packed assets.
+
+        Returns:
+            list: Logical names in index order.
+        """
+        return list(self._open())
+
+    def name_of(self, path: str) -> str | None:
+        """
+        Return the logical name of a file path if the asset is packed and its entry is current.
+
+        Args:
+            path (str): File path to the asset.
+
+        Returns:
+            str | None: Logical name, None if the asset is not in the pack or its loose file
+            changed since it was packed.
+        """
+        name = asset_name(path, self.root)
+        if name is None or name not in self._open() or name in self._stale_names:
+            return None
+        return name
+
+    def open(self, path: str) -> io.BytesIO | str:
+        """
+        Return what pygame loads an asset from, the packed data or the loose file.
+
+        Args:
+            path (str): File path to the asset.
+
+        Returns:
+            io.BytesIO | str: File object reading the packed asset, the path itself if it is not packed.
+        """
+        name = self.name_of(path)
+        if name is None:
+            return path
+        return io.BytesIO(self.read(name))
+
+    def content_hash(self, name: str) -> str | None:
+        """
+        Return the content hash of a packed asset's original file.
+
+        Args:
+            name (str): Logical name of the asset.
+
+        Returns:
+            str | None: Hexadecimal SHA-256 digest, None if the asset is not in the pack.
+        """
+        entry = self._open().get(name)
+        return entry["hash"] if entry is not None else None
+
+    def read(self, name: str) -> bytes | memoryview:
+        """
+        Return the contents of a packed asset.
+
+        Args:
+            name (str): Logical name of the asset.
+
+        Returns:
+            bytes | memoryview: Original file contents, uncompressed entries
+            are a read-only view of the mapped pack.
+
+        Raises:
+            KeyError: If the asset is not in the pack.
+        """
+        entry = self._open().get(name)
+        if entry is None:
+            raise KeyError(f"No asset '{name}' in '{self.path}'.")
+
+        start = entry["offset"]
+        data = self._data[start:start + entry["stored_size"]]
+        if entry["compression"] == "zlib":
+            data = zlib.decompress(data)
+        self.reads += 1
+        self.bytes_read += entry["size"]
+        return data
+
+    def verify(self) -> list:
+        """
+        Return the problems found in the pack.
+
+        Returns:
+            list: Messages for entries whose data does not match their hash, whose loose file
+            changed or was removed, and for loose files not in the pack.
+        """
+        index = self._open()
+        problems = []
+        for name, entry in index.items():
+            try:
+                data = self.read(name)
+            except zlib.error:
+                problems.append(f"corrupt: {name}")
+                continue
+            if hashlib.sha256(data).hexdigest() != entry["hash"]:
+                problems.append(f"corrupt: {name}")
+                continue
+
+            path = os.path.join(self.root, *name.split("/"))
+            if not os.path.exists(path):
+                problems.append(f"removed: {name}")
+                continue
+            if content_hash(path) != entry["hash"]:
+                problems.append(f"changed: {name}")
+
+        problems.extend(f"missing: {name}"
+                        for name in (asset_name(path, self.root)
+                                     for path in source_files(self.root, ASSET_PACK_EXTENSIONS))
+                        if name not in index)
+        return problems
+
+    def stats(self) -> dict:
+        """
+        Return the pack counters.
+
+        Returns:
+            dict: Number of packed assets, reads, the original size of the assets read and stale entries.
+        """
+        return {
+            "assets": len(self._open()),
+            "reads": self.reads,
+            "bytes_read": self.bytes_read,
+            "stale": self.stale,
+        }
+
+    def _loaded(self, index: dict) -> None:
+        """
+        Find the entries whose loose file changed since packing, they are read from the loose files.
+
+        Size and modification time are compared instead of hashing, which would read every
+        file. A missing loose file is current, a shipped pack may be the only copy.
+
+        Args:
+            index (dict): Entries by logical name.
+        """
+        stale = set()
+        for name, entry in index.items():
+            try:
+                stat = os.stat(os.path.join(self.root, *name.split("/")))
+            except FileNotFoundError:
+                continue
+            if stat.st_size != entry["source_size"] or stat.st_mtime_ns != entry["source_mtime_ns"]:
+                stale.add(name)
+        if stale:
+            logging.warning(f"{len(stale)} asset pack entries are stale, reading their loose files, "
+                            f"rebuild the pack: {', '.join(sorted(stale))}")
+        self._stale_names = stale
+        self.stale = len(stale)
+
+
+# Shared asset pack used by load_image and AudioManager
+asset_pack = AssetPack()
+
+
+def main(argv: list | None = None) -> int:
+    """
+    Build, verify or list the asset pack from the command line.
+
+    Args:
+        argv (list | None): Command line arguments, None reads sys.argv.
+
+    Returns:
+        int: Exit code, 1 when verify finds problems.
+    """
+    parser = command_parser("Build, verify or list the single-file asset pack.", ("build", "verify", "list"),
+                            "--pack", ASSET_PACK_PATH, MEDIA_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        result = build_asset_pack(args.pack, args.root)
+        print(f"Packed {result['assets']} assets in {args.pack} "
+              f"({result['original_bytes']} bytes into {result['bytes']} bytes)")
+        return 0
+
+    pack = AssetPack(args.pack, args.root)
+    if args.command == "list":
+        for name in pack.names():
+            print(name)
+        return 0
+
+    problems = pack.verify()
+    for problem in problems:
+        print(problem)
+    if not len(pack):
+        print(f"No asset pack at {args.pack}")
+        return 1
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
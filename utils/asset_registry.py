@@ -0,0 +1,192 @@
+"""
+Process-wide registry of loaded image surfaces.
+"""
+import os
+import weakref
+import pygame
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """
+    Return the size of a surface's pixel data.
+
+    Args:
+        surface (pygame.Surface): Surface to measure.
+
+    Returns:
+        int: Pixel data size in bytes.
+    """
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+class AssetRegistry:
+    """
+    Shares loaded image surfaces between all game objects.
+
+    Responsibilities:
+        - Store each image once per normalized path and pixel format
+        - Hand out the same surface to every object that asks for it
+        - Count cache hits, misses and the memory used by stored surfaces
+        - Keep preloaded surfaces until load_image shares them or hands them over
+        - Build the collision mask of a surface once and keep it alongside the surface
+
+    Surfaces handed out by the registry are shared, so they must not be drawn on.
+
+    Attributes:
+        hits (int): Number of lookups that found a stored surface.
+        misses (int): Number of lookups that did not find a stored surface.
+        bytes (int): Pixel data size of all stored surfaces.
+        masks_built (int): Number of collision masks built from surfaces.
+        _surfaces (dict): Stored surfaces by (path, pixel format) key.
+        _staged (dict): Preloaded surfaces not requested yet by (path, pixel format) key.
+        _masks (weakref.WeakKeyDictionary): Collision masks by surface, dropped with their surface.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self.masks_built = 0
+        self._surfaces = {}
+        self._staged = {}
+        self._masks = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def key(path: str, pixel_format: str) -> tuple[str, str]:
+        """
+        Build the registry key of an image.
+
+        Args:
+            path (str): File path to the image file.
+            pixel_format (str): Requested pixel format of the surface.
+
+        Returns:
+            tuple[str, str]: Normalized absolute path and pixel format.
+        """
+        return (os.path.normcase(os.path.abspath(path)), pixel_format)
+
+    def get(self, path: str, pixel_format: str) -> pygame.Surface | None:
+        """
+        Return a stored surface and count the lookup as a hit or a miss.
+
+        Args:
+            path (str): File path to the image file.
+            pixel_format (str): Requested pixel format of the surface.
+
+        Returns:
+            pygame.Surface | None: Stored surface or None if the image is not loaded yet.
+        """
+        key = self.key(path, pixel_format)
+        surface = self._surfaces.get(key)
+        if surface is None and key in self._staged:
+            # First request of a preloaded surface stores it for sharing
+            surface = self._staged.pop(key)
+            self.put(path, pixel_format, surface)
+        if surface is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return surface
+
+    def contains(self, path: str, pixel_format: str) -> bool:
+        """
+        Return whether a surface is stored or preloaded, without counting a lookup.
+
+        Args:
+            path (str): File path to the image file.
+            pixel_format (str): Requested pixel format of the surface.
+        """
+        key = self.key(path, pixel_format)
+        return key in self._surfaces or key in self._staged
+
+    def put(self, path: str, pixel_format: str, surface: pygame.Surface) -> None:
+        """
+        Store a loaded surface.
+
+        Args:
+            path (str): File path to the image file.
+            pixel_format (str): Pixel format of the surface.
+            surface (pygame.Surface): Loaded surface.
+        """
+        key = self.key(path, pixel_format)
+        previous = self._surfaces.get(key)
+        if previous is not None:
+            self.bytes -= surface_bytes(previous)
+        self._surfaces[key] = surface
+        self.bytes += surface_bytes(surface)
+
+    def stage(self, path: str, pixel_format: str, surface: pygame.Surface) -> None:
+        """
+        Keep a preloaded surface until it is first requested, shared or not.
+
+        Args:
+            path (str): File path to the image file.
+            pixel_format (str): Pixel format of the surface.
+            surface (pygame.Surface): Preloaded surface.
+        """
+        self._staged[self.key(path, pixel_format)] = surface
+
+    def take(self, path: str, pixel_format: str) -> pygame.Surface | None:
+        """
+        Hand over a preloaded surface without storing it, for callers that do not share it.
+
+        Args:
+            path (str): File path to the image file.
+            pixel_format (str): Requested pixel format of the surface.
+
+        Returns:
+            pygame.Surface | None: Preloaded surface or None if the image was not preloaded.
+        """
+        surface = self._staged.pop(self.key(path, pixel_format), None)
+        if surface is not None:
+            self.hits += 1
+        return surface
+
+    def mask(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        """
+        Return the collision mask of a surface, building it on first use.
+
+        Args:
+            surface (pygame.Surface): Sprite image, shared or not.
+
+        Returns:
+            pygame.mask.Mask: Mask of the surface's opaque pixels.
+        """
+        mask = self._masks.get(surface)
+        if mask is None:
+            mask = pygame.mask.from_surface(surface)
+            self._masks[surface] = mask
+            self.masks_built += 1
+        return mask
+
+    def clear(self) -> None:
+        """
+        Remove all stored and preloaded surfaces and masks and reset the counters.
+        """
+        self._surfaces.clear()
+        self._staged.clear()
+        self._masks.clear()
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self.masks_built = 0
+
+    def stats(self) -> dict:
+        """
+        Return the registry counters.
+
+        Returns:
+            dict: Number of stored surfaces, hits, misses, bytes and built masks.
+        """
+        return {
+            "surfaces": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes": self.bytes,
+            "masks": self.masks_built,
+        }
+
+
+# Shared registry used by load_image
+registry = AssetRegistry()
@@ -15,13 +15,30 @@ GRAPHICS_PATH = os.path.join(
                             __file__)),
                                 "media",
                                     "graphics")
+FONT_PATH = os.path.join(GRAPHICS_PATH, "font", "Pixeltype.ttf")
 GROUND_LEVEL = 324
 GROUND_X = ZERO
 GROUND_Y = GROUND_LEVEL - 4
+SCENE_CACHE_BUDGET = 8 * 1024 * 1024  # Bytes, about six composited 800x400 scenes
 SKY_X = ZERO
 SKY_Y = -110
 
+# Asset pack
+MEDIA_PATH = os.path.dirname(GRAPHICS_PATH)
+ASSET_PACK_ALIGNMENT = 64  # Bytes, every packed asset starts at a multiple of this
+ASSET_PACK_EXTENSIONS = (".png", ".wav", ".ogg")
+ASSET_PACK_MIN_SAVING = 0.1  # Fraction of the size zlib must save for an asset to be stored compressed
+ASSET_PACK_PATH = os.path.join(MEDIA_PATH, "assets.pack")
+
 # Configuration
+ASSET_LOADER_WORKERS = 4  # Threads decoding images at startup
+DIRTY_RECT_RENDERING = False
+EVENT_DRIVEN_INPUT = True
+FIXED_TIMESTEP = True
+IDLE_WAIT_MS = 1000  # Longest block waiting for events while the world is static
+INPUT_LATENCY_SAMPLES = 600
+PRELOAD_ASSETS = True  # Decode startup images in parallel behind a loading screen
+PROFILER_ENABLED = False
 RUN_ANIM_SPEED = TEN
 SOUND_VOLUME = 0.3
 WHITE = (255, 255, 255)
@@ -32,6 +49,22 @@ DEFAULT_SURFACE_COLOR = (255, 0, 0)  # Red
 DEFAULT_SURFACE_SIZE = (100, 100)
 DEFAULT_TEXT_SURFACE_SIZE = (TEN, TEN)
 
+# Pixel format
+PIXEL_FORMAT_ALPHA = "alpha"
+PIXEL_FORMAT_AUTO = "auto"  # Cheapest of the formats below that draws the image unchanged
+PIXEL_FORMAT_COLORKEY = "colorkey"
+PIXEL_FORMAT_COLORKEYS = ((255, 0, 255), (0, 255, 255), (1, 2, 3))  # Tried in order, first unused by the image
+PIXEL_FORMAT_OPAQUE = "opaque"
+PIXEL_FORMAT_RLE_MIN_TRANSPARENT = 0.5  # Fraction of transparent pixels from which alpha images are RLE encoded
+PIXEL_CACHE_ALIGNMENT = 64  # Bytes, every cached image starts at a multiple of this
+PIXEL_CACHE_LAYOUT = "BGRA"  # Byte order of cached pixels, the ARGB8888 display format in memory
+PIXEL_CACHE_PATH = os.path.join(
+                    os.path.dirname(
+                        os.path.dirname(
+                            __file__)),
+                                "media",
+                                    "graphics.cache")
+
 # Display
 SCREEN_HEIGHT = 400
 SCREEN_WIDTH = 800
@@ -39,11 +72,28 @@ CAPTION = "Piccolo"
 DISPLAY_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
 EDGE_MARGIN = TEN
 FRAMERATE = 60
+MAX_STEPS_PER_FRAME = 5  # Simulation steps run for one rendered frame before the rest is dropped
+SIMULATION_RATE = FRAMERATE  # Simulation steps per second
 SCREEN_LEFT = 0
 
+# Loading screen
+LOADING_BAR_COLOR = WHITE
+LOADING_BAR_SIZE = (400, 16)
+LOADING_FONT_SIZE = 48
+
+# Profiler
+PROFILER_CSV_PATH = "frame_profile.csv"
+PROFILER_FONT_SIZE = 24
+PROFILER_FRAMES = 600
+PROFILER_OVERLAY_INTERVAL = 30
+
 # Sound
+MUSIC_FADE_MS = 500
 MUSIC_YARD = "music_yard.wav"
+SOUND_CACHE_SIZE = 16
+SOUND_CHANNELS = 8
 SOUND_JUMP = "sound_jump.wav"
+PRELOADED_SOUNDS = (SOUND_JUMP,)
 SOUNDS_PATH = os.path.join(
                 os.path.dirname(
                     os.path.dirname(
@@ -52,6 +102,19 @@ SOUNDS_PATH = os.path.join(
                                 "audio")
 
 # Scene
+DOOR_LEFT = 230  # Player left positions at the front door
+DOOR_RIGHT = 460
+PREFETCH_MARGIN = 100  # Pixels from the edge margin where the neighbouring scene and its music are prefetched
+DOWN = "down"
+LEFT = "left"
+RIGHT = "right"
+UP = "up"
+SCENES_PATH = os.path.join(
+                os.path.dirname(
+                    os.path.dirname(
+                        __file__)),
+                            "media",
+                                "scenes.json")
 BALLROOM = "ballroom"
 ELEVATOR = "elevator"
 ENTRANCE = "entrance"
@@ -67,10 +130,19 @@ GRAVITY = 1
 JUMP_HEIGHT = -TEN
 JUMP_CEILING_Y = 200
 PLAYER_X = 100
+PLAYER_RUN_IMAGES = 2  # Running animation images per facing
 
 # Trolley
 TROLLEY_X = 50
 PUSH_SPEED = FIVE
+TROLLEY_FRICTION = 0.97  # Speed multiplier per simulation step of a released trolley
+TROLLEY_MIN_SPEED = 0.5
 
 # Bag
 BAG_X = 700
+
+# Items
+ENTITY_CAPACITY = 1024  # Items the entity store holds before growing its arrays
+ITEM_SPRITES = ("bag", "bill", "carkeys", "coin", "pillow", "trash1", "trash2")  # Sprite ids by index
+INTERACTION_REACH = TEN  # Pixels around the player where interactable objects are found
+SPATIAL_CELL_SIZE = 64  # Pixels, width and height of a spatial hash cell
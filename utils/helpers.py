@@ -1,13 +1,20 @@
 """
 Helper functions for game utilities.
 """
+import os
+import numpy as np
 import pygame
 import logging
+from utils.asset_pack import asset_pack
+from utils.asset_registry import registry
+from utils.pixel_cache import pixel_cache
+from utils.pixel_formats import convert_image
 from utils.constants import (DEFAULT_FONT_SIZE, DEFAULT_SURFACE_COLOR,
                              DEFAULT_SURFACE_SIZE, DEFAULT_TEXT_SURFACE_SIZE,
-                             WHITE)
+                             PIXEL_FORMAT_AUTO, WHITE)
 
-def load_image(path: str, default_color=DEFAULT_SURFACE_COLOR, default_size=DEFAULT_SURFACE_SIZE) -> pygame.Surface:
+def load_image(path: str, default_color=DEFAULT_SURFACE_COLOR, default_size=DEFAULT_SURFACE_SIZE,
+               pixel_format: str = PIXEL_FORMAT_AUTO, shared: bool = True) -> pygame.Surface:
     """
     Load an image file with error handling and placeholder fallback.
 
@@ -15,6 +22,9 @@ def load_image(path: str, default_color=DEFAULT_SURFACE_COLOR, default_size=DEFA
         path (str): File path to the image file.
         default_color (tuple): RGB color tuple for placeholder.
         default_size (tuple): Width and height for placeholder surface.
+        pixel_format (str): PIXEL_FORMAT_AUTO picks the cheapest format to blit,
+            PIXEL_FORMAT_ALPHA keeps per-pixel alpha, PIXEL_FORMAT_OPAQUE drops it.
+        shared (bool): Whether to return the surface shared through the asset registry.
 
     Returns:
         pygame.Surface: Loaded image surface or placeholder surface if loading fails.
@@ -22,13 +32,39 @@ def load_image(path: str, default_color=DEFAULT_SURFACE_COLOR, default_size=DEFA
     If an image fails to load (e.g. file not found, invalid format), a placeholder image
     with a default color and size will be returned instead.
 
+    Images in the pixel cache (python -m utils.pixel_cache build) are built from
+    their decoded pixels, all others are decoded from the asset pack
+    (python -m utils.asset_pack build) or, if not packed, from the image file.
+    With PIXEL_FORMAT_AUTO opaque images are converted without alpha and sparse
+    sprites are RLE encoded (python -m utils.pixel_formats reports the choices).
+
+    Shared surfaces are decoded once per path and pixel format and handed out to every caller,
+    so they must not be drawn on. Callers that manage the surface lifetime themselves
+    (e.g. Background's scene cache) pass shared=False and take over a preloaded surface.
+
     Note:
         Assumes that Pygame and pygame.font have been initialized
         before this function is called.
     """
+    if shared:
+        image = registry.get(path, pixel_format)
+        if image is not None:
+            return image
+    else:
+        # Preloaded unshared images are handed over instead of being kept in the registry
+        image = registry.take(path, pixel_format)
+        if image is not None:
+            return image
+
     try:
-        # Attempt to load the image
-        image = pygame.image.load(path).convert_alpha()
+        # Build the image from the pixel cache, or decode it from the asset pack or its file
+        image = pixel_cache.load(path)
+        if image is None:
+            image = pygame.image.load(asset_pack.open(path), os.path.basename(path))
+        image = convert_image(image, pixel_format)
+
+        if shared:
+            registry.put(path, pixel_format, image)
         return image
     except pygame.error as e:
         # Handle Pygame-specific errors
@@ -50,3 +86,55 @@ def load_image(path: str, default_color=DEFAULT_SURFACE_COLOR, default_size=DEFA
     placeholder.blit(text_surface, DEFAULT_TEXT_SURFACE_SIZE)
 
     return placeholder
+
+def interpolate_position(rect: pygame.Rect, previous: tuple[int, int], alpha: float) -> pygame.Rect | tuple[int, int]:
+    """
+    Return the drawing position between the previous and the current simulation step.
+
+    Args:
+        rect (pygame.Rect): Position after the current simulation step.
+        previous (tuple[int, int]): Top left position after the previous simulation step.
+        alpha (float): Fraction of the way from previous to current position, 1 draws at rect.
+
+    Returns:
+        pygame.Rect | tuple[int, int]: The rect itself when not moving or alpha is 1, else the interpolated top left.
+    """
+    if alpha >= 1 or previous == rect.topleft:
+        return rect
+    x, y = previous
+    return (round(x + (rect.x - x) * alpha), round(y + (rect.y - y) * alpha))
+
+def sprites_collide(a, b) -> bool:
+    """
+    Return whether the opaque pixels of two sprites overlap.
+
+    A cheap rect test runs first and only overlapping rects compare the
+    sprites' collision masks, which the asset registry builds once per image.
+
+    Args:
+        a: Game object with rect and image attributes.
+        b: Game object with rect and image attributes.
+
+    Returns:
+        bool: True if at least one opaque pixel of both sprites is at the same screen position.
+    """
+    # Broad phase
+    if not a.rect.colliderect(b.rect):
+        return False
+
+    # Narrow phase
+    offset = (b.rect.x - a.rect.x, b.rect.y - a.rect.y)
+    return registry.mask(a.image).overlap(registry.mask(b.image), offset) is not None
+
+
+def opaque_pixels(surface: pygame.Surface) -> np.ndarray:
+    """
+    Return the pixels of a surface that sprites_collide counts as opaque.
+
+    Args:
+        surface (pygame.Surface): Sprite image, shared or not.
+
+    Returns:
+        np.ndarray: Boolean [y, x] array of the pixels set in the surface's collision mask.
+    """
+    return pygame.surfarray.array_red(registry.mask(surface).to_surface()).T > 0
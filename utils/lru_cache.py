@@ -0,0 +1,100 @@
+"""
+Size-bounded least recently used cache.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LRUCache:
+    """
+    Keeps the most recently used values within a size budget.
+
+    Responsibilities:
+        - Store values by key and move them to the most recently used end on access
+        - Evict the least recently used values when the budget is exceeded
+        - Track the total size of stored values and the number of evictions
+
+    Args:
+        max_size (int): Budget for the summed size of all stored values.
+        size_of (Callable): Function returning the size of a value, defaults to counting values.
+
+    Attributes:
+        size (int): Summed size of all stored values.
+        evictions (int): Number of values evicted to stay within the budget.
+    """
+
+    def __init__(self, max_size: int, size_of: Callable[[Any], int] = lambda value: 1):
+        self.max_size = max_size
+        self.size_of = size_of
+        self.size = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Return a stored value and mark it as most recently used.
+
+        Args:
+            key (Hashable): Key of the value.
+
+        Returns:
+            Any | None: Stored value or None if the key is not cached.
+        """
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value and evict least recently used values over the budget.
+
+        Values larger than the whole budget are not stored.
+
+        Args:
+            key (Hashable): Key of the value.
+            value (Any): Value to store.
+        """
+        self.pop(key)
+
+        value_size = self.size_of(value)
+        if value_size > self.max_size:
+            return
+
+        self._items[key] = (value, value_size)
+        self.size += value_size
+
+        while self.size > self.max_size:
+            _, (_, evicted_size) = self._items.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> Any | None:
+        """
+        Remove a value from the cache.
+
+        Args:
+            key (Hashable): Key of the value.
+
+        Returns:
+            Any | None: Removed value or None if the key was not cached.
+        """
+        item = self._items.pop(key, None)
+        if item is None:
+            return None
+        self.size -= item[1]
+        return item[0]
+
+    def clear(self) -> None:
+        """
+        Remove all values from the cache.
+        """
+        self._items.clear()
+        self.size = 0
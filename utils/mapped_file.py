@@ -0,0 +1,212 @@
+"""
+Indexed memory-mapped files, the format shared by the pixel cache and the asset pack.
+
+File layout:
+    - Header: magic bytes, format version and index length (MAPPED_FILE_HEADER)
+    - Index: JSON object mapping entry names to entries, whose offsets are relative to the data start
+    - Entry data, each starting at an alignment boundary
+"""
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+
+MAPPED_FILE_HEADER = struct.Struct("<8sII")  # Magic, version, index length in bytes
+
+
+def relative_name(path: str, root: str) -> str | None:
+    """
+    Return the entry name of a file, its path relative to a directory.
+
+    Args:
+        path (str): File path.
+        root (str): Directory the names are relative to.
+
+    Returns:
+        str | None: Relative path with forward slashes, None if the file is outside the directory.
+    """
+    relative = os.path.relpath(os.path.abspath(path), os.path.abspath(root))
+    if relative.startswith(os.pardir):
+        return None
+    return relative.replace(os.sep, "/")
+
+
+def source_files(root: str, extensions: tuple) -> list:
+    """
+    Return the files below a directory with the given extensions in a stable order.
+
+    Args:
+        root (str): Directory to walk.
+        extensions (tuple): Lowercase file extensions including the dot.
+
+    Returns:
+        list: File paths.
+    """
+    return [os.path.join(directory, name)
+            for directory, _, files in sorted(os.walk(root))
+            for name in sorted(files) if os.path.splitext(name)[1].lower() in extensions]
+
+
+def content_hash(path: str) -> str:
+    """
+    Return the content hash of a file.
+
+    Args:
+        path (str): File path.
+
+    Returns:
+        str: Hexadecimal SHA-256 digest of the file's bytes.
+    """
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def write_mapped_file(path: str, magic: bytes, version: int, entries: list, alignment: int) -> int:
+    """
+    Write an indexed file that MappedFile reads.
+
+    The file is written next to its destination and then renamed over it,
+    so a running game never maps a half-written file.
+
+    Args:
+        path (str): File path to write.
+        magic (bytes): Eight magic bytes identifying the file type.
+        version (int): Format version of the index entries.
+        entries (list): (name, entry, data) tuples, the entry dict gets the data's offset.
+        alignment (int): Bytes, every entry's data starts at a multiple of this.
+
+    Returns:
+        int: Size of the written file in bytes.
+    """
+    index = {}
+    blobs = []
+    offset = 0
+    for name, entry, data in entries:
+        index[name] = {**entry, "offset": offset}
+        padding = -len(data) % alignment
+        blobs.append(bytes(data) + bytes(padding))
+        offset += len(data) + padding
+
+    # Entry offsets are stored relative to the data start, which is aligned after the index
+    index_bytes = json.dumps(index, sort_keys=True).encode("utf-8")
+    data_start = MAPPED_FILE_HEADER.size + len(index_bytes)
+    index_bytes += b" " * (-data_start % alignment)
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(MAPPED_FILE_HEADER.pack(magic, version, len(index_bytes)))
+        file.write(index_bytes)
+        for data in blobs:
+            file.write(data)
+    os.replace(temporary_path, path)
+    return os.path.getsize(path)
+
+
+def command_parser(description: str, commands: tuple, path_option: str, path_default: str,
+                   root_default: str) -> argparse.ArgumentParser:
+    """
+    Return the command line parser of a mapped file's build and check commands.
+
+    Args:
+        description (str): Description shown in the help.
+        commands (tuple): Command names.
+        path_option (str): Option naming the mapped file, e.g. "--cache".
+        path_default (str): Default file path of the mapped file.
+        root_default (str): Default directory of the source files.
+
+    Returns:
+        argparse.ArgumentParser: Parser of the command, the file path and the source directory.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("command", choices=commands)
+    parser.add_argument(path_option, default=path_default, help=f"{path_option[2:]} file path")
+    parser.add_argument("--root", default=root_default, help="directory of the source files")
+    return parser
+
+
+class MappedFile:
+    """
+    Reads the index and entry data of an indexed memory-mapped file.
+
+    Responsibilities:
+        - Map the file on first use and read its index
+        - Ignore a missing file or one written by another format version
+        - Let subclasses check the entries once when the index is read
+        - Unmap the file when closed, it is mapped again on the next use
+
+    Args:
+        path (str): File path of the mapped file.
+        magic (bytes): Eight magic bytes identifying the file type.
+        version (int): Format version the index entries are read in.
+        description (str): What the file is, used in log messages.
+
+    Attributes:
+        path (str): File path of the mapped file.
+        magic (bytes): Eight magic bytes identifying the file type.
+        version (int): Format version the index entries are read in.
+        description (str): What the file is, used in log messages.
+        _index (dict | None): Entries by name, None until the file is opened.
+        _data (memoryview | None): Mapped entry data.
+        _lock (threading.Lock): Guards opening the file, entries are read from loader threads too.
+    """
+
+    def __init__(self, path: str, magic: bytes, version: int, description: str):
+        self.path = path
+        self.magic = magic
+        self.version = version
+        self.description = description
+        self._index = None
+        self._data = None
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """
+        Unmap the file, it is opened again on the next read.
+        """
+        with self._lock:
+            self._index = None
+            self._data = None
+
+    def _open(self) -> dict:
+        """
+        Map the file and read its index on first use.
+
+        Returns:
+            dict: Entries by name, empty if there is no usable file.
+        """
+        if self._index is not None:
+            return self._index
+
+        with self._lock:
+            if self._index is not None:
+                return self._index
+            index = {}
+            try:
+                with open(self.path, "rb") as file:
+                    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, version, index_size = MAPPED_FILE_HEADER.unpack_from(mapped)
+                if magic != self.magic or version != self.version:
+                    logging.warning(f"Ignoring {self.description} '{self.path}' of another format version.")
+                else:
+                    data_start = MAPPED_FILE_HEADER.size + index_size
+                    index = json.loads(bytes(mapped[MAPPED_FILE_HEADER.size:data_start]))
+                    self._data = memoryview(mapped)[data_start:]
+                    self._loaded(index)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, struct.error) as e:
+                logging.error(f"Error reading {self.description} '{self.path}': {e}")
+            self._index = index
+        return self._index
+
+    def _loaded(self, index: dict) -> None:
+        """
+        Check the entries of a freshly read index, called once per opening with the lock held.
+
+        Args:
+            index (dict): Entries by name.
+        """
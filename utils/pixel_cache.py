@@ -0,0 +1,207 @@
+"""
+Versioned on-disk cache of decoded image pixels.
+
+The cache file holds every PNG below the graphics directory already decoded,
+so load_image builds surfaces from memory-mapped pixel data instead of
+decoding PNGs at every launch.
+
+File layout:
+    - Header: magic bytes, format version and index length (MAPPED_FILE_HEADER)
+    - Index: JSON object mapping image paths relative to the graphics directory to their
+      source file's content hash, size and modification time, pixel offset, size and layout
+    - Pixel data of every image, each starting at a PIXEL_CACHE_ALIGNMENT boundary
+
+Build the cache after changing images with:
+    python -m utils.pixel_cache build
+"""
+import logging
+import os
+import sys
+import pygame
+from utils.asset_pack import asset_pack
+from utils.constants import (GRAPHICS_PATH, PIXEL_CACHE_ALIGNMENT, PIXEL_CACHE_LAYOUT,
+                             PIXEL_CACHE_PATH)
+from utils.mapped_file import (MappedFile, command_parser, content_hash, relative_name,
+                               source_files, write_mapped_file)
+
+PIXEL_CACHE_MAGIC = b"PICCOLO\x00"
+PIXEL_CACHE_VERSION = 1
+
+
+def build_pixel_cache(cache_path: str = PIXEL_CACHE_PATH, root: str = GRAPHICS_PATH) -> dict:
+    """
+    Decode every PNG below a directory and write the cache file.
+
+    Args:
+        cache_path (str): File path of the cache file.
+        root (str): Graphics directory with the PNGs.
+
+    Returns:
+        dict: Number of cached images and the cache file size in bytes.
+    """
+    entries = []
+    for path in source_files(root, (".png",)):
+        stat = os.stat(path)
+        image = pygame.image.load(path)
+        entries.append((relative_name(path, root), {
+            "hash": content_hash(path),
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "size": image.get_size(),
+            "layout": PIXEL_CACHE_LAYOUT,
+        }, pygame.image.tobytes(image, PIXEL_CACHE_LAYOUT)))
+
+    size = write_mapped_file(cache_path, PIXEL_CACHE_MAGIC, PIXEL_CACHE_VERSION, entries, PIXEL_CACHE_ALIGNMENT)
+    return {"images": len(entries), "bytes": size}
+
+
+class PixelCache(MappedFile):
+    """
+    Builds surfaces from the memory-mapped pixel cache file.
+
+    Responsibilities:
+        - Map the cache file on first use, images are decoded while there is
+          no cache file of the current format version
+        - Detect entries whose source PNG changed since the cache was built
+        - Build surfaces from the cached pixels without decoding PNGs
+        - Count hits, misses and stale entries
+
+    Cached surfaces share memory with the mapped file, so callers
+    convert them to the display pixel format before keeping them.
+
+    Args:
+        cache_path (str): File path of the cache file.
+        root (str): Graphics directory the cached images were read from.
+
+    Attributes:
+        path (str): File path of the cache file.
+        root (str): Graphics directory the cached images were read from.
+        hits (int): Number of images built from cached pixels.
+        misses (int): Number of images not in the cache.
+        stale (int): Number of cached images whose source PNG changed.
+    """
+
+    def __init__(self, cache_path: str = PIXEL_CACHE_PATH, root: str = GRAPHICS_PATH):
+        super().__init__(cache_path, PIXEL_CACHE_MAGIC, PIXEL_CACHE_VERSION, "pixel cache")
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def load(self, path: str) -> pygame.Surface | None:
+        """
+        Return the surface of a cached image.
+
+        Args:
+            path (str): File path to the image file.
+
+        Returns:
+            pygame.Surface | None: Surface sharing the cached pixels, None if the image
+            is not cached or its source changed.
+        """
+        name = relative_name(path, self.root)
+        entry = self._open().get(name) if name is not None else None
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if not self._is_fresh(path, entry):
+            logging.warning(f"Pixel cache entry '{name}' is stale, rebuild the cache.")
+            self.stale += 1
+            return None
+
+        width, height = entry["size"]
+        start = entry["offset"]
+        end = start + width * height * len(entry["layout"])
+        self.hits += 1
+        return pygame.image.frombuffer(self._data[start:end], (width, height), entry["layout"])
+
+    def stats(self) -> dict:
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: Number of cached images, hits, misses and stale entries.
+        """
+        return {
+            "images": len(self._open()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+        }
+
+    def verify(self) -> list:
+        """
+        Return the images whose cache entry is stale or missing.
+
+        Returns:
+            list: Names of the cached images whose source PNG changed or was removed,
+            followed by the PNGs not in the cache.
+        """
+        index = self._open()
+        stale = []
+        for name, entry in index.items():
+            path = os.path.join(self.root, *name.split("/"))
+            if not os.path.exists(path) or content_hash(path) != entry["hash"]:
+                stale.append(name)
+        stale.extend(name for name in (relative_name(path, self.root) for path in source_files(self.root, (".png",)))
+                     if name not in index)
+        return stale
+
+    @staticmethod
+    def _is_fresh(path: str, entry: dict) -> bool:
+        """
+        Return whether a source PNG is unchanged since its entry was built.
+
+        An image the game reads from the asset pack is compared with the pack's content hash.
+        Otherwise unchanged size and modification time skip
+        hashing, a touched file with the same content is still fresh.
+
+        Args:
+            path (str): File path to the image file.
+            entry (dict): Cache entry of the image.
+        """
+        name = asset_pack.name_of(path)
+        if name is not None:
+            return asset_pack.content_hash(name) == entry["hash"]
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size == entry["source_size"] and stat.st_mtime_ns == entry["source_mtime_ns"]:
+            return True
+        return content_hash(path) == entry["hash"]
+
+
+# Shared pixel cache used by load_image
+pixel_cache = PixelCache()
+
+
+def main(argv: list | None = None) -> int:
+    """
+    Build or verify the pixel cache from the command line.
+
+    Args:
+        argv (list | None): Command line arguments, None reads sys.argv.
+
+    Returns:
+        int: Exit code, 1 when verify finds stale entries.
+    """
+    parser = command_parser("Build or verify the decoded image pixel cache.", ("build", "verify"),
+                            "--cache", PIXEL_CACHE_PATH, GRAPHICS_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        result = build_pixel_cache(args.cache, args.root)
+        print(f"Cached {result['images']} images in {args.cache} ({result['bytes']} bytes)")
+        return 0
+
+    stale = PixelCache(args.cache, args.root).verify()
+    for name in stale:
+        print(f"stale: {name}")
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""
+Choosing the cheapest pixel format to blit each image in.
+
+Images are analysed once when loaded:
+    - Opaque images (every pixel's alpha is 255) are converted without alpha and copied when blitted
+    - Images whose pixels are either opaque or fully transparent get a colorkey and are
+      RLE encoded, so blits copy the runs of opaque pixels and skip the transparent ones
+    - Images with translucent pixels keep per-pixel alpha, RLE encoded when
+      at least PIXEL_FORMAT_RLE_MIN_TRANSPARENT of their pixels are transparent
+
+Report the format and the estimated and measured blit time saved per asset with:
+    python -m utils.pixel_formats
+"""
+import argparse
+import os
+import sys
+from time import perf_counter_ns
+import numpy as np
+import pygame
+from utils.constants import (GRAPHICS_PATH, PIXEL_FORMAT_ALPHA, PIXEL_FORMAT_AUTO, PIXEL_FORMAT_COLORKEY,
+                             PIXEL_FORMAT_COLORKEYS, PIXEL_FORMAT_OPAQUE, PIXEL_FORMAT_RLE_MIN_TRANSPARENT)
+
+# Blit cost per pixel relative to alpha blending, measured on the hotel backgrounds
+BLIT_COST_BLEND = 1.0
+BLIT_COST_COLORKEY = 0.6
+BLIT_COST_COPY = 0.2
+
+# Pixels blitted per timing round of the report
+REPORT_BLIT_PIXELS = 10_000_000
+
+
+def analyze_image(image: pygame.Surface) -> dict:
+    """
+    Return the cheapest pixel format that draws an image unchanged.
+
+    Must run on the display thread if the image has a colorkey, it is converted to per-pixel alpha first.
+
+    Args:
+        image (pygame.Surface): Decoded image.
+
+    Returns:
+        dict: Pixel format (PIXEL_FORMAT_OPAQUE, PIXEL_FORMAT_COLORKEY or PIXEL_FORMAT_ALPHA),
+        the fractions of transparent and translucent pixels, the colorkey and whether to RLE encode.
+    """
+    analysis = {"format": PIXEL_FORMAT_OPAQUE, "transparent": 0.0, "translucent": 0.0,
+                "colorkey": None, "rle": False}
+    if not image.get_flags() & pygame.SRCALPHA:
+        # Without per-pixel alpha only a colorkey makes pixels transparent
+        if image.get_colorkey() is None:
+            return analysis
+        image = image.convert_alpha()
+
+    alpha = pygame.surfarray.pixels_alpha(image)
+    if alpha.min() == 255:
+        return analysis
+
+    pixels = alpha.size
+    visible = np.count_nonzero(alpha)
+    opaque = alpha == 255
+    analysis["transparent"] = (pixels - visible) / pixels
+    analysis["translucent"] = (visible - np.count_nonzero(opaque)) / pixels
+
+    colorkey = None
+    if not analysis["translucent"]:
+        rgb = pygame.surfarray.pixels3d(image)
+        colorkey = next((key for key in PIXEL_FORMAT_COLORKEYS
+                         if not np.any(np.all(rgb == key, axis=2) & opaque)), None)
+        del rgb
+
+    if colorkey is not None:
+        # RLE copies runs of opaque pixels, measured faster than testing every pixel against the key
+        analysis.update(format=PIXEL_FORMAT_COLORKEY, colorkey=colorkey, rle=True)
+    else:
+        analysis.update(format=PIXEL_FORMAT_ALPHA,
+                        rle=analysis["transparent"] >= PIXEL_FORMAT_RLE_MIN_TRANSPARENT)
+    return analysis
+
+
+def optimize_image(image: pygame.Surface, analysis: dict) -> pygame.Surface:
+    """
+    Convert an image to the display pixel format chosen by analyze_image.
+
+    Must run on the display thread.
+
+    Args:
+        image (pygame.Surface): Decoded image.
+        analysis (dict): Result of analyze_image for the image.
+
+    Returns:
+        pygame.Surface: New surface in the display pixel format.
+
+    Raises:
+        pygame.error: If the display is not initialized.
+    """
+    flags = pygame.RLEACCEL if analysis["rle"] else 0
+    if analysis["format"] == PIXEL_FORMAT_OPAQUE:
+        return image.convert()
+
+    if analysis["format"] == PIXEL_FORMAT_COLORKEY:
+        # Transparent pixels show the key, opaque pixels cover it
+        colorkey = analysis["colorkey"]
+        keyed = pygame.Surface(image.get_size()).convert()
+        keyed.fill(colorkey)
+        keyed.blit(image, (0, 0))
+        keyed.set_colorkey(colorkey, flags)
+        return keyed
+
+    converted = image.convert_alpha()
+    if flags:
+        converted.set_alpha(255, flags)
+    return converted
+
+
+def convert_image(image: pygame.Surface, pixel_format: str) -> pygame.Surface:
+    """
+    Convert a decoded image to the display pixel format.
+
+    Must run on the display thread.
+
+    Args:
+        image (pygame.Surface): Decoded image.
+        pixel_format (str): PIXEL_FORMAT_AUTO picks the cheapest format to blit,
+            PIXEL_FORMAT_ALPHA keeps per-pixel alpha, PIXEL_FORMAT_OPAQUE drops it.
+
+    Returns:
+        pygame.Surface: New surface in the display pixel format.
+
+    Raises:
+        pygame.error: If the display is not initialized.
+    """
+    if pixel_format == PIXEL_FORMAT_AUTO:
+        return optimize_image(image, analyze_image(image))
+    if pixel_format == PIXEL_FORMAT_OPAQUE:
+        return image.convert()
+    return image.convert_alpha()
+
+
+def estimated_saving(analysis: dict) -> float:
+    """
+    Return the blit time an analysed format saves over per-pixel alpha, from the blit cost model.
+
+    Args:
+        analysis (dict): Result of analyze_image.
+
+    Returns:
+        float: Fraction of the alpha blending time saved.
+    """
+    if analysis["format"] == PIXEL_FORMAT_OPAQUE:
+        cost = BLIT_COST_COPY
+    elif not analysis["rle"]:
+        cost = BLIT_COST_COLORKEY if analysis["format"] == PIXEL_FORMAT_COLORKEY else BLIT_COST_BLEND
+    else:
+        # RLE skips transparent pixels, copies opaque ones and blends only translucent ones
+        opaque = 1 - analysis["transparent"] - analysis["translucent"]
+        cost = opaque * BLIT_COST_COPY + analysis["translucent"] * BLIT_COST_BLEND
+    return 1 - cost / BLIT_COST_BLEND
+
+
+def blit_time_ns(image: pygame.Surface, rounds: int = 3) -> float:
+    """
+    Return the time of one blit of an image onto a display format surface.
+
+    Args:
+        image (pygame.Surface): Image in the display pixel format.
+        rounds (int): Timing rounds, the fastest is kept.
+
+    Returns:
+        float: Nanoseconds per blit.
+    """
+    width, height = image.get_size()
+    blits = max(1, REPORT_BLIT_PIXELS // (width * height))
+    target = pygame.Surface((width, height)).convert()
+    # The first blit RLE encodes the image
+    target.blit(image, (0, 0))
+
+    fastest = None
+    for _ in range(rounds):
+        start = perf_counter_ns()
+        for _ in range(blits):
+            target.blit(image, (0, 0))
+        elapsed = (perf_counter_ns() - start) / blits
+        fastest = elapsed if fastest is None else min(fastest, elapsed)
+    return fastest
+
+
+def analyze_assets(root: str = GRAPHICS_PATH, rounds: int = 3) -> list:
+    """
+    Analyse every PNG below a directory and time its blits.
+
+    Must run on the display thread.
+
+    Args:
+        root (str): Graphics directory.
+        rounds (int): Timing rounds per image and format.
+
+    Returns:
+        list: One dict per image with its name, size, analysis, estimated saving and
+        the measured blit times in the alpha and the chosen format.
+    """
+    report = []
+    for directory, _, files in sorted(os.walk(root)):
+        for name in sorted(file for file in files if file.lower().endswith(".png")):
+            path = os.path.join(directory, name)
+            image = pygame.image.load(path)
+            analysis = analyze_image(image)
+            alpha_ns = blit_time_ns(image.convert_alpha(), rounds)
+            optimized_ns = blit_time_ns(optimize_image(image, analysis), rounds)
+            report.append({
+                "name": os.path.relpath(path, root).replace(os.sep, "/"),
+                "size": image.get_size(),
+                **analysis,
+                "estimated_saving": estimated_saving(analysis),
+                "alpha_us": alpha_ns / 1000,
+                "optimized_us": optimized_ns / 1000,
+                "measured_saving": 1 - optimized_ns / alpha_ns,
+            })
+    return report
+
+
+def main(argv: list | None = None) -> int:
+    """
+    Print the pixel format of every image and the blit time it saves.
+
+    Args:
+        argv (list | None): Command line arguments, None reads sys.argv.
+
+    Returns:
+        int: Exit code.
+    """
+    parser = argparse.ArgumentParser(description="Report the pixel format chosen per image and the blit time saved.")
+    parser.add_argument("--root", default=GRAPHICS_PATH, help="graphics directory")
+    parser.add_argument("--rounds", type=int, default=3, help="timing rounds per image and format")
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    report = analyze_assets(args.root, args.rounds)
+
+    print(f"{'image':32} {'size':>9} {'format':8} {'rle':3} {'transp':>6} "
+          f"{'alpha us':>9} {'chosen us':>9} {'estimated':>9} {'measured':>9}")
+    for entry in report:
+        width, height = entry["size"]
+        print(f"{entry['name']:32} {width:>4}x{height:<4} {entry['format']:8} {'yes' if entry['rle'] else 'no':3} "
+              f"{entry['transparent']:>6.0%} {entry['alpha_us']:>9.1f} {entry['optimized_us']:>9.1f} "
+              f"{entry['estimated_saving']:>9.0%} {entry['measured_saving']:>9.0%}")
+
+    alpha_us = sum(entry["alpha_us"] for entry in report)
+    optimized_us = sum(entry["optimized_us"] for entry in report)
+    if alpha_us:
+        print(f"Blitting every image once: {alpha_us:.1f} us in alpha, {optimized_us:.1f} us in the chosen formats "
+              f"({1 - optimized_us / alpha_us:.0%} saved)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
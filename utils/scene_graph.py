@@ -0,0 +1,156 @@
+"""
+Declarative scene graph loaded from a JSON file.
+"""
+import json
+from utils.constants import DOWN, LEFT, RIGHT, SCENES_PATH, UP
+
+# Sides a scene can be exited from
+SIDES = (DOWN, LEFT, RIGHT, UP)
+
+
+class Scene:
+    """
+    One room of the scene graph.
+
+    Args:
+        name (str): Scene name.
+        ground (str): Ground image file name.
+        sky (str): Sky image file name.
+        music (str | None): Music file name or None if the scene is silent.
+        exits (dict): Neighbouring scene name by side.
+    """
+
+    def __init__(self, name: str, ground: str, sky: str, music: str | None, exits: dict):
+        self.name = name
+        self.ground = ground
+        self.sky = sky
+        self.music = music
+        self.exits = exits
+
+
+class SceneGraph:
+    """
+    Map of the hotel scenes and how they connect.
+
+    Responsibilities:
+        - Hold the images, music and exits of every scene
+        - Look up the neighbouring scene by (scene, side) in constant time
+        - Validate that every exit leads to a known scene
+
+    Args:
+        scenes (dict): Scene instances by name.
+        start (str): Scene the game starts in.
+
+    Attributes:
+        scenes (dict): Scene instances by name.
+        start (str): Scene the game starts in.
+        _neighbours (dict): Neighbouring scene name by (scene, side).
+        _ids (dict): Stable integer id of each scene, in scene name order.
+
+    Raises:
+        ValueError: If the start scene or an exit target is not a known scene, or an exit side is unknown.
+    """
+
+    def __init__(self, scenes: dict, start: str):
+        if start not in scenes:
+            raise ValueError(f"Unknown start scene '{start}'.")
+
+        self.scenes = scenes
+        self.start = start
+        self._ids = {name: index for index, name in enumerate(sorted(scenes))}
+        self._neighbours = {}
+        for scene in scenes.values():
+            for side, target in scene.exits.items():
+                if side not in SIDES:
+                    raise ValueError(f"Unknown exit side '{side}' in scene '{scene.name}'.")
+                if target not in scenes:
+                    raise ValueError(f"Exit '{side}' of scene '{scene.name}' leads to unknown scene '{target}'.")
+                self._neighbours[(scene.name, side)] = target
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.scenes
+
+    def __len__(self) -> int:
+        return len(self.scenes)
+
+    def get(self, name: str) -> Scene | None:
+        """
+        Return a scene by name.
+
+        Args:
+            name (str): Scene name.
+
+        Returns:
+            Scene | None: The scene or None if it is unknown.
+        """
+        return self.scenes.get(name)
+
+    def neighbour(self, name: str, side: str) -> str | None:
+        """
+        Return the scene entered when exiting a scene from a side.
+
+        Args:
+            name (str): Scene name.
+            side (str): One of SIDES.
+
+        Returns:
+            str | None: Neighbouring scene name or None if the scene has no exit on that side.
+        """
+        return self._neighbours.get((name, side))
+
+    def scene_id(self, name: str) -> int:
+        """
+        Return the integer id of a scene, for example for numeric observations.
+
+        Args:
+            name (str): Scene name.
+
+        Returns:
+            int: Index of the scene in scene name order, -1 if the scene is unknown.
+        """
+        return self._ids.get(name, -1)
+
+    def music(self, name: str | None) -> str | None:
+        """
+        Return the music file name of a scene.
+
+        Args:
+            name (str | None): Scene name.
+
+        Returns:
+            str | None: Music file name or None if the scene is unknown or silent.
+        """
+        scene = self.scenes.get(name)
+        return scene.music if scene is not None else None
+
+
+def load_scene_graph(path: str = SCENES_PATH) -> SceneGraph:
+    """
+    Read a scene graph from a JSON file.
+
+    The file holds the start scene and every scene's ground and sky images,
+    optional music and exits:
+        {"start": "entrance",
+         "scenes": {"entrance": {"ground": "...", "sky": "...", "music": "...", "exits": {"left": "yard"}}}}
+
+    Args:
+        path (str): File path of the scene graph.
+
+    Returns:
+        SceneGraph: Loaded and validated scene graph.
+
+    Raises:
+        ValueError: If the file is not a valid scene graph.
+    """
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+
+    try:
+        scenes = {
+            name: Scene(name, entry["ground"], entry["sky"], entry.get("music"), dict(entry.get("exits", {})))
+            for name, entry in data["scenes"].items()
+        }
+        start = data["start"]
+    except (KeyError, TypeError, AttributeError) as error:
+        raise ValueError(f"Invalid scene graph '{path}': {error!r}") from error
+    return SceneGraph(scenes, start)